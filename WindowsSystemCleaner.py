@@ -1,18 +1,21 @@
+import time
+_STARTUP_T0 = time.perf_counter()  # Startup instrumentation (see benchmarks/bench_startup.py)
+
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
 import os
+import json
 import ctypes
 import threading
 import logging
-from datetime import datetime
-from PIL import Image
 from pathlib import Path
-from collections import deque
-import time
 
-# Import Modular Engine
-from cleaner_engine import CleanerEngine
+# Lightweight engine modules; CleanerEngine itself is imported on first use (App.engine)
+from walker import CancelToken
+from scan_results import ScanResults
+from selection_model import SelectionModel
+from progress import ProgressBus
 from resource_manager import ResourceManager
 from config_manager import ConfigManager
 
@@ -102,73 +105,64 @@ class CircularGauge(ctk.CTkCanvas):
 
 
 # ============= VIRTUAL SCROLLING LIST =============
-class VirtualScrollList(ctk.CTkScrollableFrame):
-    """High-performance list that only renders visible items"""
+class VirtualScrollList(ctk.CTkFrame):
+    """
+    High-performance list that only renders visible items.
+    A fixed pool of row widgets (sized to the viewport) is rebound to data rows as the user
+    scrolls, so widget count, memory and frame time do not depend on the number of results.
+    """
     def __init__(self, parent, item_height=50, **kwargs):
         super().__init__(parent, **kwargs)
         self.item_height = item_height
         self.items = []
-        self.visible_widgets = []
-        self.checkbox_vars = []
-        self.last_scroll_pos = 0
-        self.render_batch_size = 50  # Render items in batches
-        
-        # Bind scroll event for dynamic rendering
-        self._parent_canvas.bind("<Configure>", self._on_scroll)
+        self.selection = SelectionModel()  # Bitset selection with running totals (lives outside Tk)
+        self.on_change = lambda: None
+        self.scroll_y = 0        # Pixel offset of the viewport into the virtual scroll region
+        self.pool = []
+        
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent", corner_radius=0)
+        self.viewport.pack(side="left", fill="both", expand=True)
+        
+        self.viewport.bind("<Configure>", self._on_resize)
+        self.bind_all("<MouseWheel>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-4>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-5>", self._on_mousewheel, add="+")
     
     def set_items(self, items, on_change_callback):
-        """Set items and render visible ones"""
+        """Show a results store (shared with the engine, not copied) from the top"""
         self.items = items
         self.on_change = on_change_callback
-        self.checkbox_vars = []
-        
-        # Clear existing widgets
-        for widget in self.visible_widgets:
-            widget.destroy()
-        self.visible_widgets = []
-        
-        # Render in batches to avoid UI freeze
-        self._render_batch(0)
-    
-    def _render_batch(self, start_idx):
-        """Render a batch of items progressively"""
-        end_idx = min(start_idx + self.render_batch_size, len(self.items))
-        
-        for i in range(start_idx, end_idx):
-            self._create_item_widget(self.items[i], i)
-        
-        # Schedule next batch if more items exist
-        if end_idx < len(self.items):
-            self.after(10, lambda: self._render_batch(end_idx))
-    
-    def _create_item_widget(self, item, index):
-        """Create a single item widget"""
-        var = tk.StringVar(value="on")
-        self.checkbox_vars.append((item, var))
-        
-        # Card style row
-        row = ctk.CTkFrame(self, fg_color="#161B22", corner_radius=8)
-        row.pack(fill="x", pady=4, padx=5)
-        
-        # Hover effect with lambda capture
-        def make_hover_handlers(frame):
-            return (
-                lambda e: frame.configure(fg_color="#21262D"),
-                lambda e: frame.configure(fg_color="#161B22")
-            )
+        self.selection.reset(items)
+        self.scroll_y = 0
+        for row in self.pool:
+            row.index = -1
+        self._layout()
+
+    def refresh(self):
+        """Pick up rows added to the store since the last call (e.g. by a streaming scan)"""
+        self.selection.sync()
+        self._layout()
+
+    def _create_row(self):
+        """Create one pooled row widget (bound to data later by _bind_row)"""
+        row = ctk.CTkFrame(self.viewport, fg_color="#161B22", corner_radius=8, height=self.item_height - 8)
+        row.pack_propagate(False)
+        row.index = -1
         
-        enter_handler, leave_handler = make_hover_handlers(row)
-        row.bind("<Enter>", enter_handler)
-        row.bind("<Leave>", leave_handler)
+        # Hover effect
+        row.bind("<Enter>", lambda e: row.configure(fg_color="#21262D"))
+        row.bind("<Leave>", lambda e: row.configure(fg_color="#161B22"))
         
         inner = ctk.CTkFrame(row, fg_color="transparent")
-        inner.pack(fill="x", padx=10, pady=8)
+        inner.pack(fill="both", expand=True, padx=10, pady=8)
         
-        # Checkbox with debounced callback
-        cb = ctk.CTkCheckBox(
+        row.var = tk.StringVar(value="on")
+        row.cb = ctk.CTkCheckBox(
             inner, 
-            text=f"  {item['path'].name}", 
-            variable=var, 
+            text="", 
+            variable=row.var, 
             onvalue="on", 
             offvalue="off",
             checkbox_width=20, 
@@ -178,34 +172,115 @@ class VirtualScrollList(ctk.CTkScrollableFrame):
             fg_color="#2f81f7",
             hover_color="#2f81f7", 
             font=ctk.CTkFont(family="Segoe UI Variable Text", size=13),
-            command=self.on_change
+            command=lambda: self._on_toggle(row)
         )
-        cb.pack(side="left")
+        row.cb.pack(side="left")
         
         # Metadata
         meta_frame = ctk.CTkFrame(inner, fg_color="transparent")
         meta_frame.pack(side="right")
         
         # Category badge
-        ctk.CTkLabel(
+        row.cat_lbl = ctk.CTkLabel(
             meta_frame, 
-            text=item['category'], 
+            text="", 
             font=ctk.CTkFont(size=10, weight="bold"), 
             text_color="#7D8590",
             fg_color="#0D1117", 
             corner_radius=4
-        ).pack(side="left", padx=(0, 10))
+        )
+        row.cat_lbl.pack(side="left", padx=(0, 10))
         
         # Size label
-        size_text = self._format_bytes(item['size'])
-        ctk.CTkLabel(
+        row.size_lbl = ctk.CTkLabel(
             meta_frame, 
-            text=size_text, 
+            text="", 
             font=ctk.CTkFont(family="Segoe UI Variable Text", size=13, weight="bold"), 
             text_color="#E6EDF3"
-        ).pack(side="left")
+        )
+        row.size_lbl.pack(side="left")
+        return row
+
+    def _bind_row(self, row, index):
+        """Point a pooled row at data row `index`"""
+        item = self.items[index]
+        row.index = index
+        row.cb.configure(text=f"  {item['name']}")
+        row.var.set("on" if self.selection.is_selected(index) else "off")
+        row.cat_lbl.configure(text=item['category'])
+        row.size_lbl.configure(text=self._size_text(item))
+
+    def _layout(self):
+        """Clamp the scroll offset, rebind rows that changed index and position the pool"""
+        count = len(self.items)
+        h = self.item_height
+        view_h = max(1, self.viewport.winfo_height())
+        total_h = count * h
+        self.scroll_y = min(max(0, self.scroll_y), max(0, total_h - view_h))
+        
+        first = int(self.scroll_y // h)
+        offset = self.scroll_y - first * h
+        for slot, row in enumerate(self.pool):
+            index = first + slot
+            if index < count:
+                if row.index != index:
+                    self._bind_row(row, index)
+                row.place(x=0, y=slot * h - offset + 4, relwidth=1.0)
+            else:
+                row.place_forget()
+                row.index = -1
         
-        self.visible_widgets.append(row)
+        if total_h <= view_h:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.scroll_y / total_h, (self.scroll_y + view_h) / total_h)
+
+    def _on_resize(self, event):
+        """Grow the row pool to cover the viewport (it never shrinks; extra rows stay hidden)"""
+        needed = event.height // self.item_height + 2
+        while len(self.pool) < needed:
+            self.pool.append(self._create_row())
+        self._layout()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        """Scrollbar protocol: ('moveto', fraction) or ('scroll', n, 'units'|'pages')"""
+        total_h = len(self.items) * self.item_height
+        if action == "moveto":
+            self.scroll_y = float(amount) * total_h
+        elif action == "scroll":
+            step = self.item_height if unit == "units" else self.viewport.winfo_height()
+            self.scroll_y += int(amount) * step
+        self._layout()
+
+    def _on_mousewheel(self, event):
+        """Scroll three rows per wheel notch when the pointer is over the list"""
+        if not self._pointer_inside():
+            return
+        if event.num == 4:
+            notches = 1
+        elif event.num == 5:
+            notches = -1
+        else:
+            notches = event.delta / 120
+        self.scroll_y -= notches * 3 * self.item_height
+        self._layout()
+
+    def _pointer_inside(self):
+        try:
+            widget = self.winfo_containing(*self.winfo_pointerxy())
+        except (KeyError, tk.TclError):
+            return False
+        while widget is not None:
+            if widget is self:
+                return True
+            widget = widget.master
+        return False
+
+    def _on_toggle(self, row):
+        if row.index < 0:
+            return
+        self.selection.set(row.index, row.var.get() == "on")
+        self.on_change()
     
     def _format_bytes(self, size):
         """Format bytes to human readable"""
@@ -214,31 +289,48 @@ class VirtualScrollList(ctk.CTkScrollableFrame):
                 return f"{size:.2f} {unit}"
             size /= 1024
         return f"{size:.2f} TB"
-    
-    def _on_scroll(self, event):
-        """Handle scroll events (placeholder for future optimization)"""
-        pass
+
+    def _size_text(self, item):
+        """Size with accuracy markers: '≥' for cut-short sizes, '~ … ±' for sampled estimates"""
+        if item.get('estimated'):
+            return f"~{self._format_bytes(item['size'])} ± {self._format_bytes(item['size_error'])}"
+        if item.get('partial'):
+            return f"≥ {self._format_bytes(item['size'])}"
+        return self._format_bytes(item['size'])
+
+    def update_item(self, item, size=None, allocated=None):
+        """Refresh a visible row whose values changed in place (a new size goes through the selection model)"""
+        if size is not None:
+            self.selection.set_size(item.index, size, allocated)
+        for row in self.pool:
+            if row.index == item.index:
+                self._bind_row(row, item.index)
     
     def get_selected_items(self):
         """Get all selected items"""
-        return [item for item, var in self.checkbox_vars if var.get() == "on"]
+        return self.selection.selected_items()
     
     def select_all(self):
         """Select all items"""
-        for item, var in self.checkbox_vars:
-            var.set("on")
+        self.selection.select_all()
+        for row in self.pool:
+            row.var.set("on")
         self.on_change()
     
     def deselect_all(self):
         """Deselect all items"""
-        for item, var in self.checkbox_vars:
-            var.set("off")
+        self.selection.deselect_all()
+        for row in self.pool:
+            row.var.set("off")
         self.on_change()
 
 
 # ============= MAIN APP =============
 class App(ctk.CTk):
+    PROGRESS_POLL_MS = 100  # Single fixed-rate UI refresh while the engine is busy
+
     def __init__(self):
+        self.startup_timings = {'imports_s': time.perf_counter() - _STARTUP_T0}
         super().__init__()
         self.title("Windows System Cleaner")
         self.geometry("1100x800")
@@ -282,11 +374,16 @@ class App(ctk.CTk):
         log_dir = Path(os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))) / "WindowsSystemCleaner"
         log_dir.mkdir(exist_ok=True)
         self.config_manager = ConfigManager(str(log_dir / "config.json"))
-        self.engine = CleanerEngine(self.config_manager)
+        self._engine = None  # See the engine property
+        self._engine_lock = threading.Lock()
+        self.apply_diagnostics_logging()
         
         # State management
-        self.scan_results = []
+        self.scan_results = ScanResults()
         self.scan_active = False
+        self.clean_active = False
+        self.progress = ProgressBus()  # Engine workers publish here; poll_progress() drains it
+        self.refine_token = None  # Cancels background refinement of estimated sizes
         self.debounce_timer = None  # For debounced updates
         
         # Grid configuration
@@ -298,12 +395,53 @@ class App(ctk.CTk):
         self.setup_content_areas()
         self.show_dash()
 
-        # Close splash screen
-        if pyi_splash:
-            self.after(200, self.close_splash)
+        # Close the splash screen once the window has actually been drawn
+        self.startup_timings['init_s'] = time.perf_counter() - _STARTUP_T0
+        self.after_idle(self.on_first_paint)
         
         # First-run setup prompt
         self.after(1000, self.check_first_run_install)
+        self.after(self.PROGRESS_POLL_MS, self.poll_progress)
+
+    def apply_diagnostics_logging(self):
+        """With diagnostics on, the engine's scan stats (INFO) are written to engine_debug.log too"""
+        level = logging.INFO if self.config_manager.get("scan_diagnostics") else logging.NOTSET
+        logging.getLogger("cleaner_engine").setLevel(level)
+
+    def apply_watch_mode(self):
+        """(Re)starts the live totals service so it follows the current settings, or stops it"""
+        enabled = self.config_manager.get("watch_mode")
+        if not enabled and self._engine is None:
+            return
+
+        def _apply():
+            self.engine.stop_live_totals()
+            if enabled:
+                self.engine.start_live_totals()
+        threading.Thread(target=_apply, daemon=True).start()
+
+    @property
+    def engine(self):
+        """Created on first use, so the window paints before the engine and its imports load"""
+        with self._engine_lock:
+            if self._engine is None:
+                from cleaner_engine import CleanerEngine
+                self._engine = CleanerEngine(self.config_manager)
+            return self._engine
+
+    def on_first_paint(self):
+        """Records time-to-first-paint and closes the splash screen"""
+        self.update_idletasks()
+        self.startup_timings['first_paint_s'] = time.perf_counter() - _STARTUP_T0
+        self.close_splash()
+        logging.info(f"Startup timings: {self.startup_timings}")
+        self.apply_watch_mode()
+        # WSC_STARTUP_PROFILE=1 prints the timings, =exit also quits (benchmarks/bench_startup.py)
+        profile = os.environ.get("WSC_STARTUP_PROFILE")
+        if profile:
+            print(json.dumps(self.startup_timings), flush=True)
+            if profile == "exit":
+                self.after(0, self.destroy)
 
     def check_first_run_install(self):
         """Prompt user to install on first run"""
@@ -391,7 +529,7 @@ class App(ctk.CTk):
         self.content_dash = ctk.CTkFrame(self, fg_color="transparent")
         self.content_settings = ctk.CTkFrame(self, fg_color="transparent")
         self.setup_dashboard()
-        self.setup_settings_view()
+        self.settings_built = False  # Settings are built on first visit (switch_view)
 
     def setup_dashboard(self):
         """Create dashboard UI with optimized components"""
@@ -528,6 +666,16 @@ class App(ctk.CTk):
         )
         self.results_list.pack(fill="both", expand=True)
 
+        # Optional scan diagnostics (per category / search path), shown after a scan when enabled
+        self.diag_box = ctk.CTkTextbox(
+            self.results_container,
+            height=150,
+            fg_color=self.colors["card"],
+            text_color=self.colors["text_dim"],
+            font=ctk.CTkFont(family="Consolas", size=11),
+            wrap="none"
+        )
+
         # Status bar
         self.status_lbl = ctk.CTkLabel(
             self.content_dash, 
@@ -638,7 +786,7 @@ class App(ctk.CTk):
             command=self.save_settings
         )
         self.sw_grace.pack(pady=10, padx=30, anchor="w")
-        if self.engine.config.get("grace_period_hours", 0) > 0:
+        if self.config_manager.get("grace_period_hours", 0) > 0:
             self.sw_grace.select()
 
         # Recycle bin switch
@@ -649,7 +797,7 @@ class App(ctk.CTk):
             command=self.save_settings
         )
         self.sw_bin.pack(pady=10, padx=30, anchor="w")
-        if self.engine.config.get("empty_recycle_bin"):
+        if self.config_manager.get("empty_recycle_bin"):
             self.sw_bin.select()
 
         # Dev-bloat hunter switch
@@ -659,10 +807,54 @@ class App(ctk.CTk):
             progress_color=self.colors["accent"],
             command=self.save_settings
         )
-        self.sw_dev.pack(pady=(10, 20), padx=30, anchor="w")
-        if self.engine.config.get("dev_bloat_hunter"):
+        self.sw_dev.pack(pady=10, padx=30, anchor="w")
+        if self.config_manager.get("dev_bloat_hunter"):
             self.sw_dev.select()
 
+        # Duplicate finder switch
+        self.sw_dup = ctk.CTkSwitch(
+            s_frame, 
+            text="Find Duplicate Files in Search Paths", 
+            progress_color=self.colors["accent"],
+            command=self.save_settings
+        )
+        self.sw_dup.pack(pady=10, padx=30, anchor="w")
+        if self.config_manager.get("duplicate_finder"):
+            self.sw_dup.select()
+
+        # Large file finder switch
+        self.sw_large = ctk.CTkSwitch(
+            s_frame, 
+            text="Find Largest Files in Search Paths", 
+            progress_color=self.colors["accent"],
+            command=self.save_settings
+        )
+        self.sw_large.pack(pady=10, padx=30, anchor="w")
+        if self.config_manager.get("large_files_enabled"):
+            self.sw_large.select()
+
+        # Scan diagnostics switch
+        self.sw_diag = ctk.CTkSwitch(
+            s_frame, 
+            text="Show Scan Diagnostics", 
+            progress_color=self.colors["accent"],
+            command=self.save_settings
+        )
+        self.sw_diag.pack(pady=10, padx=30, anchor="w")
+        if self.config_manager.get("scan_diagnostics"):
+            self.sw_diag.select()
+
+        # Watch mode switch
+        self.sw_watch = ctk.CTkSwitch(
+            s_frame, 
+            text="Keep Totals Live (Watch Mode)", 
+            progress_color=self.colors["accent"],
+            command=self.save_settings
+        )
+        self.sw_watch.pack(pady=(10, 20), padx=30, anchor="w")
+        if self.config_manager.get("watch_mode"):
+            self.sw_watch.select()
+
         # System integration section
         i_frame = ctk.CTkFrame(
             self.content_settings, 
@@ -720,7 +912,7 @@ class App(ctk.CTk):
         for w in self.path_listbox.winfo_children():
             w.destroy()
         
-        for path in self.engine.config.get("search_paths", []):
+        for path in self.config_manager.get("search_paths", []):
             row = ctk.CTkFrame(self.path_listbox, fg_color="transparent")
             row.pack(fill="x", pady=2)
             
@@ -737,24 +929,34 @@ class App(ctk.CTk):
     def add_search_path(self):
         """Add a new search path"""
         path = filedialog.askdirectory()
-        if path and path not in self.engine.config["search_paths"]:
-            self.engine.config["search_paths"].append(path)
+        if path and path not in self.config_manager["search_paths"]:
+            self.config_manager["search_paths"].append(path)
             self.config_manager.save_config()
             self.refresh_path_list()
+            self.apply_watch_mode()  # Live totals watch the search paths: restart on the new set
 
     def remove_search_path(self, path):
         """Remove a search path"""
-        if path in self.engine.config["search_paths"]:
-            self.engine.config["search_paths"].remove(path)
+        if path in self.config_manager["search_paths"]:
+            self.config_manager["search_paths"].remove(path)
             self.config_manager.save_config()
             self.refresh_path_list()
+            self.apply_watch_mode()
 
     def save_settings(self):
         """Save settings to config"""
-        self.engine.config["grace_period_hours"] = 24 if self.sw_grace.get() else 0
-        self.engine.config["empty_recycle_bin"] = bool(self.sw_bin.get())
-        self.engine.config["dev_bloat_hunter"] = bool(self.sw_dev.get())
+        self.config_manager["grace_period_hours"] = 24 if self.sw_grace.get() else 0
+        self.config_manager["empty_recycle_bin"] = bool(self.sw_bin.get())
+        self.config_manager["dev_bloat_hunter"] = bool(self.sw_dev.get())
+        self.config_manager["duplicate_finder"] = bool(self.sw_dup.get())
+        self.config_manager["large_files_enabled"] = bool(self.sw_large.get())
+        self.config_manager["scan_diagnostics"] = bool(self.sw_diag.get())
+        self.config_manager["watch_mode"] = bool(self.sw_watch.get())
         self.config_manager.save_config()
+        self.apply_diagnostics_logging()
+        self.apply_watch_mode()
+        if not self.config_manager["scan_diagnostics"]:
+            self.diag_box.pack_forget()
 
     def create_start_menu_shortcut(self):
         """Create Start Menu shortcut and register in Windows"""
@@ -836,6 +1038,9 @@ class App(ctk.CTk):
                          w.pack(anchor="w", pady=(10, 0))
 
         elif view_name == "settings":
+            if not self.settings_built:
+                self.setup_settings_view()
+                self.settings_built = True
             self.content_settings.grid(row=0, column=1, sticky="nsew", padx=40, pady=40)
             self.btn_settings.configure(fg_color=self.colors["card"], text_color=self.colors["accent"])
 
@@ -857,20 +1062,21 @@ class App(ctk.CTk):
         self.debounce_timer = self.after(100, self._do_update_stats)
     
     def _do_update_stats(self):
-        """Actual stats update (called after debounce)"""
-        selected_items = self.results_list.get_selected_items()
-        total_size = sum(item['size'] for item in selected_items)
+        """Actual stats update (called after debounce); O(1) reads of the selection model"""
+        selection = self.results_list.selection
+        total_size = selection.bytes
         
         # Update size card
         self.card_size.val_label.configure(text=self.engine.format_bytes(total_size))
         
-        # Enable/disable clean button
-        self.btn_clean.configure(state="normal" if selected_items else "disabled")
+        # Enable/disable clean button (not while results are still streaming in)
+        self.btn_clean.configure(state="normal" if selection.count and not self.scan_active else "disabled")
 
     def start_analyze(self):
         """Start system analysis"""
-        # Disable buttons
-        self.btn_analyze.configure(state="disabled")
+        self.cancel_refine()
+        # Analyze button becomes the Stop action while scanning
+        self.btn_analyze.configure(text="Stop Scan", fg_color=self.colors["danger"], command=self.stop_analyze)
         self.btn_clean.configure(state="disabled")
         
         # Update UI status
@@ -878,28 +1084,39 @@ class App(ctk.CTk):
         self.health_desc.configure(text="Searching for temporary files and app caches...")
         self.gauge.set_percent(0)
         
+        # Fresh results store shared by the engine and the list; rows appear as the scan streams them
+        self.scan_results = ScanResults()
+        self.card_files.val_label.configure(text="0")
+        self.results_list.set_items(self.scan_results, self.update_live_stats)
+        self.selection_frame.pack_forget()
+        self.diag_box.pack_forget()
+        
         # Start scanning animation
         self.scan_active = True
         self.animate_gauge_scanning()
         
         # Start scan in background thread
+        self.progress.reset("scan")
         threading.Thread(target=self.work_analyze, daemon=True).start()
 
+    def stop_analyze(self):
+        """Stop the running scan; results gathered so far are kept"""
+        self.btn_analyze.configure(state="disabled", text="Stopping...")
+        self.engine.cancel_scan()
+
     def animate_gauge_scanning(self):
-        """Indeterminate progress animation during scan"""
-        if self.scan_active:
+        """Indeterminate progress animation during scan (until the first results arrive)"""
+        if self.scan_active and not self.scan_results:
             # Pulse between 0-30% for scanning visual feedback
             val = (self.gauge.percent + 3) % 30
             self.gauge.set_percent(val, animate=False)
             self.after(80, self.animate_gauge_scanning)  # Slower for less CPU usage
 
     def work_analyze(self):
-        """Background worker for analysis"""
+        """Background worker for analysis (rows land in the shared store; poll_progress shows them)"""
         try:
-            results = self.engine.scan(
-                lambda m: self.after(0, lambda msg=m: self.status_lbl.configure(text=msg))
-            )
-            self.after(0, lambda: self.finish_analyze(results))
+            self.engine.scan(self.progress, results=self.scan_results)
+            self.after(0, self.finish_analyze)
         except Exception as e:
             logging.error(f"Scan failed: {e}")
             self.after(0, lambda: messagebox.showerror("Error", f"Scan failed: {e}"))
@@ -907,10 +1124,48 @@ class App(ctk.CTk):
             self.scan_active = False
             self.after(0, self.stop_progress)
 
-    def finish_analyze(self, results):
+    def poll_progress(self):
+        """
+        Fixed-rate UI refresh: drains the progress bus into one status line and shows rows
+        streamed into the store since the last tick, however fast the engine produces them.
+        """
+        try:
+            snap = self.progress.drain()
+            if snap and (self.scan_active or self.clean_active):
+                self.status_lbl.configure(text=self._progress_text(snap))
+            if self.scan_active and len(self.scan_results) > self.results_list.selection.known:
+                self.add_results()
+        except Exception as e:
+            logging.error(f"Progress update failed: {e}")
+        self.after(self.PROGRESS_POLL_MS, self.poll_progress)
+
+    def _progress_text(self, snap):
+        if snap.message or not snap.items_done:
+            return snap.message or ""
+        fmt = self.engine.format_bytes
+        if snap.phase == "clean":
+            done = f"{snap.items_done:,}/{snap.items_total:,}" if snap.items_total else f"{snap.items_done:,}"
+            return (f"Cleaning: {snap.current}  ·  {done} items, {fmt(snap.bytes_done)} freed  ·  "
+                    f"{snap.rate:.0f} items/s, {fmt(snap.byte_rate)}/s")
+        return f"Scanning: {snap.current}  ·  {snap.items_done:,} items, {fmt(snap.bytes_done)}  ·  {snap.rate:.0f} items/s"
+
+    def add_results(self):
+        """Show streamed results (already in the shared store): list, item count and live gauge"""
+        if not self.selection_frame.winfo_ismapped():
+            self.selection_frame.pack(fill="x", pady=(0, 5))
+        self.results_list.refresh()
+        selection = self.results_list.selection
+        self.card_files.val_label.configure(text=str(selection.total_count))
+        self.gauge.set_percent(self.engine.calculate_health_score(selection.total_allocated), animate=True)
+        self.update_live_stats()
+
+    def finish_analyze(self):
         """Process and display scan results"""
-        self.scan_results = results
-        total_size = sum(item['size'] for item in results)
+        if len(self.scan_results) > self.results_list.selection.known:
+            self.add_results()  # Rows streamed after the last progress tick
+        results = self.scan_results
+        # Allocated bytes, each hardlinked file counted once: what cleaning would actually free
+        total_size = self.results_list.selection.total_allocated
         
         # Update file count
         self.card_files.val_label.configure(text=str(len(results)))
@@ -933,29 +1188,86 @@ class App(ctk.CTk):
             self.health_desc.configure(text=f"Reclaim {self.engine.format_bytes(total_size)} to boost performance.")
             self.gauge.target_color = self.colors["danger"]
         
-        # Render results in virtual list
-        self.results_list.set_items(results, self.update_live_stats)
-        
-        # Show selection controls directly above results_list
-        # Since both are in results_container and results_list is always packed, before= works.
-        self.selection_frame.pack(fill="x", pady=(0, 5))
-        
         # Update initial stats
         self.update_live_stats()
-        self.status_lbl.configure(text="Analysis complete. Ready to clean.")
+        status = "Analysis complete. Ready to clean."
+        summary = self.engine.last_scan_summary
+        if summary.get('estimated_items'):
+            status = f"Analysis complete. {summary['estimated_items']} sizes are estimates (~)."
+            if self.config_manager.get("refine_estimates", True):
+                self.start_refine()
+        if summary.get('status') == "live":
+            status = "Analysis complete (live totals, kept current in the background)."
+        elif summary.get('status', "complete") != "complete":
+            reason = "Time limit reached" if summary['status'] == "deadline" else "Scan stopped"
+            status = f"{reason}: {summary['partial_items']} sizes are incomplete (marked ≥)."
+            if summary.get('skipped_searches'):
+                status += f" {summary['skipped_searches']} folders were not searched."
+        if 'index_hits' in summary:
+            status += f"  (Size index: {summary['index_hits']} hits / {summary['index_misses']} misses)"
+        if summary.get('throttled_s'):
+            status += f"  (I/O limits: workers waited {summary['throttled_s']:.1f}s)"
+        self.status_lbl.configure(text=status)
+        self.show_diagnostics()
+
+    def show_diagnostics(self):
+        """Fill the diagnostics panel with the last scan's per-category / per-search-path stats"""
+        stats = self.engine.last_scan_stats
+        if not self.config_manager.get("scan_diagnostics") or stats is None:
+            self.diag_box.pack_forget()
+            return
+        self.diag_box.configure(state="normal")
+        self.diag_box.delete("1.0", "end")
+        self.diag_box.insert("1.0", stats.format_table())
+        self.diag_box.configure(state="disabled")
+        if not self.diag_box.winfo_ismapped():
+            self.diag_box.pack(fill="x", pady=(10, 0))
+
+    def start_refine(self):
+        """Compute exact sizes for estimated results in the background"""
+        self.refine_token = CancelToken()
+        threading.Thread(target=self.work_refine, args=(self.scan_results, self.refine_token), daemon=True).start()
+
+    def work_refine(self, results, token):
+        """Background worker for exact refinement of estimated sizes"""
+        try:
+            for res, exact in self.engine.refine_estimates(results, token):
+                self.after(0, lambda r=res, e=exact: self.apply_refinement(r, e, token))
+        except Exception as e:
+            logging.error(f"Refinement failed: {e}")
+
+    def apply_refinement(self, res, exact, token):
+        """Replace an estimate with its exact size (main thread)"""
+        if token is not self.refine_token or token.cancelled:
+            return
+        res.update(partial=exact['partial'], estimated=False, size_error=0)
+        self.results_list.update_item(res, size=exact['size'], allocated=exact['allocated'])
+        self.gauge.set_percent(self.engine.calculate_health_score(self.results_list.selection.total_allocated),
+                               animate=True)
+        self.update_live_stats()
+
+    def cancel_refine(self):
+        """Stop a running refinement (results are about to change)"""
+        if self.refine_token:
+            self.refine_token.cancel()
+            self.refine_token = None
 
     def start_clean(self):
         """Start cleaning selected items"""
-        items_to_del = self.results_list.get_selected_items()
-        if not items_to_del:
+        selection = self.results_list.selection
+        if not selection.count:
             return
+        items_to_del = self.results_list.get_selected_items()
         
-        # Confirmation dialog
-        msg = f"Move {len(items_to_del)} items to Recycle Bin?"
-        if self.engine.config.get("empty_recycle_bin"):
+        # Confirmation dialog with per-category subtotals from the selection model
+        msg = f"Move {selection.count} items ({self.engine.format_bytes(selection.bytes)}) to Recycle Bin?\n"
+        for cat, (count, size) in sorted(selection.category_subtotals().items()):
+            msg += f"\n  {cat}: {count} items, {self.engine.format_bytes(size)}"
+        if self.config_manager.get("empty_recycle_bin"):
             msg += "\n\n⚠️ WARNING: 'Empty Recycle Bin' is ENABLED."
         
         if messagebox.askyesno("Confirm Cleanup", msg):
+            self.cancel_refine()
             # Disable buttons
             self.btn_clean.configure(state="disabled")
             self.btn_analyze.configure(state="disabled")
@@ -964,20 +1276,20 @@ class App(ctk.CTk):
             self.health_lbl.configure(text="CLEANING...", text_color=self.colors["accent"])
             
             # Start cleaning in background
+            self.progress.reset("clean")
+            self.clean_active = True
             threading.Thread(target=self.work_clean, args=(items_to_del,), daemon=True).start()
 
     def work_clean(self, items):
         """Background worker for cleaning"""
         try:
-            count, size = self.engine.clean(
-                items, 
-                lambda m: self.after(0, lambda msg=m: self.status_lbl.configure(text=msg))
-            )
+            count, size = self.engine.clean(items, self.progress)
             self.after(0, lambda: self.finish_clean(count, size))
         except Exception as e:
             logging.error(f"Clean failed: {e}")
             self.after(0, lambda: messagebox.showerror("Error", f"Clean failed: {e}"))
         finally:
+            self.clean_active = False
             self.after(0, self.stop_progress)
 
     def finish_clean(self, count, size):
@@ -990,21 +1302,36 @@ class App(ctk.CTk):
         self.gauge.target_color = self.colors["success"]
         self.gauge.set_percent(0, animate=True)
         
-        # Show success message
-        messagebox.showinfo("Success", f"Reclaimed {self.engine.format_bytes(size)}!")
+        # Show success message with throughput and failures from the clean summary
+        summary = self.engine.last_clean_summary
+        msg = f"Reclaimed {self.engine.format_bytes(size)}!"
+        if summary:
+            msg += f"\n\n{count} items in {summary['elapsed_s']:.1f}s ({summary['items_per_s']:.0f} items/s, {summary['mb_per_s']:.1f} MB/s)"
+            if summary['failed']:
+                msg += f"\n{summary['failed']} items could not be moved to the Recycle Bin."
+        messagebox.showinfo("Success", msg)
         
         # Reset UI
         self.card_files.val_label.configure(text="0")
-        self.results_list.set_items([], self.update_live_stats)
+        self.scan_results = ScanResults()
+        self.results_list.set_items(self.scan_results, self.update_live_stats)
         self.selection_frame.pack_forget() # Hide selection controls
         self.update_live_stats()
 
     def stop_progress(self):
         """Re-enable analyze button after operation"""
-        self.btn_analyze.configure(state="normal")
+        self.btn_analyze.configure(
+            state="normal", 
+            text="Generate Report", 
+            fg_color=self.colors["accent"], 
+            command=self.start_analyze
+        )
 
 
 if __name__ == "__main__":
+    # The duplicate finder hashes on a process pool; frozen builds must not re-run the app in workers
+    import multiprocessing
+    multiprocessing.freeze_support()
     try:
         app = App()
         app.mainloop()
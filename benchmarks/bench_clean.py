@@ -0,0 +1,111 @@
+"""
+Benchmark: CleanerEngine.clean() throughput, serial (batch 1, 1 worker, like the old loop)
+vs. the batched parallel trash pipeline, on two workloads:
+  files  uniquely named temp files
+  bloat  Dev-Bloat style folders (node_modules, __pycache__, .venv, ...) repeated per project, where
+         many items share a name; the freedesktop trash needs each name on a single lane
+For each workload the largest lane (the critical path of the pipeline) is printed next to what
+hashing item names onto lanes, the previous assignment, would give. On the freedesktop trash,
+same-named items are bound by send2trash probing "name", "name 2", ... for a free destination,
+so the bloat timings mostly show the balance; the Windows Recycle Bin gets round-robin lanes.
+One item of each pipeline run is deleted beforehand and must be reported as skipped, not freed.
+
+Runs against the freedesktop trash on Linux. HOME and XDG_DATA_HOME are pointed into a
+temporary directory before send2trash is imported, so nothing lands in the real trash.
+
+Usage: python benchmarks/bench_clean.py [--items 2000] [--size 4096] [--projects 150] [--batch 64] [--workers 4]
+"""
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+ROOT = Path(tempfile.mkdtemp(prefix="wsc_clean_bench_"))
+os.environ["HOME"] = str(ROOT)
+os.environ["XDG_DATA_HOME"] = str(ROOT / "xdg")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config_manager import ConfigManager  # noqa: E402
+from cleaner_engine import CleanerEngine  # noqa: E402
+
+
+def make_items(folder, count, size):
+    folder.mkdir(parents=True)
+    payload = b"x" * size
+    items = []
+    for i in range(count):
+        p = folder / f"tmp{i:06d}.dat"
+        p.write_bytes(payload)
+        items.append({'path': p, 'size': size, 'category': 'TEMP'})
+    return items
+
+
+BLOAT_NAMES = ("node_modules", "__pycache__", ".venv", "target", "build", ".pytest_cache")
+
+
+def make_bloat(folder, projects, size):
+    """projects x BLOAT_NAMES folders of 8 files each; items are the folders"""
+    payload = b"x" * size
+    items = []
+    for i in range(projects):
+        for name in BLOAT_NAMES:
+            d = folder / f"project{i:04d}" / name
+            d.mkdir(parents=True)
+            for j in range(8):
+                (d / f"f{j}").write_bytes(payload)
+            items.append({'path': d, 'size': 8 * size, 'category': 'DEV-BLOAT'})
+    return items
+
+
+def run(engine, label, items, batch, workers):
+    # Start from an empty trash: send2trash probes "name", "name 2", ... for a free destination
+    shutil.rmtree(ROOT / "xdg" / "Trash", ignore_errors=True)
+    engine.config["clean_batch_size"] = batch
+    engine.config["clean_workers"] = workers
+    count, size = engine.clean(items, lambda m: None)
+    s = engine.last_clean_summary
+    print(f"{label:10}: {count} items, {s['elapsed_s']:6.2f}s  "
+          f"{s['items_per_s']:8.0f} items/s  {s['mb_per_s']:7.1f} MB/s  failed={s['failed']}")
+    return s
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=4096)
+    parser.add_argument("--projects", type=int, default=150)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    try:
+        config = ConfigManager(ROOT / "config.json")
+        config["empty_recycle_bin"] = False
+        config["size_index_enabled"] = False
+        engine = CleanerEngine(config)
+
+        ok = True
+        for workload, make, count in (("files", make_items, args.items), ("bloat", make_bloat, args.projects)):
+            print(f"[{workload}]")
+            serial = run(engine, "serial", make(ROOT / workload / "a", count, args.size), 1, 1)
+            items = make(ROOT / workload / "b", count, args.size)
+            lanes = engine._clean_lanes(items, args.workers)
+            by_hash = max(sum(1 for item in items if hash(item['path'].name) % args.workers == k)
+                          for k in range(args.workers))
+            print(f"lanes     : largest {max(map(len, lanes))} of {len(items)} items "
+                  f"(hash by name: {by_hash})")
+            shutil.rmtree(items[0]['path']) if items[0]['path'].is_dir() else items[0]['path'].unlink()
+            batched = run(engine, "pipeline", items, args.batch, args.workers)
+            print(f"speedup   : {serial['elapsed_s'] / batched['elapsed_s']:.2f}x")
+            ok = ok and not serial['failed'] and not batched['failed']
+            ok = ok and batched['skipped'] == 1 and batched['deleted'] == len(items) - 1
+        return 0 if ok else 1
+    finally:
+        shutil.rmtree(ROOT, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
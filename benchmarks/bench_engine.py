@@ -0,0 +1,238 @@
+"""
+Benchmark suite: engine hot paths on a deterministic synthetic tree (benchmarks/synthetic_tree.py).
+
+Cases: get_size, the legacy Dev-Bloat path (find_bloat_recursive + get_size per hit), _scan_category
+for all standard targets, a full scan() with a cold and a warm size index, and clean().
+For each case: best wall time over --repeat runs, throughput (entries/s, MB/s) and peak Python heap
+(tracemalloc, measured in a separate run so it does not skew the timings).
+
+Results are compared against benchmarks/baseline.json, keyed by OS, architecture, CPU count and
+scale; a throughput drop or a peak-memory growth beyond --tolerance fails the run with exit code 1.
+clean() is nothing but filesystem metadata writes, whose speed swings about 3x between runs on a
+virtualised disk, so it is allowed at least CLEAN_TOLERANCE and only gross regressions fail it.
+--update-baseline records the current numbers instead. On a machine without a baseline of its own
+nothing is compared: record one there first.
+
+Usage: python benchmarks/bench_engine.py [--scale small|medium|large] [--repeat 5] [--tolerance 0.3]
+                                         [--workers 0] [--only scan,clean] [--update-baseline] [--keep]
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(tempfile.mkdtemp(prefix="wsc_engine_bench_"))
+# The freedesktop trash lives under HOME/XDG_DATA_HOME: keep clean() runs out of the real one
+(ROOT / "home").mkdir()
+os.environ["HOME"] = str(ROOT / "home")
+os.environ["XDG_DATA_HOME"] = str(ROOT / "xdg")
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent))
+
+from synthetic_tree import SyntheticTree, SCALES, TreeStats  # noqa: E402
+from config_manager import ConfigManager  # noqa: E402
+from cleaner_engine import CleanerEngine  # noqa: E402
+from walker import TreeWalker  # noqa: E402
+
+BASELINE = HERE / "baseline.json"
+MB = 1024 * 1024
+CLEAN_TOLERANCE = 0.75
+
+
+def noop(_message):
+    pass
+
+
+class Case:
+    """One benchmark: setup() runs untimed before every run, run() is timed"""
+    def __init__(self, name, workload, run, setup=None, tolerance=None):
+        self.name = name
+        self.workload = workload  # TreeStats of what one run walks
+        self.run = run
+        self.setup = setup or (lambda: None)
+        self.tolerance = tolerance  # None = --tolerance
+
+
+def make_engine(config_dir, tree, workers, index):
+    config = ConfigManager(config_dir / "config.json")
+    config["dev_bloat_hunter"] = True
+    config["search_paths"] = [str(tree.projects.parent)]
+    config["max_scan_depth"] = 3
+    config["scan_workers"] = workers
+    config["empty_recycle_bin"] = False
+    config["size_index_enabled"] = index
+    return CleanerEngine(config)
+
+
+def build_cases(tree, args):
+    work = ROOT / "work"
+    work.mkdir()
+    engine = make_engine(work, tree, args.workers, index=False)
+    indexed = make_engine(work, tree, args.workers, index=True)
+    categories = ("temp", "system_temp", "discord", "spotify")
+
+    def legacy_hunt():
+        for hit in engine.find_bloat_recursive(tree.projects, 0, 3, noop):
+            engine.get_size(hit)
+
+    def scan_categories():
+        walker = TreeWalker(workers=engine.config.get("scan_workers", 0))
+        for target, cat in engine.get_standard_targets():
+            engine._scan_category(target, cat, 0, noop, walker)
+        walker.run()
+
+    warmed = []
+    def warm_index():
+        if not warmed:
+            indexed.scan(noop)
+            warmed.append(True)
+
+    # clean() consumes its input: every run trashes a freshly written batch of TEMP-like files.
+    # The trash is emptied first and names are unique per batch, so no run pays for name collisions
+    # against (or a growing index of) what earlier runs trashed; the batch is flushed to disk before
+    # the timer starts, so the run does not compete with its own writeback.
+    clean_stats = TreeStats()
+    clean_items = []
+    clean_count = SCALES[tree.scale]['temp_files'] // 4
+    batches = []
+    def make_clean_batch():
+        shutil.rmtree(ROOT / "xdg" / "Trash", ignore_errors=True)
+        folder = ROOT / "clean" / f"batch_{len(batches):03d}"
+        folder.mkdir(parents=True)
+        batches.append(folder)
+        clean_items.clear()
+        clean_stats.files = clean_stats.bytes = 0
+        for i in range(clean_count):
+            p = folder / f"b{len(batches):03d}_{i:06d}.tmp"
+            p.write_bytes(b"\0" * 4096)
+            clean_items.append({'path': p, 'size': 4096, 'category': 'TEMP'})
+            clean_stats.files += 1
+            clean_stats.bytes += 4096
+        if hasattr(os, "sync"):
+            os.sync()
+
+    cases = [
+        Case("get_size", tree.stats("projects"), lambda: engine.get_size(tree.projects)),
+        Case("legacy_hunt", tree.stats("projects"), legacy_hunt),
+        Case("scan_category", tree.stats(*categories), scan_categories),
+        Case("scan", tree.stats(), lambda: engine.scan(noop)),
+        Case("scan_warm_index", tree.stats(), lambda: indexed.scan(noop), setup=warm_index),
+        Case("clean", clean_stats, lambda: engine.clean(clean_items, noop), setup=make_clean_batch,
+             tolerance=max(args.tolerance, CLEAN_TOLERANCE)),
+    ]
+    if args.only:
+        wanted = set(args.only.split(","))
+        cases = [c for c in cases if c.name in wanted]
+    return cases
+
+
+def measure(case, repeat):
+    best = None
+    for _ in range(repeat):
+        case.setup()
+        start = time.perf_counter()
+        case.run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    case.setup()
+    tracemalloc.start()
+    case.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    entries = case.workload.entries
+    return {
+        'wall_s': round(best, 4),
+        'entries': entries,
+        'entries_per_s': round(entries / best, 1) if best > 0 else 0.0,
+        'mb_per_s': round(case.workload.bytes / MB / best, 2) if best > 0 else 0.0,
+        'peak_mb': round(peak / MB, 2),
+    }
+
+
+def compare(results, baseline, tolerances):
+    """Returns a list of regression messages (empty when everything is within tolerance)"""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        tolerance = tolerances[name]
+        if current['entries_per_s'] < base['entries_per_s'] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {current['entries_per_s']:,.0f} entries/s "
+                               f"< baseline {base['entries_per_s']:,.0f} (-{tolerance:.0%} allowed)")
+        # Ignore sub-megabyte noise in the heap peak
+        if current['peak_mb'] > base['peak_mb'] * (1 + tolerance) and current['peak_mb'] - base['peak_mb'] > 1:
+            regressions.append(f"{name}: peak memory {current['peak_mb']:.1f} MB "
+                               f"> baseline {base['peak_mb']:.1f} MB (+{tolerance:.0%} allowed)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    parser.add_argument("--workers", type=int, default=0, help="scan_workers for the engine (0 = auto)")
+    parser.add_argument("--only", help="Comma-separated case names")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated tree and print its location")
+    args = parser.parse_args()
+
+    if platform.system() == "Windows" and not args.only:
+        # send2trash uses the real Recycle Bin there
+        print("note: on Windows the clean case fills the real Recycle Bin; use --only to skip it")
+
+    try:
+        start = time.perf_counter()
+        tree = SyntheticTree(ROOT / "tree", args.scale, args.seed).build()
+        total = tree.stats()
+        print(f"tree ({args.scale}, seed {args.seed}): {total.files:,} files, {total.dirs:,} dirs, "
+              f"{total.bytes / MB:.1f} MB, built in {time.perf_counter() - start:.1f}s")
+        os.environ.update(tree.target_env())
+
+        results = {}
+        tolerances = {}
+        for case in build_cases(tree, args):
+            tolerances[case.name] = args.tolerance if case.tolerance is None else case.tolerance
+            r = results[case.name] = measure(case, args.repeat)
+            print(f"{case.name:16}: {r['wall_s']:7.3f}s  {r['entries_per_s']:11,.0f} entries/s  "
+                  f"{r['mb_per_s']:8.1f} MB/s  peak {r['peak_mb']:7.1f} MB")
+
+        key = f"{platform.system()}-{platform.machine()}-{os.cpu_count()}cpu-{args.scale}"
+        stored = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+        if args.update_baseline:
+            stored[key] = {**stored.get(key, {}), **results}
+            BASELINE.write_text(json.dumps(stored, indent=4, sort_keys=True) + "\n")
+            print(f"baseline '{key}' updated in {BASELINE.name}")
+            return 0
+        if key not in stored:
+            print(f"no baseline for '{key}' yet: run with --update-baseline to record one")
+            return 0
+
+        regressions = compare(results, stored[key], tolerances)
+        if regressions:
+            print(f"\nREGRESSION against baseline '{key}':")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"OK: within tolerance of baseline '{key}'")
+        return 0
+    finally:
+        if args.keep:
+            print(f"tree kept at {ROOT}")
+        else:
+            shutil.rmtree(ROOT, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
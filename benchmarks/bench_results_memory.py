@@ -0,0 +1,70 @@
+"""
+Benchmark: memory of 1M synthetic scan results as the old list of dicts
+({'path': Path, 'size': int, 'category': str}) vs. the columnar ScanResults store.
+
+Usage: python benchmarks/bench_results_memory.py [--entries 1000000]
+"""
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scan_results import ScanResults  # noqa: E402
+
+CATEGORIES = ["TEMP", "SYSTEM_TEMP", "PREFETCH", "DISCORD", "SPOTIFY", "DEV-BLOAT"]
+
+
+def synthetic_rows(count):
+    """Deterministic paths spread over ~1000 parent folders, like TEMP/cache contents."""
+    for i in range(count):
+        parent = os.path.join(os.sep, "Users", "dev", "AppData", "Local", "Temp", f"batch_{i % 1000:04d}")
+        yield os.path.join(parent, f"tmp{i:07d}.dat"), (i * 7919) % 10_000_000, CATEGORIES[i % len(CATEGORIES)]
+
+
+def build_dicts(count):
+    return [{'path': Path(p), 'size': s, 'category': c} for p, s, c in synthetic_rows(count)]
+
+
+def build_store(count):
+    store = ScanResults()
+    for p, s, c in synthetic_rows(count):
+        store.append(p, s, c)
+    return store
+
+
+def measure(build, count):
+    tracemalloc.start()
+    start = time.perf_counter()
+    obj = build(count)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    mb = 1024 * 1024
+    rows = []
+    for label, build in (("list of dicts", build_dicts), ("ScanResults", build_store)):
+        obj, current, peak, elapsed = measure(build, args.entries)
+        rows.append((label, current, peak, elapsed))
+        del obj
+
+    print(f"entries: {args.entries:,}")
+    for label, current, peak, elapsed in rows:
+        print(f"{label:14}: {current / mb:8.1f} MB retained  {peak / mb:8.1f} MB peak  "
+              f"{current / args.entries:6.1f} B/row  built in {elapsed:.2f}s")
+    print(f"reduction     : {rows[0][1] / rows[1][1]:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Benchmark: GUI cold start. Launches WindowsSystemCleaner.py with WSC_STARTUP_PROFILE=exit, which
+prints its own timings (module imports, App.__init__, first paint) and quits after the first paint.
+
+Reports medians over several runs and fails (exit 1) if time-to-first-paint exceeds the budget.
+--importtime adds a `python -X importtime` breakdown of the slowest imports.
+Needs a display (on Linux CI, run under xvfb-run).
+
+Usage: python benchmarks/bench_startup.py [--runs 5] [--budget-ms 1500] [--importtime]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+APP = Path(__file__).resolve().parent.parent / "WindowsSystemCleaner.py"
+
+
+def launch(env, extra_args=()):
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, *extra_args, str(APP)], env=env,
+                          capture_output=True, text=True, timeout=120)
+    wall = time.perf_counter() - start
+    timings = None
+    for line in proc.stdout.splitlines():
+        if line.startswith("{"):
+            timings = json.loads(line)
+    if timings is None:
+        output = (proc.stderr + proc.stdout).strip()
+        raise RuntimeError(f"App did not report startup timings (exit {proc.returncode}):\n{output[-2000:]}")
+    timings['process_s'] = wall
+    return timings, proc.stderr
+
+
+def slowest_imports(stderr, count):
+    """Parses `-X importtime` output into (cumulative_us, module), slowest first"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        try:
+            rows.append((int(cumulative), module.rstrip()))
+        except ValueError:
+            continue  # Header line
+    # Only top-level entries of the import tree (indentation of one space)
+    top = [(us, m.strip()) for us, m in rows if not m.startswith("  ")]
+    return sorted(top, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1500)
+    parser.add_argument("--importtime", action="store_true")
+    args = parser.parse_args()
+
+    # Isolated profile directory so config/logs/size index of the real app are untouched
+    home = tempfile.mkdtemp(prefix="wsc_startup_bench_")
+    env = dict(os.environ, WSC_STARTUP_PROFILE="exit", LOCALAPPDATA=home, APPDATA=home, HOME=home)
+
+    runs = []
+    for _ in range(args.runs):
+        timings, _ = launch(env)
+        runs.append(timings)
+
+    for key in ("imports_s", "init_s", "first_paint_s", "process_s"):
+        values = [r[key] for r in runs]
+        print(f"{key:14}: median {statistics.median(values) * 1000:7.1f} ms  "
+              f"(min {min(values) * 1000:.1f}, max {max(values) * 1000:.1f})")
+
+    if args.importtime:
+        _, stderr = launch(env, ("-X", "importtime"))
+        print("slowest imports (cumulative):")
+        for us, module in slowest_imports(stderr, 15):
+            print(f"  {us / 1000:8.1f} ms  {module}")
+
+    first_paint_ms = statistics.median(r['first_paint_s'] for r in runs) * 1000
+    if first_paint_ms > args.budget_ms:
+        print(f"FAIL: time-to-first-paint {first_paint_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        return 1
+    print(f"OK: time-to-first-paint {first_paint_ms:.1f} ms within budget {args.budget_ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Benchmark: single-pass TreeWalker vs. the legacy two-phase Dev-Bloat path
+(find_bloat_recursive + the original recursive get_size per hit, copied below) on a synthetic tree.
+The walker also stat()s every directory it sizes (hardlink/loop guard, size-index stamp), which
+the legacy path never did.
+
+Usage: python benchmarks/bench_walker.py [--projects 40] [--packages 30] [--files 20] [--repeat 7] [--workers 1]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from walker import TreeWalker  # noqa: E402
+from config_manager import ConfigManager  # noqa: E402
+from cleaner_engine import CleanerEngine  # noqa: E402
+
+OLD = time.time() - 90 * 24 * 3600
+
+
+def build_tree(root, projects, packages, files):
+    """
+    Creates `projects` stale projects, alternately node (package.json + node_modules) and python
+    (pyproject.toml + .venv), each bloat folder holding `packages` x `files` files. Every fifth
+    project was touched recently and must not be reported.
+    """
+    for p in range(projects):
+        proj = root / f"project_{p:03d}"
+        (proj / "src").mkdir(parents=True)
+        (proj / "src" / "main.js").write_bytes(b"x" * 512)
+        if p % 2:
+            markers, bloat = ("pyproject.toml", "poetry.lock"), proj / ".venv"
+        else:
+            markers, bloat = ("package.json", "package-lock.json"), proj / "node_modules"
+        for k in range(packages):
+            pkg = bloat / f"pkg_{k:03d}" / "lib"
+            pkg.mkdir(parents=True)
+            for f in range(files):
+                (pkg / f"f{f}.js").write_bytes(b"y" * (100 + f))
+        for name in markers:
+            (proj / name).write_text("{}")
+            if p % 5:
+                os.utime(proj / name, (OLD, OLD))
+
+
+def legacy_get_size(path, timeout=3600):
+    """Verbatim copy of the pre-walker recursive CleanerEngine.get_size."""
+    start_time = time.time()
+    try:
+        if path.is_file():
+            return path.stat().st_size
+        total = 0
+        with os.scandir(path) as it:
+            for entry in it:
+                if time.time() - start_time > timeout:
+                    return total
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat().st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        total += legacy_get_size(Path(entry.path), timeout - (time.time() - start_time))
+                except (PermissionError, FileNotFoundError):
+                    continue
+        return total
+    except Exception:
+        return 0
+
+
+def two_phase(engine, root, max_depth):
+    found = engine.find_bloat_recursive(root, 1, max_depth, lambda m: None, detector=engine.detector)
+    return sum(legacy_get_size(p) for p in found)
+
+
+def single_pass(engine, root, max_depth, workers):
+    walker = TreeWalker(size_index=None, timeout=3600, workers=workers)
+    walker.add_hunt(root, max_depth, detector=engine.detector)
+    return sum(r['size'] for r in walker.run())
+
+
+def best_of(fn, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--projects", type=int, default=40)
+    parser.add_argument("--packages", type=int, default=30)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--max-depth", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--workers", type=int, default=1, help="Walker threads (0 = auto)")
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="wsc_bench_"))
+    try:
+        tree = root / "tree"
+        build_tree(tree, args.projects, args.packages, args.files)
+        # A real engine: find_bloat_recursive charges its directory reads to engine.governor,
+        # and both paths classify projects with its EcosystemDetector
+        config = ConfigManager(root / "config.json")
+        config["size_index_enabled"] = False
+        engine = CleanerEngine(config)
+
+        t_two, bytes_two = best_of(lambda: two_phase(engine, tree, args.max_depth), args.repeat)
+        t_one, bytes_one = best_of(lambda: single_pass(engine, tree, args.max_depth, args.workers), args.repeat)
+
+        print(f"tree: {args.projects} projects x {args.packages} packages x {args.files} files")
+        print(f"two-phase   : {t_two * 1000:8.1f} ms  ({bytes_two} bytes)")
+        print(f"single-pass : {t_one * 1000:8.1f} ms  ({bytes_one} bytes)")
+        print(f"speedup     : {t_two / t_one:.2f}x")
+        if bytes_two != bytes_one:
+            print("WARNING: byte totals differ")
+            return 1
+        return 0
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
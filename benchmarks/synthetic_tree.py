@@ -0,0 +1,168 @@
+"""
+Deterministic synthetic filesystem for the engine benchmarks.
+
+Builds, under one root, the kinds of trees the cleaner walks in practice:
+  Temp/, Windows/Temp/                  TEMP-like flat dirs (many files, a few shallow sub-folders)
+  AppData/Roaming/discord/Cache/        many-tiny-file cache
+  AppData/Local/Spotify/PersistentCache many-tiny-file cache, two levels of shards
+  home/projects/*/node_modules          deep node_modules trees (stale, found by the Dev-Bloat hunt)
+
+The same (scale, seed) always yields the same names, sizes and mtimes. target_env() returns the
+environment variables that make CleanerEngine.get_standard_targets() resolve into the tree.
+"""
+import os
+import time
+import random
+from pathlib import Path
+
+# Per-scale knobs; every count multiplies into the number of files written. 'small' is sized so each
+# bench_engine case runs for at least ~200 ms: shorter runs were dominated by timer and scheduling noise
+SCALES = {
+    'small':  {'temp_files': 8000,   'temp_dirs': 40,  'cache_files': 4000,   'projects': 28, 'packages': 60,  'depth': 3, 'pkg_files': 16},
+    'medium': {'temp_files': 30000,  'temp_dirs': 150, 'cache_files': 30000,  'projects': 40, 'packages': 80,  'depth': 4, 'pkg_files': 16},
+    'large':  {'temp_files': 100000, 'temp_dirs': 400, 'cache_files': 100000, 'projects': 80, 'packages': 150, 'depth': 5, 'pkg_files': 20},
+}
+
+AGE = 90 * 24 * 3600  # Everything is older than the grace period and the Dev-Bloat staleness threshold
+
+
+class TreeStats:
+    """Files, directories and bytes written below one region of the tree"""
+    __slots__ = ('files', 'dirs', 'bytes')
+
+    def __init__(self):
+        self.files = 0
+        self.dirs = 0
+        self.bytes = 0
+
+    @property
+    def entries(self):
+        return self.files + self.dirs
+
+    def add(self, other):
+        self.files += other.files
+        self.dirs += other.dirs
+        self.bytes += other.bytes
+
+
+class SyntheticTree:
+    def __init__(self, root, scale="small", seed=1234):
+        if scale not in SCALES:
+            raise ValueError(f"Unknown scale {scale!r} (choose from {', '.join(SCALES)})")
+        self.root = Path(root)
+        self.scale = scale
+        self.params = SCALES[scale]
+        self.seed = seed
+        self.regions = {}  # name -> (path, TreeStats)
+        self._mtime = time.time() - AGE
+
+    # --- layout -------------------------------------------------------------
+    @property
+    def temp(self):
+        return self.root / "Temp"
+
+    @property
+    def system_root(self):
+        return self.root / "Windows"
+
+    @property
+    def appdata(self):
+        return self.root / "AppData" / "Roaming"
+
+    @property
+    def local_appdata(self):
+        return self.root / "AppData" / "Local"
+
+    @property
+    def projects(self):
+        return self.root / "home" / "projects"
+
+    def target_env(self):
+        """Environment overrides that point the engine's standard targets into the tree"""
+        return {
+            'TEMP': str(self.temp),
+            'SystemRoot': str(self.system_root),
+            'APPDATA': str(self.appdata),
+            'LOCALAPPDATA': str(self.local_appdata),
+        }
+
+    def stats(self, *names):
+        total = TreeStats()
+        for name in names or self.regions:
+            total.add(self.regions[name][1])
+        return total
+
+    # --- generation ---------------------------------------------------------
+    def build(self):
+        rng = random.Random(self.seed)
+        p = self.params
+        self.regions['temp'] = (self.temp, self._flat(self.temp, rng, p['temp_files'], p['temp_dirs']))
+        self.regions['system_temp'] = (self.system_root / "Temp",
+                                       self._flat(self.system_root / "Temp", rng, p['temp_files'] // 4, p['temp_dirs'] // 4))
+        discord = self.appdata / "discord" / "Cache"
+        self.regions['discord'] = (discord, self._cache(discord, rng, p['cache_files'], shards=0))
+        spotify = self.local_appdata / "Spotify" / "PersistentCache"
+        self.regions['spotify'] = (spotify, self._cache(spotify, rng, p['cache_files'], shards=2))
+        self.regions['projects'] = (self.projects, self._projects(rng))
+        return self
+
+    def _write(self, path, size, stats):
+        with open(path, "wb") as f:
+            if size:
+                f.write(b"\0" * size)
+        os.utime(path, (self._mtime, self._mtime))
+        stats.files += 1
+        stats.bytes += size
+
+    def _finish(self, root, stats):
+        """Counts every directory below root and ages them (mtimes change while files are written)"""
+        stats.dirs = 0
+        for dirpath, dirnames, _ in os.walk(root, topdown=False):
+            stats.dirs += len(dirnames)
+            os.utime(dirpath, (self._mtime, self._mtime))
+        return stats
+
+    def _flat(self, root, rng, files, dirs):
+        """TEMP-like: mostly loose files of mixed size, some shallow installer/extract folders"""
+        stats = TreeStats()
+        root.mkdir(parents=True, exist_ok=True)
+        loose = files - files // 4
+        for i in range(loose):
+            self._write(root / f"tmp{i:06d}.tmp", rng.choice((0, 512, 4096, 65536, rng.randrange(1 << 20))), stats)
+        per_dir = (files - loose) // max(1, dirs)
+        for d in range(dirs):
+            sub = root / f"extract_{d:04d}"
+            sub.mkdir()
+            for i in range(per_dir):
+                self._write(sub / f"part{i:05d}.bin", rng.randrange(32 * 1024), stats)
+        return self._finish(root, stats)
+
+    def _cache(self, root, rng, files, shards):
+        """Many tiny files, optionally spread over two-character shard folders"""
+        stats = TreeStats()
+        root.mkdir(parents=True, exist_ok=True)
+        for i in range(files):
+            folder = root
+            for level in range(shards):
+                folder = folder / f"{(i >> (4 * level)) & 0xFF:02x}"
+            folder.mkdir(parents=True, exist_ok=True)
+            self._write(folder / f"data_{i:07d}", rng.randrange(64, 2048), stats)
+        return self._finish(root, stats)
+
+    def _projects(self, rng):
+        """Stale projects, each with a node_modules nested `depth` levels deep"""
+        p = self.params
+        stats = TreeStats()
+        for n in range(p['projects']):
+            proj = self.projects / f"project_{n:03d}"
+            (proj / "src").mkdir(parents=True)
+            self._write(proj / "package.json", 512, stats)
+            self._write(proj / "src" / "index.js", 2048, stats)
+            for k in range(p['packages']):
+                pkg = proj / "node_modules" / f"pkg_{k:03d}"
+                for level in range(p['depth']):
+                    pkg = pkg / ("lib" if level % 2 == 0 else "dist")
+                pkg.mkdir(parents=True)
+                for f in range(p['pkg_files']):
+                    self._write(pkg / f"mod{f:02d}.js", rng.randrange(100, 16 * 1024), stats)
+        return self._finish(self.projects, stats)
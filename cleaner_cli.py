@@ -0,0 +1,299 @@
+"""
+Headless command-line interface for the cleaner engine.
+
+    python -m cleaner_cli scan   [--deadline S] [--estimate]       # one NDJSON line per result, then a summary
+    python -m cleaner_cli clean  --yes [--from FILE|-] [--dry-run] # trash a fresh scan or a saved scan
+    python -m cleaner_cli report                                   # one JSON summary (totals, health score)
+    python -m cleaner_cli watch  [--for S]                         # a 'totals' line whenever the live totals change
+    python -m cleaner_cli daemon --yes [--schedule CRON] [--now]   # unattended scan + clean on a schedule, low priority
+    python -m cleaner_cli history [--last N]                       # past unattended runs
+
+Every line on stdout is a JSON object with a "type" field ("result", "stats", "failure", "summary", "report",
+"trace", "totals", "run").
+Log messages go to stderr. This module must never import tkinter/customtkinter/PIL.
+"""
+import os
+import sys
+import json
+import logging
+import time
+import argparse
+from pathlib import Path
+
+from config_manager import ConfigManager
+from cleaner_engine import CleanerEngine
+
+logger = logging.getLogger(__name__)
+
+# Exit codes
+EXIT_OK = 0
+EXIT_ERROR = 1       # Unexpected failure
+EXIT_USAGE = 2       # Bad arguments (same as argparse)
+EXIT_INCOMPLETE = 3  # Scan stopped early or some items could not be trashed
+EXIT_INTERRUPTED = 130
+
+
+def default_config_path():
+    """Same location the desktop app uses"""
+    return Path(os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))) / "WindowsSystemCleaner" / "config.json"
+
+
+def emit(record_type, **fields):
+    sys.stdout.write(json.dumps({'type': record_type, **fields}, default=str) + "\n")
+    sys.stdout.flush()
+
+
+def result_fields(res):
+    fields = res.to_dict()
+    fields['path'] = str(fields['path'])
+    return fields
+
+
+def make_engine(args):
+    config_path = Path(args.config) if args.config else default_config_path()
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config = ConfigManager(config_path)
+    # Command-line overrides apply to this run only; config.json is never written
+    if getattr(args, "deadline", None) is not None:
+        config["scan_deadline_seconds"] = args.deadline
+    if getattr(args, "workers", None) is not None:
+        config["scan_workers"] = args.workers
+    if getattr(args, "estimate", False):
+        config["size_mode"] = "estimate"
+    if args.trace:
+        config["trace_enabled"] = True
+    for name in ("dir_reads_per_s", "stats_per_s", "bytes_per_s"):
+        if getattr(args, f"io_{name}") is not None:
+            config[f"io_{name}"] = getattr(args, f"io_{name}")
+    return CleanerEngine(config)
+
+
+def run_scan(engine, stream=True):
+    """Scans, optionally streaming each result as NDJSON. Returns the ScanResults store."""
+    for res in engine.scan_iter(logger.info):
+        if stream:
+            emit("result", **result_fields(res))
+    return engine.last_scan_results
+
+
+def scan_status(engine):
+    return EXIT_OK if engine.last_scan_summary.get('status', "complete") in ("complete", "live") else EXIT_INCOMPLETE
+
+
+def cmd_scan(engine, args):
+    run_scan(engine)
+    if engine.last_scan_stats is not None:
+        emit("stats", **engine.last_scan_stats.to_dict())
+    emit("summary", command="scan", **engine.last_scan_summary)
+    return scan_status(engine)
+
+
+def load_results(source):
+    """Reads 'result' lines written by `scan` from a file or stdin ('-')"""
+    handle = sys.stdin if source == "-" else open(source, "r", encoding="utf-8")
+    items = []
+    try:
+        for line_no, line in enumerate(handle, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                raise ValueError(f"{source}:{line_no}: not a JSON line")
+            if record.get('type') != "result":
+                continue
+            items.append({'path': Path(record['path']), 'size': int(record.get('size', 0)),
+                          'category': record.get('category')})
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+    return items
+
+
+def cmd_clean(engine, args):
+    if not args.yes and not args.dry_run:
+        logger.error("clean moves files to the Recycle Bin: pass --yes to confirm or --dry-run to preview")
+        return EXIT_USAGE
+
+    status = EXIT_OK
+    if args.source:
+        items = load_results(args.source)
+    else:
+        results = run_scan(engine, stream=False)
+        items = engine.unattended_items(results, include=args.include)
+        status = scan_status(engine)
+
+    if args.dry_run:
+        for item in items:
+            emit("result", path=str(item['path']), size=item['size'], category=item['category'])
+        emit("summary", command="clean", dry_run=True, requested=len(items),
+             bytes=sum(item['size'] for item in items))
+        return status
+
+    engine.clean(items, logger.info)
+    summary = dict(engine.last_clean_summary)
+    for path, reason in summary.pop('failures', []):
+        emit("failure", path=path, reason=reason)
+    emit("summary", command="clean", dry_run=False, **summary)
+    return EXIT_INCOMPLETE if summary.get('failed') else status
+
+
+def cmd_report(engine, args):
+    results = run_scan(engine, stream=False)
+    by_category = {}
+    for res in results:
+        entry = by_category.setdefault(res['category'], {'items': 0, 'bytes': 0})
+        entry['items'] += 1
+        entry['bytes'] += res['size']
+    largest = sorted(results, key=lambda r: r['size'], reverse=True)[:args.top]
+    total = results.total_bytes()
+    allocated = results.total_allocated()
+    emit("report",
+         items=len(results),
+         bytes=total,
+         allocated_bytes=allocated,
+         size=engine.format_bytes(total),
+         health_score=round(engine.calculate_health_score(allocated), 1),
+         categories=by_category,
+         largest=[result_fields(r) for r in largest],
+         scan=engine.last_scan_summary)
+    return scan_status(engine)
+
+
+def cmd_watch(engine, args):
+    live = engine.start_live_totals()
+    deadline = time.monotonic() + args.duration if args.duration else None
+    try:
+        while not live.wait_ready(0.5):
+            if deadline and time.monotonic() >= deadline:
+                return EXIT_INCOMPLETE
+        seen = None
+        while deadline is None or time.monotonic() < deadline:
+            if live.refreshes != seen:
+                seen = live.refreshes
+                totals = live.totals()
+                emit("totals",
+                     items=sum(count for count, _ in totals.values()),
+                     bytes=sum(size for _, size in totals.values()),
+                     targets={key: {'items': count, 'bytes': size} for key, (count, size) in totals.items()},
+                     polled=sorted(live.polled),
+                     refreshes=live.refreshes,
+                     overflows=live.overflows)
+            time.sleep(0.25)
+    finally:
+        engine.stop_live_totals()
+    return EXIT_OK
+
+
+def cmd_daemon(engine, args):
+    from scheduler import CleaningScheduler, ProcessPriority
+
+    if not args.yes:
+        logger.error("daemon moves files to the Recycle Bin unattended: pass --yes to confirm")
+        return EXIT_USAGE
+    try:
+        scheduler = CleaningScheduler(engine, schedule=args.schedule)
+    except ValueError as e:
+        logger.error(str(e))
+        return EXIT_USAGE
+    if engine.config.get("schedule_low_priority", True):
+        logger.info(f"Lowered priority: {', '.join(ProcessPriority().lower()) or 'not supported'}")
+    if args.now:
+        record = scheduler.run_when_idle()
+        emit("run", **record)
+        return EXIT_OK if record['status'] != "failed" else EXIT_ERROR
+    try:
+        scheduler.run_forever()
+    finally:
+        scheduler.stop()
+    return EXIT_OK
+
+
+def cmd_history(engine, args):
+    from scheduler import CleaningScheduler
+
+    for record in CleaningScheduler(engine).history.load()[-args.last:]:
+        emit("run", **record)
+    return EXIT_OK
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cleaner_cli", description="Headless Windows System Cleaner (NDJSON output)")
+    parser.add_argument("--config", help="Path to config.json (default: the desktop app's config)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log progress to stderr")
+    parser.add_argument("--trace", action="store_true",
+                        help="Write a Chrome/Perfetto trace of scan/clean workers (path reported as a 'trace' line)")
+    parser.add_argument("--io-dirs", dest="io_dir_reads_per_s", type=float, metavar="N",
+                        help="Cap directory listings per second (0 = unlimited)")
+    parser.add_argument("--io-stats", dest="io_stats_per_s", type=float, metavar="N",
+                        help="Cap stat calls per second (0 = unlimited)")
+    parser.add_argument("--io-bytes", dest="io_bytes_per_s", type=float, metavar="N",
+                        help="Cap bytes moved to the Recycle Bin per second (0 = unlimited)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def scan_options(p):
+        p.add_argument("--deadline", type=float, help="Stop the scan after this many seconds (partial results)")
+        p.add_argument("--workers", type=int, help="Walker threads (0 = auto)")
+        p.add_argument("--estimate", action="store_true", help="Estimate sizes of very large folders")
+
+    p = sub.add_parser("scan", help="Scan and stream one NDJSON line per result")
+    scan_options(p)
+    p.set_defaults(func=cmd_scan)
+
+    p = sub.add_parser("clean", help="Move scan results to the Recycle Bin")
+    scan_options(p)
+    p.add_argument("--from", dest="source", metavar="FILE", help="Clean results saved by `scan` ('-' = stdin) instead of rescanning")
+    p.add_argument("--yes", action="store_true", help="Confirm deletion")
+    p.add_argument("--dry-run", action="store_true", help="List what would be cleaned without touching it")
+    p.add_argument("--include", action="append", default=[], metavar="CATEGORY",
+                   help="Also clean a review-only category when rescanning (DUPLICATES, LARGE-FILES); repeatable")
+    p.set_defaults(func=cmd_clean)
+
+    p = sub.add_parser("report", help="Scan and print one JSON summary")
+    scan_options(p)
+    p.add_argument("--top", type=int, default=10, help="Number of largest items to include")
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser("watch", help="Keep junk totals current from filesystem notifications (NDJSON 'totals' lines)")
+    p.add_argument("--for", dest="duration", type=float, help="Stop after this many seconds (default: until Ctrl+C)")
+    p.set_defaults(func=cmd_watch)
+
+    p = sub.add_parser("daemon", help="Scan and clean unattended on a cron schedule (schedule_cron)")
+    p.add_argument("--schedule", metavar="CRON", help="Cron expression overriding schedule_cron, e.g. '0 3 * * *'")
+    p.add_argument("--now", action="store_true", help="Run once now (still waiting while the machine is busy) and exit")
+    p.add_argument("--yes", action="store_true", help="Confirm unattended deletion")
+    p.set_defaults(func=cmd_daemon)
+
+    p = sub.add_parser("history", help="Print past unattended runs (one 'run' line each)")
+    p.add_argument("--last", type=int, default=20, help="Number of runs to print")
+    p.set_defaults(func=cmd_history)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(levelname)s: %(message)s'
+    )
+    try:
+        engine = make_engine(args)
+        status = args.func(engine, args)
+        if engine.last_trace_path:
+            emit("trace", path=engine.last_trace_path)
+        return status
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+    except BrokenPipeError:
+        # Output consumer went away (e.g. piped into `head`)
+        sys.stdout = open(os.devnull, "w")
+        return EXIT_OK
+    except Exception as e:
+        logger.error(f"{args.command} failed: {e}")
+        return EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
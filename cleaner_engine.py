@@ -1,10 +1,22 @@
 import os
+import sys
+import math
 import ctypes
 import json
 import time
+import queue
 import logging
+import threading
 from pathlib import Path
-from send2trash import send2trash
+from size_index import SizeIndex
+from walker import TreeWalker, CancelToken, CHECK_EVERY
+from scan_results import ScanResults, PARTIAL, ESTIMATED
+from progress import as_progress
+from trace_events import TraceRecorder
+from io_governor import IOGovernor
+from target_registry import TargetRegistry
+from prune_rules import PruneRules
+from ecosystems import EcosystemDetector
 
 # Professional logging: Module-level logger (Configured by the entry point)
 logger = logging.getLogger(__name__)
@@ -18,7 +30,30 @@ class CleanerEngine:
         self.WHITELIST = ["Lenovo", "Microsoft", "Package Cache", "Temp", "Speech", "SGR"]
         
         self.is_admin = self.check_admin()
-        self.last_scan_results = [] # List of dicts: {'path': Path, 'size': int, 'category': str}
+        # Targets are data: built-ins plus `custom_targets` and targets.d/*.json plugins next to config.json
+        self.registry = TargetRegistry(config_manager, self.WHITELIST,
+                                       Path(config_manager.config_path).parent / "targets.d")
+        # Project types the Dev-Bloat Hunter recognises (built-ins plus `dev_bloat_ecosystems`)
+        self.detector = EcosystemDetector(self.config.get("dev_bloat_ecosystems", []))
+        self.last_scan_results = ScanResults() # Columnar store; rows read like {'path', 'size', 'category', ...}
+        self.last_scan_summary = {}
+        self.last_scan_stats = None  # ScanStats of the last scan (per category / search path)
+        self.last_trace_path = None  # Trace-event JSON of the last scan/clean when tracing is enabled
+        self.last_clean_summary = {}
+        self.active_scan_token = None
+        self.live_totals = None  # LiveTotals service while watch mode is on
+        self.governor = IOGovernor.from_config(config_manager)  # Shared I/O caps for walks and cleaning
+
+        # Persistent size index lives next to config.json
+        self.size_index = None
+        if self.config.get("size_index_enabled", True):
+            index_path = Path(config_manager.config_path).parent / "size_index.json"
+            self.size_index = SizeIndex(
+                index_path,
+                max_entries=self.config.get("size_index_max_entries", 500000),
+                max_idle_scans=self.config.get("size_index_max_idle_scans", 10),
+                max_age_s=self.config.get("size_index_max_age_hours", 24) * 3600
+            )
 
     # Config loading/saving moved to ConfigManager
 
@@ -29,28 +64,35 @@ class CleanerEngine:
         except Exception:
             return False
 
+    def _link_options(self):
+        """TreeWalker hardlink settings: dedupe_hardlinks, probed on Windows from dedupe_hardlinks_min_kb up"""
+        return {'dedupe_links': self.config.get("dedupe_hardlinks", True),
+                'link_probe_min': self.config.get("dedupe_hardlinks_min_kb", 1024) * 1024}
+
     def get_size(self, path: Path, timeout=5):
         """High-performance size calculation with a safety timeout"""
-        start_time = time.time()
         try:
-            if path.is_file():
-                return path.stat().st_size
-            total = 0
-            with os.scandir(path) as it:
-                for entry in it:
-                    if time.time() - start_time > timeout:
-                        return total
-                    try:
-                        if entry.is_file(follow_symlinks=False):
-                            total += entry.stat().st_size
-                        elif entry.is_dir(follow_symlinks=False):
-                            total += self.get_size(Path(entry.path), timeout - (time.time() - start_time))
-                    except (PermissionError, FileNotFoundError):
-                        continue
-            return total
+            walker = TreeWalker(self.size_index, timeout, workers=self.config.get("scan_workers", 0),
+                                governor=self.governor, **self._link_options())
+            walker.add_item(path, None)
+            return walker.run()[0]['size']
         except Exception:
             return 0
 
+    def _new_tracer(self):
+        """A TraceRecorder when `trace_enabled` is set, else None (tracing costs nothing when off)"""
+        if not self.config.get("trace_enabled"):
+            return None
+        return TraceRecorder(min_span_s=self.config.get("trace_min_ms", 50) / 1000)
+
+    def _save_trace(self, tracer, kind):
+        """Writes <config dir>/traces/<kind>-<timestamp>.json (open in ui.perfetto.dev or chrome://tracing)"""
+        name = f"{kind}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        path = tracer.save(str(Path(self.config_manager.config_path).parent / "traces" / name))
+        if path:
+            self.last_trace_path = path
+            logger.info(f"Trace written to {path}")
+
     def format_bytes(self, size):
         for unit in ['B', 'KB', 'MB', 'GB']:
             if size < 1024: return f"{size:.2f} {unit}"
@@ -58,51 +100,65 @@ class CleanerEngine:
         return f"{size:.2f} TB"
 
     def get_standard_targets(self):
-        user_appdata = os.environ.get('APPDATA')
-        user_local = os.environ.get('LOCALAPPDATA')
-        system_root = os.environ.get('SystemRoot', 'C:\\Windows')
-        
-        target_map = {
-            "TEMP": os.environ.get('TEMP'),
-            "SYSTEM_TEMP": os.path.join(system_root, 'Temp'),
-            "PREFETCH": os.path.join(system_root, 'Prefetch') if self.is_admin else None,
-            "DISCORD": os.path.join(user_appdata, "discord", "Cache") if user_appdata else None,
-            "SPOTIFY": os.path.join(user_local, "Spotify", "PersistentCache") if user_local else None
-        }
-
-        paths = []
-        for key in self.config.get("targets", []):
-            path_str = target_map.get(key)
-            if path_str:
-                p = Path(path_str)
-                if p.exists():
-                    paths.append((p, key))
-        return paths
+        """(root Path, category) for every enabled target that exists (see target_registry.py)"""
+        return [(root, spec.name) for spec, root in self.registry.active(self.is_admin)]
 
-    def find_bloat_recursive(self, current_path: Path, depth: int, max_depth: int, log_callback):
-        """Optimized recursive search with intelligent path skipping"""
+    def find_bloat_recursive(self, current_path: Path, depth: int, max_depth: int, log_callback, rules=None,
+                             detector=None):
+        """
+        Legacy two-phase search: returns bloat paths only, callers size them afterwards.
+        scan() uses the single-pass TreeWalker instead; this is kept for benchmarks and scripts.
+        `rules` (PruneRules, see prune_rules()) skips excluded directories as the walker does.
+        `detector` (EcosystemDetector) flags bloat next to project markers in stale projects, like the
+        walker; None keeps the old name-only check (node_modules/venv folders older than 30 days).
+        """
         if depth > max_depth:
             return []
         
-        # Folders to completely ignore to save time (Updated to allow traversing User/Documents/Desktop)
-        ignore_list = ["AppData", "Pictures", "Music", "Videos", 
-                       ".git", ".vscode", "node_modules", "venv", ".venv"]
+        # Folders to completely ignore to save time (shared with the walker, built once)
+        ignore_list = TreeWalker.HUNT_IGNORE
         
         found = []
+        self.governor.dir_read()
+        if rules is not None:
+            rules = rules.with_ignore_file(str(current_path))
         try:
             with os.scandir(current_path) as it:
-                for entry in it:
-                    if entry.is_dir(follow_symlinks=False):
-                        if entry.name in ignore_list:
-                            if entry.name in ["node_modules", "venv", ".venv"]:
-                                try:
-                                    if (time.time() - entry.stat().st_mtime) > (30 * 24 * 3600):
-                                        found.append(Path(entry.path))
-                                except Exception: pass
-                            continue
-                        
-                        if not entry.name.startswith("."):
-                            found.extend(self.find_bloat_recursive(Path(entry.path), depth + 1, max_depth, log_callback))
+                entries = list(it)
+            project = None
+            stale = False
+            if detector is not None:
+                files = [entry for entry in entries if not entry.is_dir(follow_symlinks=False)]
+                project = detector.detect([entry.name for entry in files])
+                if project is not None:
+                    mtimes = []
+                    for entry in files:
+                        if detector.is_source(entry.name):
+                            try:
+                                mtimes.append(entry.stat(follow_symlinks=False).st_mtime)
+                            except OSError:
+                                continue
+                    bloat_age = self.config.get("bloat_age_days", 30) * 24 * 3600
+                    stale = bool(mtimes) and time.time() - max(mtimes) > bloat_age
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if rules and rules.excluded(entry.path, entry.name):
+                        continue
+                    if project is not None and project.is_bloat(entry.name):
+                        if stale:
+                            found.append(Path(entry.path))
+                        continue
+                    if entry.name in ignore_list:
+                        if detector is None and entry.name in TreeWalker.BLOAT_NAMES:
+                            try:
+                                if (time.time() - entry.stat().st_mtime) > (30 * 24 * 3600):
+                                    found.append(Path(entry.path))
+                            except Exception: pass
+                        continue
+                    
+                    if not entry.name.startswith("."):
+                        found.extend(self.find_bloat_recursive(Path(entry.path), depth + 1, max_depth, log_callback,
+                                                               rules, detector))
         except (PermissionError, FileNotFoundError):
             pass
         except Exception as e:
@@ -110,79 +166,340 @@ class CleanerEngine:
             
         return found
 
-    def _scan_category(self, target, cat, grace_period, log_callback):
-        """Helper to scan a single category (Thread-safe execution)"""
-        results = []
-        local_total = 0
+    def _scan_category(self, target, cat, grace_period, log_callback, walker):
+        """
+        Queues every stale top-level item of a category on the shared walker.
+        Entries are filtered by the target's include/exclude globs and the whitelist in one match;
+        the target's min_age_hours, if set, replaces grace_period.
+        The listing stops early once the walker's cancel token trips (cancel or scan deadline).
+        """
         now = time.time()
+        spec = self.registry.get(cat)
+        index = self.registry.index_of(cat)
+        matches = self.registry.matcher.matches
+        if spec is not None and spec.min_age_hours is not None:
+            grace_period = spec.min_age_hours * 3600
+        stats = walker.stats.group(cat)
+        start = time.perf_counter()
+        queued = 0
+        stat_calls = stats.stat_calls
+        stopped = walker.cancel_token.stopped
+        if stopped():
+            return
         
         try:
             log_callback(f"Scanning: {cat}...")
-            for item in target.iterdir():
-                if item.name in self.WHITELIST:
-                    continue
-                    
-                try:
-                    if (now - item.stat().st_mtime) > grace_period:
-                        size = self.get_size(item)
-                        results.append({'path': item, 'size': size, 'category': cat})
-                        local_total += size
-                except (PermissionError, FileNotFoundError):
-                    continue
+            stats.throttled_s += self.governor.dir_read(stopped)
+            with os.scandir(target) as it:
+                stats.dirs += 1
+                for n, entry in enumerate(it):
+                    # A huge or slow target must not hold up cancel or the scan deadline
+                    if n % CHECK_EVERY == CHECK_EVERY - 1 and stopped():
+                        break
+                    stats.entries += 1
+                    if index is None:
+                        if self.registry.matcher.protected(entry.name):
+                            continue
+                    elif not matches(index, entry.name):
+                        continue
+                        
+                    try:
+                        stats.stat_calls += 1
+                        st = entry.stat(follow_symlinks=False)
+                        if (now - st.st_mtime) > grace_period:
+                            walker.add_item(entry.path, cat, st)
+                            queued += 1
+                    except PermissionError:
+                        stats.permission_errors += 1
+                    except FileNotFoundError:
+                        continue
+        except PermissionError as e:
+            stats.permission_errors += 1
+            logger.error(f"Failed to scan {cat}: {e}")
         except Exception as e:
             logger.error(f"Failed to scan {cat}: {e}")
-            
-        return results
+        stats.throttled_s += self.governor.stat(stats.stat_calls - stat_calls, stopped)
+        end = time.perf_counter()
+        stats.mark(start, end)
+        if walker.tracer is not None:
+            walker.tracer.complete(f"list {cat}", "category", start, end, args={'path': str(target), 'items': queued})
+
+    def prune_rules(self, search_path):
+        """
+        Compiled `prune_patterns` for one search path (relative patterns are anchored there),
+        or None when pruning is off. .cleanerignore files add to these during the walk.
+        """
+        if not self.config.get("prune_enabled", True):
+            return None
+        return PruneRules.from_patterns(self.config.get("prune_patterns", []), str(search_path))
+
+    def _scan_bloat(self, path_to_scan, max_depth, log_callback, walker, bloat=True):
+        """Queues a Dev-Bloat search; hits are sized in the same traversal (bloat=False: file sinks only)"""
+        log_callback(f"Hunting in: {path_to_scan.name}...")
+        walker.add_hunt(path_to_scan, max_depth, rules=self.prune_rules(path_to_scan), detector=self.detector,
+                        bloat_age=self.config.get("bloat_age_days", 30) * 24 * 3600, bloat=bloat)
+
+    def _new_large_file_finder(self, progress):
+        """Top-K LargeFileFinder fed by the search-path hunt, or None when LARGE-FILES is off"""
+        if not self.config.get("large_files_enabled"):
+            return None
+        from large_files import LargeFileFinder
+        return LargeFileFinder(k=self.config.get("large_files_count", 100),
+                               min_size=int(self.config.get("large_files_min_mb", 10) * 1024 * 1024),
+                               min_age_s=self.config.get("large_files_min_age_days", 0) * 24 * 3600,
+                               extensions=self.config.get("large_files_extensions", []),
+                               progress=progress, format_bytes=self.format_bytes)
+
+    def _new_duplicate_finder(self):
+        """DuplicateFinder fed by the search-path hunt, or None when the DUPLICATES category is off"""
+        if not self.config.get("duplicate_finder"):
+            return None
+        from duplicates import DuplicateFinder
+        return DuplicateFinder(min_size=int(self.config.get("duplicate_min_mb", 1) * 1024 * 1024),
+                               hash_workers=self.config.get("duplicate_hash_workers", 0))
+
+    def scan(self, log_callback, cancel_token=None, results=None):
+        """Blocking scan: returns the ScanResults store once the walk has finished"""
+        for _ in self.scan_iter(log_callback, cancel_token, results):
+            pass
+        return self.last_scan_results
+
+    def start_live_totals(self):
+        """Starts watch mode: results are kept current in the background (see live_totals.py)"""
+        if self.live_totals is None:
+            from live_totals import LiveTotals
+            self.live_totals = LiveTotals(self)
+            self.live_totals.start()
+        return self.live_totals
 
-    def scan(self, log_callback):
-        self.last_scan_results = []
-        total_size = 0
+    def stop_live_totals(self):
+        if self.live_totals is not None:
+            self.live_totals.stop()
+            self.live_totals = None
+
+    def set_io_limits(self, **limits):
+        """
+        Changes I/O caps at runtime (dir_reads_per_s, stats_per_s, bytes_per_s; 0 = unlimited).
+        Running scans and cleans pick them up at their next directory / batch; config.json is updated in memory.
+        """
+        self.governor.configure(**limits)
+        for name, rate in limits.items():
+            self.config[f"io_{name}"] = rate
+
+    def cancel_scan(self):
+        """Asks the running scan to stop; it returns the partial results gathered so far"""
+        if self.active_scan_token:
+            self.active_scan_token.cancel()
+
+    def scan_iter(self, log_callback, cancel_token=None, results=None):
+        """
+        Streaming scan: yields each result (a ResultRecord row of last_scan_results)
+        as soon as its size is final.
+        The walk runs on background threads; last_scan_results and last_scan_summary
+        are complete once the generator is exhausted.
+        Stopping (cancel_scan, the scan_deadline_seconds budget, or closing the generator)
+        drains the walk quickly; unfinished items are reported with 'partial': True.
+        Pass an empty ScanResults as `results` to share the store with the caller (e.g. the UI list).
+        Per-category / per-search-path instrumentation ends up in last_scan_stats (a ScanStats).
+        `log_callback` may be a plain callable or a ProgressBus; the bus also receives one
+        'scan' tick per result (item count, bytes, current name).
+        While watch mode is running and seeded, the results come from the maintained
+        live totals instead of a new walk (summary status 'live'), unless DUPLICATES or
+        LARGE-FILES are enabled: live totals do not track those, so the scan walks as usual.
+        """
+        progress = as_progress(log_callback)
+        if self.live_totals is not None and self.live_totals.ready:
+            if not (self.config.get("duplicate_finder") or self.config.get("large_files_enabled")):
+                yield from self._live_scan_iter(progress, results)
+                return
+            progress("Watch mode keeps junk totals only: walking for duplicates and large files...")
+        if cancel_token is None:
+            cancel_token = CancelToken(self.config.get("scan_deadline_seconds", 0))
+        self.active_scan_token = cancel_token
+        results = self.last_scan_results = results if results is not None else ScanResults()
+        if self.size_index:
+            self.size_index.begin_scan()
         grace_period = self.config.get("grace_period_hours", 24) * 3600
+        start = time.perf_counter()
+        first_result = None
         
-        import concurrent.futures
+        # One work-stealing walker for everything: every directory is a task any idle worker can take,
+        # so a single huge TEMP subfolder no longer serialises its whole category
+        results_queue = queue.Queue()
+        estimate_samples = self.config.get("estimate_samples", 16) if self.config.get("size_mode") == "estimate" else 0
+        tracer = self._new_tracer()
+        walker = TreeWalker(self.size_index, workers=self.config.get("scan_workers", 0),
+                            on_item=results_queue.put, cancel_token=cancel_token,
+                            estimate_samples=estimate_samples, tracer=tracer, governor=self.governor,
+                            **self._link_options())
+
+        # 1. Queue Standard Targets
+        for target, cat in self.get_standard_targets():
+            self._scan_category(target, cat, grace_period, progress, walker)
         
-        # Use a ThreadPool to scan multiple targets at once
-        # Max workers = 4 is usually a sweet spot for disk I/O on typical SSDs
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            stop_event = False # In case we want to add stop logic later
-            futures = []
-            
-            # 1. Submit Standard Targets
-            for target, cat in self.get_standard_targets():
-                futures.append(executor.submit(self._scan_category, target, cat, grace_period, log_callback))
-            
-            # 2. Submit Dev-Bloat (Recursive)
-            if self.config.get("dev_bloat_hunter"):
-                max_depth = self.config.get("max_scan_depth", 3)
-                for path_str in self.config.get("search_paths", []):
-                    p = Path(path_str)
-                    if p.exists():
-                        # We wrap the recursive search in a lambda or helper to fit the executor signature if needed
-                        # But here we can just define a wrapper task
-                        def _scan_bloat(path_to_scan):
-                             log_callback(f"Hunting in: {path_to_scan.name}...")
-                             found = []
-                             bloat_items = self.find_bloat_recursive(path_to_scan, 1, max_depth, log_callback)
-                             for bloat_path in bloat_items:
-                                 size = self.get_size(bloat_path)
-                                 found.append({'path': bloat_path, 'size': size, 'category': 'DEV-BLOAT'})
-                             return found
-                        
-                        futures.append(executor.submit(_scan_bloat, p))
-            
-            # 3. Collect Results
-            for future in concurrent.futures.as_completed(futures):
+        # 2. Queue Dev-Bloat (single pass); duplicate and large-file candidates come from the same listings
+        bloat = self.config.get("dev_bloat_hunter")
+        duplicates = self._new_duplicate_finder()
+        large_files = self._new_large_file_finder(progress)
+        for finder in (duplicates, large_files):
+            if finder is not None:
+                walker.file_sinks.append(finder.add)
+        if bloat or walker.file_sinks:
+            max_depth = self.config.get("max_scan_depth", 3)
+            for path_str in self.config.get("search_paths", []):
+                p = Path(path_str)
+                if p.exists():
+                    self._scan_bloat(p, max_depth, progress, walker, bloat=bool(bloat))
+        
+        # 3. Walk in the background, yield results as they complete
+        finished = False
+        try:
+            for res in self._stream_walk(walker, results_queue):
+                if first_result is None:
+                    first_result = time.perf_counter() - start
+                progress.publish("scan", res['path'].name, 1, res['size'])
+                yield results.append_result(res)
+            # 4. Hash duplicate candidates once every file has been seen, then report the top-K large files
+            # (a file that is already listed as a duplicate is not listed twice)
+            reported = set()
+            if duplicates is not None and not cancel_token.stopped():
                 try:
-                    res = future.result()
-                    self.last_scan_results.extend(res)
+                    found = duplicates.find(cancel_token, progress)
                 except Exception as e:
-                    logger.error(f"Scan thread failed: {e}")
-        
-        return self.last_scan_results
+                    # The walk's results and the summary below must not be lost to the hashing stage
+                    logger.error(f"Duplicate search failed: {e}")
+                    progress(f"Duplicate search failed: {e}")
+                    found = []
+                for res in found:
+                    reported.add(str(res['path']))
+                    if first_result is None:
+                        first_result = time.perf_counter() - start
+                    progress.publish("scan", res['path'].name, 1, res['size'])
+                    yield results.append_result(res)
+            if large_files is not None:
+                for res in large_files.results(exclude=reported):
+                    if first_result is None:
+                        first_result = time.perf_counter() - start
+                    progress.publish("scan", res['path'].name, 1, res['size'])
+                    yield results.append_result(res)
+            finished = True
+        finally:
+            if not finished:
+                # Consumer stopped iterating: let the workers drain instead of walking on
+                cancel_token.cancel()
+            self.active_scan_token = None
+
+        totals = walker.stats.totals()
+        self.last_scan_summary = {
+            'items': len(results),
+            'bytes': results.total_bytes(),
+            'allocated_bytes': results.total_allocated(),
+            'workers': walker.workers,
+            'elapsed_s': time.perf_counter() - start,
+            'first_result_s': first_result,
+            'status': cancel_token.reason or "complete",
+            'partial_items': results.count_flag(PARTIAL),
+            'estimated_items': results.count_flag(ESTIMATED),
+            'skipped_searches': walker.skipped_hunts,
+            'worker_utilisation': round(walker.stats.utilisation, 3),
+            'throttled_s': round(totals.throttled_s, 3),
+            'hardlinks_skipped': totals.links,
+            'revisited_dirs': totals.revisits
+        }
+        if duplicates is not None:
+            self.last_scan_summary['duplicate_groups'] = len(duplicates.groups)
+        self.last_scan_stats = walker.stats
+        logger.info(f"Scan stats:\n{walker.stats.format_table()}")
+        if tracer is not None:
+            # One span per category / search path, from its first to its last unit of work
+            for group in walker.stats.groups.values():
+                if group.first_start is not None:
+                    tracer.async_span(group.name, group.kind, group.first_start, group.last_end,
+                                      f"{group.kind}:{group.name}", group.to_dict())
+            self._save_trace(tracer, "scan")
+        if self.size_index:
+            self.size_index.save()
+            self.last_scan_summary['index_hits'] = self.size_index.hits
+            self.last_scan_summary['index_misses'] = self.size_index.misses
+            logger.info(f"Size index: {self.size_index.hits} hits / {self.size_index.misses} misses")
+        if cancel_token.reason:
+            logger.info(f"Scan stopped ({cancel_token.reason}): "
+                        f"{self.last_scan_summary['partial_items']} partial items")
+        logger.info(f"Scan finished in {self.last_scan_summary['elapsed_s']:.2f}s "
+                    f"(first result after {first_result or 0:.2f}s)")
+
+    def _live_scan_iter(self, progress, results):
+        """scan_iter answered from the LiveTotals state: no disk access"""
+        start = time.perf_counter()
+        live = self.live_totals
+        results = self.last_scan_results = results if results is not None else ScanResults()
+        for res in live.results():
+            progress.publish("scan", res['path'].name, 1, res['size'])
+            yield results.append_result(res)
+        self.last_scan_summary = {
+            'items': len(results),
+            'bytes': results.total_bytes(),
+            'allocated_bytes': results.total_allocated(),
+            'elapsed_s': time.perf_counter() - start,
+            'first_result_s': 0.0,
+            'status': "live",
+            'partial_items': results.count_flag(PARTIAL),
+            'estimated_items': results.count_flag(ESTIMATED),
+            'skipped_searches': 0,
+            'live_updated': live.updated,
+            'live_refreshes': live.refreshes,
+            'live_polled': sorted(live.polled)
+        }
+        self.last_scan_stats = None
+        logger.info(f"Scan answered from live totals ({len(results)} items, {live.refreshes} refreshes)")
+
+    def _stream_walk(self, walker, results_queue):
+        """Runs walker on a background thread and yields what it puts on results_queue"""
+        done = object()
+        def _run():
+            try:
+                walker.run()
+            except Exception as e:
+                logger.error(f"Scan walker failed: {e}")
+            finally:
+                results_queue.put(done)
+
+        threading.Thread(target=_run, daemon=True).start()
+        while True:
+            res = results_queue.get()
+            if res is done:
+                return
+            yield res
+
+    def refine_estimates(self, results, cancel_token=None):
+        """
+        Exact background refinement for estimate mode: walks every estimated result in full
+        and yields (result, exact_result) pairs. The caller decides how to apply them.
+        """
+        estimated = {str(r['path']): r for r in results if r.get('estimated')}
+        if not estimated:
+            return
+        cancel_token = cancel_token or CancelToken()
+        results_queue = queue.Queue()
+        walker = TreeWalker(self.size_index, timeout=math.inf, workers=self.config.get("scan_workers", 0),
+                            on_item=results_queue.put, cancel_token=cancel_token, governor=self.governor,
+                            **self._link_options())
+        for path_str, res in estimated.items():
+            walker.add_item(path_str, res['category'])
+
+        finished = False
+        try:
+            for exact in self._stream_walk(walker, results_queue):
+                yield estimated[str(exact['path'])], exact
+            finished = True
+        finally:
+            if not finished:
+                cancel_token.cancel()
 
     def calculate_health_score(self, total_bytes):
         """
         Calculates health percentage based on total junk size.
+        Pass allocated bytes (ScanResults.total_allocated()): what cleaning would actually free.
         Threshold: 1GB = 100% full (Needs cleaning)
         Uses logarithmic scaling so small amounts don't look scary.
         """
@@ -198,45 +515,171 @@ class CleanerEngine:
         score = (math.log(total_bytes) / math.log(max_junk)) * 100
         return min(100, max(0, score))
 
+    def unattended_items(self, results, include=()):
+        """
+        Clean items for a scan cleaned without a per-row choice (scheduler, CLI rescan). Rows of
+        ScanResults.REVIEW_CATEGORIES are left out unless named in `include` or in clean_review_categories.
+        """
+        skip = results.REVIEW_CATEGORIES - set(include) - set(self.config.get("clean_review_categories", []))
+        return [{'path': r['path'], 'size': r['size'], 'category': r['category']}
+                for r in results if r['category'] not in skip]
+
     def clean(self, items_to_delete, log_callback):
-        """Resilient Deletion: Send2Trash -> Direct Delete -> Log Failure"""
-        files_deleted = 0
-        size_cleared = 0
-        
-        # Whitelist of folders that should NEVER be touched (usually causes loops or errors)
+        """
+        Resilient Deletion: batched Send2Trash (parallel lanes) -> per-item retry -> Log Failure.
+        Returns (files_deleted, size_cleared); per-item outcomes and throughput are in last_clean_summary.
+        `log_callback` may be a plain callable or a ProgressBus; the bus gets a 'clean' tick per batch.
+        Each batch is paced by the I/O governor (one stat per item, the items' bytes moved).
+        """
+        import concurrent.futures
 
+        progress = as_progress(log_callback)
+        progress.publish("clean", total=len(items_to_delete))
+        tracer = self._new_tracer()
+        start = time.perf_counter()
+        throttled_before = self.governor.total_throttled()
+        batch_size = max(1, self.config.get("clean_batch_size", 64))
+        workers = max(1, self.config.get("clean_workers", 4))
         
+        skipped = 0
+        wanted = []
         for item in items_to_delete:
-            item_path = item['path']
-            size = item['size']
-            
-            if item_path.name in self.WHITELIST:
-                logger.debug(f"Skipping whitelisted item: {item_path}")
+            if self.registry.matcher.protected(item['path'].name):
+                logger.debug(f"Skipping whitelisted item: {item['path']}")
+                skipped += 1
                 continue
+            wanted.append(item)
+        lanes = self._clean_lanes(wanted, workers)
 
-            try:
-                log_callback(f"Cleaning: {item_path.name}")
-                # Try professional trashing first
+        outcomes = []  # (item, ok, reason)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._trash_lane, lane, batch_size, progress, tracer, 100 + i)
+                       for i, lane in enumerate(lanes) if lane]
+            for future in concurrent.futures.as_completed(futures):
                 try:
-                    send2trash(str(item_path))
-                except Exception:
-                    logger.error(f"Send2Trash failed for {item_path}. Skipping permanent delete for safety.")
-                    log_callback(f"Error: Recycle Bin unavailable for {item_path.name}")
-                    continue
-                
+                    outcomes.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Clean lane failed: {e}")
+
+        if self.live_totals is not None:
+            # Trashed (or already missing) items must leave the live totals before the next Analyze
+            self.live_totals.invalidate(item['path'] for item, ok, _ in outcomes if ok is not False)
+
+        files_deleted = 0
+        size_cleared = 0
+        failures = []
+        for item, ok, reason in outcomes:
+            if ok:
                 files_deleted += 1
-                size_cleared += size
-            except PermissionError:
-                log_callback(f"Skipped: {item_path.name} (In Use)")
-            except Exception as e:
-                logger.error(f"Permanent failure for {item_path}: {e}")
-                log_callback(f"Error: {item_path.name}")
+                size_cleared += item['size']
+            elif ok is None:
+                skipped += 1  # Already gone: nothing was freed
+            else:
+                failures.append((str(item['path']), reason))
+
+        elapsed = time.perf_counter() - start
+        self.last_clean_summary = {
+            'requested': len(items_to_delete),
+            'deleted': files_deleted,
+            'failed': len(failures),
+            'skipped': skipped,
+            'bytes': size_cleared,
+            'elapsed_s': elapsed,
+            'items_per_s': files_deleted / elapsed if elapsed > 0 else 0.0,
+            'mb_per_s': size_cleared / (1024 * 1024) / elapsed if elapsed > 0 else 0.0,
+            'throttled_s': round(self.governor.total_throttled() - throttled_before, 3),
+            'failures': failures
+        }
+        logger.info(f"Cleaned {files_deleted} items ({self.format_bytes(size_cleared)}) in {elapsed:.2f}s: "
+                    f"{self.last_clean_summary['items_per_s']:.1f} items/s, "
+                    f"{self.last_clean_summary['mb_per_s']:.1f} MB/s, {len(failures)} failed")
+        if tracer is not None:
+            tracer.complete("clean", "clean", start, start + elapsed, args={'deleted': files_deleted, 'failed': len(failures)})
+            self._save_trace(tracer, "clean")
         
         if self.config.get("empty_recycle_bin"):
-            log_callback("Finalizing: Emptying Recycle Bin...")
+            progress("Finalizing: Emptying Recycle Bin...")
             try:
                 ctypes.windll.shell32.SHEmptyRecycleBinW(None, None, 7)
             except Exception as e:
                 logger.error(f"Recycle bin failure: {e}")
 
         return files_deleted, size_cleared
+
+    @staticmethod
+    def _clean_lanes(items, workers):
+        """
+        Splits items over the clean lanes. The Windows Recycle Bin and the macOS Trash name their
+        entries themselves, so items are dealt round-robin. The freedesktop trash picks destination
+        names with a racy exists() check, so there items with the same name (every node_modules,
+        __pycache__, ...) stay on one lane; each name group goes to the least loaded lane.
+        """
+        lanes = [[] for _ in range(workers)]
+        if os.name == "nt" or sys.platform == "darwin":
+            for i, item in enumerate(items):
+                lanes[i % workers].append(item)
+            return lanes
+        by_name = {}
+        for item in items:
+            by_name.setdefault(item['path'].name, []).append(item)
+        for group in sorted(by_name.values(), key=len, reverse=True):
+            min(lanes, key=len).extend(group)
+        return lanes
+
+    def _trash_lane(self, lane, batch_size, progress, tracer=None, tid=None):
+        """
+        Trashes one lane batch by batch; returns (item, ok, reason) for every item, ok=None for
+        items that were already gone before their batch (reported as skipped, not as freed).
+        """
+        from send2trash import send2trash  # Deferred: only needed when cleaning
+
+        if tracer is not None:
+            tracer.name_thread(tid, f"clean-lane-{tid - 100}")
+        outcomes = []
+        for i in range(0, len(lane), batch_size):
+            batch = lane[i:i + batch_size]
+            done = len(outcomes)
+            self.governor.stat(len(batch))
+            start = time.perf_counter()
+            present = []
+            for item in batch:
+                if os.path.lexists(item['path']):
+                    present.append(item)
+                else:
+                    outcomes.append((item, None, "missing"))
+            if present:
+                self.governor.moved(sum(item['size'] for item in present))
+                try:
+                    send2trash([str(item['path']) for item in present])
+                    outcomes.extend((item, True, None) for item in present)
+                except Exception as e:
+                    # Part of the batch may already be in the trash: retry the rest one by one
+                    logger.debug(f"Batch trash failed ({e}); retrying items individually")
+                    for item in present:
+                        outcomes.append(self._trash_one(item, progress))
+            freed = sum(item['size'] for item, ok, _ in outcomes[done:] if ok)
+            progress.publish("clean", batch[-1]['path'].name, len(batch), freed)
+            if tracer is not None:
+                failed = sum(1 for _, ok, _ in outcomes[done:] if ok is False)
+                tracer.complete(f"batch {i // batch_size}", "clean", start, time.perf_counter(), tid,
+                                {'items': len(batch), 'bytes': freed, 'failed': failed})
+        return outcomes
+
+    def _trash_one(self, item, log_callback):
+        from send2trash import send2trash
+
+        item_path = item['path']
+        if not os.path.lexists(item_path):
+            # Only called after a failed batch, whose items all existed: this one went with it
+            return item, True, None
+        try:
+            send2trash(str(item_path))
+            return item, True, None
+        except PermissionError:
+            log_callback(f"Skipped: {item_path.name} (In Use)")
+            return item, False, "in use"
+        except Exception as e:
+            # No permanent-delete fallback, for safety
+            logger.error(f"Send2Trash failed for {item_path}: {e}")
+            log_callback(f"Error: Recycle Bin unavailable for {item_path.name}")
+            return item, False, str(e)
@@ -15,7 +15,53 @@ class ConfigManager:
             "targets": ["TEMP", "SYSTEM_TEMP", "PREFETCH", "DISCORD", "SPOTIFY"],
             "dev_bloat_hunter": False,
             "search_paths": [str(Path.home())],
-            "max_scan_depth": 3
+            "max_scan_depth": 3,
+            "scan_workers": 0,
+            "scan_deadline_seconds": 0,
+            "size_mode": "exact",
+            "estimate_samples": 16,
+            "refine_estimates": True,
+            "clean_batch_size": 64,
+            "clean_workers": 4,
+            "size_index_enabled": True,
+            "size_index_max_entries": 500000,
+            "size_index_max_idle_scans": 10,
+            "size_index_max_age_hours": 24,
+            "scan_diagnostics": False,
+            "trace_enabled": False,
+            "trace_min_ms": 50,
+            "watch_mode": False,
+            "watch_debounce_ms": 500,
+            "watch_rescan_minutes": 60,
+            "watch_poll_seconds": 30,
+            "watch_max_dirs": 20000,
+            "schedule_cron": "0 3 * * *",
+            "schedule_max_load": 0.5,
+            "schedule_busy_retry_minutes": 10,
+            "schedule_max_defer_minutes": 120,
+            "schedule_low_priority": True,
+            "schedule_history_max": 200,
+            "io_dir_reads_per_s": 0,
+            "io_stats_per_s": 0,
+            "io_bytes_per_s": 0,
+            "io_burst_seconds": 0.5,
+            "custom_targets": [],
+            "whitelist": [],
+            "prune_enabled": True,
+            "prune_patterns": [],
+            "bloat_age_days": 30,
+            "dev_bloat_ecosystems": [],
+            "duplicate_finder": False,
+            "duplicate_min_mb": 1,
+            "duplicate_hash_workers": 0,
+            "clean_review_categories": [],
+            "large_files_enabled": False,
+            "large_files_count": 100,
+            "large_files_min_mb": 10,
+            "large_files_min_age_days": 0,
+            "large_files_extensions": [],
+            "dedupe_hardlinks": True,
+            "dedupe_hardlinks_min_kb": 1024
         }
         
         if self.config_path.exists():
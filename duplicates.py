@@ -0,0 +1,230 @@
+import os
+import mmap
+import stat
+import hashlib
+import logging
+import threading
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from walker import allocated_bytes
+
+logger = logging.getLogger(__name__)
+
+EDGE_BYTES = 4096          # Stage 2 hashes this much from the start and from the end of a file
+FULL_HASH_SLICE = 1 << 20  # Stage 3 feeds the hash 1 MB views of the mapping at a time
+
+
+def _edge_hash(path, size):
+    """Hash of the first and last EDGE_BYTES (the whole file when it is that small)."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        h.update(f.read(EDGE_BYTES))
+        if size > 2 * EDGE_BYTES:
+            f.seek(size - EDGE_BYTES)
+        h.update(f.read(EDGE_BYTES))
+    return h.digest()
+
+
+def _full_hash(path):
+    """
+    Whole-file hash through a read-only memory map: pages are streamed, never held. Only run in
+    pool processes: a file truncated while mapped raises SIGBUS, which kills the whole process.
+    """
+    h = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return h.digest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                for offset in range(0, len(mm), FULL_HASH_SLICE):
+                    h.update(view[offset:offset + FULL_HASH_SLICE])
+            finally:
+                view.release()
+    return h.digest()
+
+
+def _read_hash(path):
+    """Whole-file hash by plain reads, for threads: a file that shrinks meanwhile just ends early."""
+    h = hashlib.blake2b(digest_size=32)
+    buf = bytearray(FULL_HASH_SLICE)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.digest()
+
+
+def _full_hash_job(path):
+    """Process-pool entry point: (path, digest or None if unreadable)."""
+    try:
+        return path, _full_hash(path)
+    except (OSError, ValueError):
+        return path, None
+
+
+def _read_hash_job(path):
+    """Thread-pool entry point: (path, digest or None if unreadable)."""
+    try:
+        return path, _read_hash(path)
+    except (OSError, ValueError):
+        return path, None
+
+
+class DuplicateFinder:
+    """
+    DUPLICATES category: a staged pipeline over the files a Dev-Bloat hunt lists.
+
+      1. add() (a walker file sink) buckets regular files >= min_size by size; hardlinks of one
+         inode count once, and a multiply-linked file is only ever a keeper, since deleting one of
+         its links frees nothing. Where the listing has no inode numbers (Windows), only files
+         sharing a size are stat()ed in full to get them
+      2. files sharing a size are told apart by a hash of their first and last few KB (threads)
+      3. what still collides is hashed in full: through mmap on a process pool for large jobs,
+         by plain reads on threads for small ones or if a pool worker dies
+
+    Only paths and stat fields are kept, never file contents. Each group of identical files keeps
+    its oldest copy (the keeper); the others become result dicts.
+    """
+    CATEGORY = "DUPLICATES"
+
+    def __init__(self, min_size=1024 * 1024, hash_workers=0, process_threshold=64 * 1024 * 1024):
+        self.min_size = min_size
+        self.hash_workers = hash_workers or min(8, os.cpu_count() or 1)
+        self.process_threshold = process_threshold  # Less full-hash work than this is done in threads
+        self.by_size = {}   # size -> {(st_dev, st_ino) or path: (path, mtime, st_nlink, allocated)}
+        self.files_seen = 0
+        self.groups = []    # [(keeper path, [duplicate paths], size)] after find()
+        self._lock = threading.Lock()
+
+    def add(self, path, st):
+        if st.st_size < self.min_size or not stat.S_ISREG(st.st_mode):
+            return
+        with self._lock:
+            self.files_seen += 1
+            # DirEntry.stat() leaves st_ino/st_nlink at 0 on Windows: keyed by path until find()
+            key = (st.st_dev, st.st_ino) if st.st_ino else path
+            self.by_size.setdefault(st.st_size, {}).setdefault(
+                key, (path, st.st_mtime, st.st_nlink, allocated_bytes(st)))
+
+    @staticmethod
+    def _resolve_links(files):
+        """
+        Re-keys path-keyed entries by their real (st_dev, st_ino) with a full stat(), so hardlinks
+        collapse into one entry and st_nlink is known. Only run on size collisions.
+        """
+        resolved = {}
+        for key, f in files.items():
+            if isinstance(key, str):
+                try:
+                    st = os.stat(f[0], follow_symlinks=False)
+                except OSError:
+                    continue
+                if st.st_ino:
+                    key = (st.st_dev, st.st_ino)
+                    f = (f[0], f[1], st.st_nlink, f[3])
+            resolved.setdefault(key, f)
+        return list(resolved.values())
+
+    def find(self, cancel_token=None, progress=None):
+        """Runs stages 2 and 3; returns DUPLICATES result dicts (keepers excluded)."""
+        stopped = cancel_token.stopped if cancel_token is not None else (lambda: False)
+        candidates = []
+        for size, files in self.by_size.items():
+            if len(files) > 1:
+                files = self._resolve_links(files)
+                if len(files) > 1:
+                    candidates.append((size, files))
+        self.by_size = {}
+        if progress:
+            progress(f"Comparing {sum(len(f) for _, f in candidates)} possible duplicates...")
+
+        # Stage 2: first/last KB
+        groups = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.hash_workers) as pool:
+            for size, files in candidates:
+                if stopped():
+                    return []
+                digests = pool.map(lambda f, size=size: self._try(_edge_hash, f[0], size), files)
+                buckets = {}
+                for f, digest in zip(files, digests):
+                    if digest is not None:
+                        buckets.setdefault(digest, []).append(f)
+                for same in buckets.values():
+                    if len(same) > 1:
+                        groups.append((size, same))
+
+        # Stage 3: full hash, only where the edges could not decide
+        need_full = [(size, files) for size, files in groups if size > 2 * EDGE_BYTES]
+        confirmed = [(size, files) for size, files in groups if size <= 2 * EDGE_BYTES]
+        paths = [f[0] for _, files in need_full for f in files]
+        full_bytes = sum(size * len(files) for size, files in need_full)
+        if paths:
+            if progress:
+                progress(f"Hashing {len(paths)} files ({full_bytes // (1024 * 1024)} MB)...")
+            digests = self._hash_all(paths, full_bytes, stopped)
+            if digests is None:
+                return []
+            for size, files in need_full:
+                buckets = {}
+                for f in files:
+                    digest = digests.get(f[0])
+                    if digest is not None:
+                        buckets.setdefault(digest, []).append(f)
+                confirmed.extend((size, same) for same in buckets.values() if len(same) > 1)
+
+        results = []
+        self.groups = []
+        for size, files in confirmed:
+            # Keep a hardlinked copy if any, else the oldest, then the one with the shortest path
+            files.sort(key=lambda f: (f[2] <= 1, f[1], len(f[0]), f[0]))
+            keeper, dups = files[0][0], [f for f in files[1:] if f[2] <= 1]
+            if not dups:
+                continue
+            self.groups.append((keeper, [f[0] for f in dups], size))
+            results.extend({'path': Path(f[0]), 'size': size, 'allocated': f[3], 'category': self.CATEGORY}
+                           for f in dups)
+        logger.info(f"Duplicates: {len(self.groups)} groups, {len(results)} redundant copies "
+                    f"from {self.files_seen} files >= {self.min_size} bytes")
+        return results
+
+    def _hash_all(self, paths, total_bytes, stopped):
+        """
+        {path: digest, None if unreadable}; None if stopped. A process pool for large jobs, threads
+        (hashlib releases the GIL) for small ones. If a pool worker dies (e.g. SIGBUS on a file
+        truncated while mapped), the files it had not answered for are hashed on threads instead.
+        """
+        digests = {}
+        if total_bytes >= self.process_threshold and len(paths) > 1:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.hash_workers)
+            try:
+                for path, digest in executor.map(_full_hash_job, paths, chunksize=8):
+                    if stopped():
+                        return None
+                    digests[path] = digest
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Hash pool failed ({e!r}); hashing the remaining files on threads")
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+            paths = [p for p in paths if p not in digests]
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.hash_workers)
+        try:
+            for path, digest in executor.map(_read_hash_job, paths):
+                if stopped():
+                    return None
+                digests[path] = digest
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return digests
+
+    @staticmethod
+    def _try(func, *args):
+        try:
+            return func(*args)
+        except OSError:
+            return None
+
@@ -0,0 +1,108 @@
+import re
+import fnmatch
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Ecosystem:
+    """
+    A project type the Dev-Bloat Hunter understands:
+      markers  file names (globs allowed) that identify a project directory
+      bloat    regenerable folder names that are only flagged next to a marker
+      sources  file names (globs allowed) whose newest mtime says when the project was last worked on;
+               markers always count as sources
+    """
+    __slots__ = ('name', 'markers', 'bloat', 'sources')
+
+    def __init__(self, name, markers, bloat, sources=()):
+        self.name = name
+        self.markers = list(markers)
+        self.bloat = frozenset(bloat)
+        self.sources = list(sources)
+
+    @classmethod
+    def from_dict(cls, data):
+        if not data.get('name') or not data.get('markers') or not data.get('bloat'):
+            raise ValueError("an ecosystem needs 'name', 'markers' and 'bloat'")
+        return cls(data['name'], data['markers'], data['bloat'], data.get('sources', []))
+
+
+BUILTIN_ECOSYSTEMS = [
+    Ecosystem("node", ["package.json"],
+              ["node_modules", ".next", ".nuxt", ".svelte-kit", ".parcel-cache", ".turbo", ".angular", "dist"],
+              ["package-lock.json", "yarn.lock", "pnpm-lock.yaml", "bun.lockb", "*.js", "*.ts", "*.mjs"]),
+    Ecosystem("python", ["pyproject.toml", "setup.py", "setup.cfg", "requirements*.txt", "Pipfile", "tox.ini"],
+              ["venv", ".venv", ".tox", ".nox", "__pycache__", ".pytest_cache", ".mypy_cache", ".ruff_cache",
+               "build", "dist", "*.egg-info"],
+              ["poetry.lock", "Pipfile.lock", "uv.lock", "pdm.lock", "*.py"]),
+    Ecosystem("rust", ["Cargo.toml"], ["target"], ["Cargo.lock"]),
+    Ecosystem("gradle", ["build.gradle", "build.gradle.kts", "settings.gradle", "settings.gradle.kts"],
+              ["build", ".gradle"], ["gradle.properties", "gradle.lockfile"]),
+    Ecosystem("maven", ["pom.xml"], ["target"]),
+    Ecosystem("dotnet", ["*.csproj", "*.fsproj", "*.vbproj", "*.sln"], ["bin", "obj"], ["packages.lock.json", "*.cs"]),
+    Ecosystem("go", ["go.mod"], ["vendor"], ["go.sum", "*.go"]),
+    Ecosystem("dart", ["pubspec.yaml"], [".dart_tool", "build"], ["pubspec.lock"]),
+]
+
+
+class ProjectInfo:
+    """What one directory listing revealed: the ecosystems present and their bloat matcher."""
+    __slots__ = ('ecosystems', '_bloat')
+
+    def __init__(self, ecosystems, bloat_regex):
+        self.ecosystems = ecosystems
+        self._bloat = bloat_regex
+
+    def is_bloat(self, name):
+        return self._bloat.fullmatch(name) is not None
+
+
+class EcosystemDetector:
+    """
+    Classifies a directory from the file names of its listing. The markers and the sources of
+    all ecosystems are each compiled into one regex (a named group per ecosystem), so a file name
+    is matched once, not once per ecosystem; bloat names are compiled per combination found.
+    """
+    def __init__(self, extra=()):
+        ecosystems = {eco.name: eco for eco in BUILTIN_ECOSYSTEMS}
+        for entry in extra:
+            try:
+                eco = Ecosystem.from_dict(entry)
+                ecosystems[eco.name] = eco
+            except (ValueError, AttributeError, TypeError) as e:
+                logger.error(f"Ignoring dev-bloat ecosystem {entry!r}: {e}")
+        self.ecosystems = list(ecosystems.values())
+        self._marker = self._compile({i: eco.markers for i, eco in enumerate(self.ecosystems)})
+        self._source = self._compile({i: eco.markers + eco.sources for i, eco in enumerate(self.ecosystems)})
+        self._bloat_cache = {}
+
+    @staticmethod
+    def _compile(globs_by_index):
+        # One named alternative per ecosystem; a name that is a marker of two ecosystems counts for the first
+        parts = [f"(?P<e{i}>{'|'.join(fnmatch.translate(g)[:-2] for g in globs)})"
+                 for i, globs in globs_by_index.items() if globs]
+        return re.compile("|".join(parts) or r"(?!)")
+
+    def _bloat_regex(self, key):
+        regex = self._bloat_cache.get(key)
+        if regex is None:
+            globs = sorted(set().union(*(self.ecosystems[i].bloat for i in key)))
+            regex = self._bloat_cache[key] = re.compile("|".join(fnmatch.translate(g)[:-2] for g in globs))
+        return regex
+
+    def detect(self, file_names):
+        """ProjectInfo for a directory containing `file_names`, or None if it is not a project."""
+        found = set()
+        marker = self._marker.fullmatch
+        for name in file_names:
+            m = marker(name)
+            if m is not None:
+                found.add(int(m.lastgroup[1:]))
+        if not found:
+            return None
+        key = tuple(sorted(found))
+        return ProjectInfo([self.ecosystems[i] for i in key], self._bloat_regex(key))
+
+    def is_source(self, name):
+        return self._source.fullmatch(name) is not None
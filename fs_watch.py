@@ -0,0 +1,203 @@
+import os
+import sys
+import time
+import errno
+import ctypes
+import ctypes.util
+import select
+import struct
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_EXCL_UNLINK = 0x04000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE |
+              IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW | IN_EXCL_UNLINK)
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class Watcher:
+    """
+    Portable change-notification interface used by LiveTotals.
+
+    watch(path, key, max_depth) subscribes to a directory tree; wait(timeout) blocks for up to
+    `timeout` seconds and returns (keys that changed, overflowed). After an overflow the caller
+    must assume every key changed and call watch() again for its trees.
+    """
+    def watch(self, path, key, max_depth=None):
+        """Returns False if the tree could only be partly watched (the caller should poll that key)."""
+        raise NotImplementedError
+
+    def wait(self, timeout):
+        raise NotImplementedError
+
+    def reset(self):
+        """Drops every watch (before re-watching after an overflow)."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class PollingWatcher(Watcher):
+    """
+    Fallback for platforms without a native backend: reports every key as changed once per
+    `interval` seconds. LiveTotals refreshes through the size index, so an unchanged tree costs
+    one stat per directory rather than a full listing.
+    """
+    def __init__(self, interval=30):
+        self.interval = interval
+        self.keys = set()
+        self._next = time.monotonic() + interval
+        self._closed = threading.Event()
+
+    def watch(self, path, key, max_depth=None):
+        self.keys.add(key)
+        return True
+
+    def wait(self, timeout):
+        remaining = self._next - time.monotonic()
+        if remaining > timeout:
+            self._closed.wait(timeout)
+            return set(), False
+        self._closed.wait(max(0.0, remaining))
+        self._next = time.monotonic() + self.interval
+        return set(self.keys), False
+
+    def reset(self):
+        self.keys.clear()
+
+    def close(self):
+        self._closed.set()
+
+
+class InotifyWatcher(Watcher):
+    """
+    Linux backend (inotify via ctypes, no extra dependency). inotify is not recursive, so every
+    directory of a tree gets its own watch; directories created later are added as their
+    IN_CREATE events arrive. At most `max_dirs` watches are used: trees beyond that budget
+    report False from watch() and are left to the caller's polling.
+    """
+    def __init__(self, max_dirs=20000):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.max_dirs = max_dirs
+        self._wds = {}   # wd -> (dir path, key, remaining depth or None)
+        self._paths = {}  # dir path -> wd
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available():
+        return sys.platform.startswith("linux")
+
+    def _add(self, path, key, depth_left):
+        if len(self._wds) >= self.max_dirs:
+            return False
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            if ctypes.get_errno() == errno.ENOSPC:
+                logger.info("inotify watch limit reached (fs.inotify.max_user_watches)")
+                return False
+            return True  # Vanished or unreadable: nothing to watch
+        self._wds[wd] = (path, key, depth_left)
+        self._paths[path] = wd
+        return True
+
+    def watch(self, path, key, max_depth=None):
+        complete = True
+        stack = [(str(path), max_depth)]
+        with self._lock:
+            while stack:
+                dir_path, depth_left = stack.pop()
+                if dir_path in self._paths:
+                    continue
+                if not self._add(dir_path, key, depth_left):
+                    complete = False
+                    break
+                if depth_left is not None and depth_left <= 0:
+                    continue
+                try:
+                    with os.scandir(dir_path) as it:
+                        for entry in it:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append((entry.path, None if depth_left is None else depth_left - 1))
+                except OSError:
+                    continue
+        return complete
+
+    def wait(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set(), False
+        keys = set()
+        overflow = False
+        new_dirs = []
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            with self._lock:
+                while offset + EVENT_HEADER.size <= len(buf):
+                    wd, mask, _, name_len = EVENT_HEADER.unpack_from(buf, offset)
+                    name = buf[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + name_len].rstrip(b"\0")
+                    offset += EVENT_HEADER.size + name_len
+                    if mask & IN_Q_OVERFLOW:
+                        overflow = True
+                        continue
+                    watched = self._wds.get(wd)
+                    if watched is None:
+                        continue
+                    dir_path, key, depth_left = watched
+                    keys.add(key)
+                    if mask & IN_IGNORED:
+                        del self._wds[wd]
+                        self._paths.pop(dir_path, None)
+                    elif mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                        if depth_left is None or depth_left > 0:
+                            child_depth = None if depth_left is None else depth_left - 1
+                            new_dirs.append((os.path.join(dir_path, os.fsdecode(name)), key, child_depth))
+        for path, key, depth_left in new_dirs:
+            self.watch(path, key, depth_left)
+        return keys, overflow
+
+    def reset(self):
+        with self._lock:
+            for wd in list(self._wds):
+                self._libc.inotify_rm_watch(self.fd, wd)
+            self._wds.clear()
+            self._paths.clear()
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_watcher(max_dirs=20000, poll_interval=30):
+    """Best available watcher for this platform: inotify on Linux, polling elsewhere."""
+    if InotifyWatcher.available():
+        try:
+            return InotifyWatcher(max_dirs)
+        except (OSError, AttributeError) as e:
+            logger.info(f"inotify unavailable ({e}); falling back to polling")
+    return PollingWatcher(poll_interval)
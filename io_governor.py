@@ -0,0 +1,109 @@
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+SLEEP_SLICE = 0.1  # Longest uninterrupted throttle sleep, so stop requests are noticed
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. `rate` tokens per second accrue up to `burst`; acquire(n) takes n
+    tokens and sleeps for any shortfall. Callers may run the bucket into debt (n larger than
+    what is available), which later callers pay off, so a big request is never starved.
+    A rate of 0 disables the bucket.
+    """
+    def __init__(self, rate=0, burst=None):
+        self._lock = threading.Lock()
+        self.set_rate(rate, burst)
+
+    def set_rate(self, rate, burst=None):
+        with self._lock:
+            self.rate = max(0.0, float(rate or 0))
+            self.burst = float(burst) if burst else max(1.0, self.rate * 0.5)
+            self.tokens = self.burst
+            self.stamp = time.monotonic()
+
+    def acquire(self, n=1, stop=None):
+        """Takes n tokens; returns the seconds spent waiting. `stop()` returning True cuts the wait short."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            self.tokens -= n
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait <= 0:
+            return 0.0
+        start = time.monotonic()
+        end = start + wait
+        while True:
+            remaining = end - time.monotonic()
+            if remaining <= 0 or (stop is not None and stop()):
+                break
+            time.sleep(min(remaining, SLEEP_SLICE))
+        return time.monotonic() - start
+
+
+class IOGovernor:
+    """
+    Shared I/O budget for the walker and the deletion path: token buckets for directory
+    listings, stat calls and bytes moved per second. Limits can be changed at runtime with
+    configure(); every bucket records how long callers were held back (throttled_s).
+    """
+    LIMITS = ("dir_reads_per_s", "stats_per_s", "bytes_per_s")
+
+    def __init__(self, dir_reads_per_s=0, stats_per_s=0, bytes_per_s=0, burst_s=0.5):
+        self.burst_s = burst_s
+        self.buckets = {name: TokenBucket() for name in self.LIMITS}
+        self.throttled_s = {name: 0.0 for name in self.LIMITS}
+        self._lock = threading.Lock()
+        self.configure(dir_reads_per_s=dir_reads_per_s, stats_per_s=stats_per_s, bytes_per_s=bytes_per_s)
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(config.get("io_dir_reads_per_s", 0), config.get("io_stats_per_s", 0),
+                   config.get("io_bytes_per_s", 0), config.get("io_burst_seconds", 0.5))
+
+    def configure(self, **limits):
+        """Sets any of dir_reads_per_s / stats_per_s / bytes_per_s (0 = unlimited); takes effect immediately."""
+        for name, rate in limits.items():
+            if name not in self.buckets:
+                raise ValueError(f"Unknown I/O limit: {name}")
+            rate = max(0.0, float(rate or 0))
+            self.buckets[name].set_rate(rate, max(1.0, rate * self.burst_s))
+        active = {name: b.rate for name, b in self.buckets.items() if b.rate > 0}
+        if active:
+            logger.info(f"I/O limits: {active}")
+
+    @property
+    def enabled(self):
+        return any(b.rate > 0 for b in self.buckets.values())
+
+    def limits(self):
+        return {name: b.rate for name, b in self.buckets.items()}
+
+    def _take(self, name, n, stop):
+        bucket = self.buckets[name]
+        if bucket.rate <= 0 or n <= 0:
+            return 0.0
+        waited = bucket.acquire(n, stop)
+        if waited:
+            with self._lock:
+                self.throttled_s[name] += waited
+        return waited
+
+    def dir_read(self, stop=None):
+        return self._take("dir_reads_per_s", 1, stop)
+
+    def stat(self, n=1, stop=None):
+        return self._take("stats_per_s", n, stop)
+
+    def moved(self, nbytes, stop=None):
+        return self._take("bytes_per_s", nbytes, stop)
+
+    def total_throttled(self):
+        with self._lock:
+            return sum(self.throttled_s.values())
@@ -0,0 +1,99 @@
+import os
+import time
+import heapq
+import stat
+import logging
+import threading
+from pathlib import Path
+from walker import allocated_bytes
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_EVERY_S = 0.5
+
+
+class LargeFileFinder:
+    """
+    LARGE-FILES category: the K largest files seen by the search-path walk (a walker file sink).
+
+    A min-heap of at most K (size, path, allocated bytes, link key) entries holds the current top K;
+    a file only gets in by beating the smallest of them, so memory stays O(K) however many files are
+    visited. Optional filters: minimum size, minimum age (mtime) and a set of extensions. A
+    hardlinked file is listed under the first of its links the walk reaches. Links are only checked
+    for files that make the cut, against the inodes in the heap (an evicted inode cannot come back:
+    its other links are no larger), and on Windows that is when its inode is stat()ed. While the
+    walk runs, the current standings are published to `progress` at most every PROGRESS_EVERY_S
+    seconds, and snapshot() can be read at any time.
+    """
+    CATEGORY = "LARGE-FILES"
+
+    def __init__(self, k=100, min_size=0, min_age_s=0, extensions=None, progress=None, format_bytes=str):
+        self.k = max(1, k)
+        self.min_size = min_size
+        self.min_age_s = min_age_s
+        self.extensions = frozenset(e.lower() if e.startswith(".") else "." + e.lower() for e in extensions or ())
+        self.progress = progress
+        self.format_bytes = format_bytes
+        self.files_seen = 0
+        self._linked = set()  # (st_dev, st_ino) of multiply-linked files in the heap: one link is listed per inode
+        self._heap = []
+        self._now = time.time()
+        self._next_report = time.monotonic() + PROGRESS_EVERY_S
+        self._lock = threading.Lock()
+
+    def add(self, path, st):
+        size = st.st_size
+        if size < self.min_size or not stat.S_ISREG(st.st_mode):
+            return
+        heap = self._heap
+        # Unlocked pre-check: once the heap is full most files cannot get in
+        if len(heap) >= self.k and size <= heap[0][0]:
+            return
+        if self.min_age_s and self._now - st.st_mtime < self.min_age_s:
+            return
+        if self.extensions and os.path.splitext(path)[1].lower() not in self.extensions:
+            return
+        key = None
+        if st.st_nlink != 1:
+            if not st.st_ino:
+                # Windows listings carry no inode or link count: only files that get this far pay for them
+                try:
+                    st = os.stat(path, follow_symlinks=False)
+                except OSError:
+                    return
+            if st.st_nlink > 1 and st.st_ino:
+                key = (st.st_dev, st.st_ino)
+        with self._lock:
+            if key is not None and key in self._linked:
+                return
+            self.files_seen += 1
+            entry = (size, path, allocated_bytes(st), key)
+            if len(heap) < self.k:
+                heapq.heappush(heap, entry)
+            elif size > heap[0][0]:
+                evicted = heapq.heapreplace(heap, entry)
+                if evicted[3] is not None:
+                    self._linked.discard(evicted[3])
+            else:
+                key = None
+            if key is not None:
+                self._linked.add(key)
+            report = self.progress is not None and time.monotonic() >= self._next_report
+            if report:
+                self._next_report = time.monotonic() + PROGRESS_EVERY_S
+                largest, cutoff, count = max(heap)[0], heap[0][0], len(heap)
+        if report:
+            self.progress(f"Largest files: top {count} so far, {self.format_bytes(largest)} "
+                          f"down to {self.format_bytes(cutoff)}")
+
+    def snapshot(self):
+        """Current top K as (size, path, allocated) entries, largest first."""
+        with self._lock:
+            return [entry[:3] for entry in sorted(self._heap, reverse=True)]
+
+    def results(self, exclude=()):
+        """Result dicts for the top K, largest first, skipping paths in `exclude` (already reported)."""
+        found = [{'path': Path(p), 'size': size, 'allocated': allocated, 'category': self.CATEGORY}
+                 for size, p, allocated in self.snapshot() if p not in exclude]
+        logger.info(f"Large files: kept {len(found)} of {self.files_seen} candidates")
+        return found
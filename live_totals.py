@@ -0,0 +1,188 @@
+import time
+import logging
+import threading
+from pathlib import Path
+from fs_watch import create_watcher
+from walker import TreeWalker
+
+logger = logging.getLogger(__name__)
+
+
+class LiveTotals:
+    """
+    Watcher mode: keeps scan results current between Analyze clicks.
+
+    Seeds its state from one walk of every category target and search path, then subscribes
+    to change notifications for those trees (fs_watch). Changed targets are re-walked after a
+    short quiet period through the size index, so only directories whose mtime changed are
+    listed again. A watcher overflow (or the periodic safety refresh) re-walks everything; only
+    those full refreshes start a size-index generation, so frequent polls do not age the index.
+    After a clean, invalidate() drops the trashed items at once and queues their targets for a
+    refresh, so they are not reported (or counted as reclaimable) again.
+    The engine's scan_iter answers from results() while the service is ready.
+    """
+    def __init__(self, engine, watcher=None):
+        self.engine = engine
+        config = engine.config
+        self.debounce_s = config.get("watch_debounce_ms", 500) / 1000
+        self.rescan_s = config.get("watch_rescan_minutes", 60) * 60
+        self.poll_s = config.get("watch_poll_seconds", 30)
+        self.watcher = watcher or create_watcher(config.get("watch_max_dirs", 20000), self.poll_s)
+        self.items = {}       # key (category name or search path) -> list of result dicts
+        self.roots = {}       # key -> (path, kind, max_depth)
+        self.polled = set()   # Keys the watcher could not fully cover; refreshed every poll_s
+        self.refreshes = 0
+        self.overflows = 0
+        self.updated = None   # time.time() of the last refresh
+        self._invalidated = set()  # Keys whose items were cleaned, picked up by the service loop
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def ready(self):
+        return self._ready.is_set()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True, name="live-totals")
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self.watcher.close()
+
+    def wait_ready(self, timeout=None):
+        return self._ready.wait(timeout)
+
+    def _collect_roots(self):
+        roots = {}
+        for target, cat in self.engine.get_standard_targets():
+            roots[cat] = (target, "category", None)
+        if self.engine.config.get("dev_bloat_hunter"):
+            max_depth = self.engine.config.get("max_scan_depth", 3)
+            for path_str in self.engine.config.get("search_paths", []):
+                p = Path(path_str)
+                if p.exists():
+                    roots[str(p)] = (p, "search", max_depth)
+        return roots
+
+    def _watch_all(self):
+        self.watcher.reset()
+        self.polled.clear()
+        for key in self.roots:
+            self._watch_key(key)
+
+    def _watch_key(self, key):
+        path, kind, max_depth = self.roots[key]
+        complete = self.watcher.watch(path, key, max_depth)
+        if kind == "search":
+            # Sizes of found bloat folders change below the hunt depth: watch those trees fully
+            for res in self.items.get(key, []):
+                complete = self.watcher.watch(res['path'], key) and complete
+        if not complete:
+            self.polled.add(key)
+
+    def _run(self):
+        try:
+            self.roots = self._collect_roots()
+            self.refresh(self.roots, full=True)
+            self._watch_all()
+        except Exception as e:
+            logger.error(f"Live totals failed to start: {e}")
+            return
+        self._ready.set()
+
+        dirty = set()
+        full = False
+        last_event = 0.0
+        now = time.monotonic()
+        next_poll = now + self.poll_s
+        next_rescan = now + self.rescan_s
+        while not self._stop.is_set():
+            keys, overflow = self.watcher.wait(min(self.debounce_s, 0.5))
+            now = time.monotonic()
+            if overflow:
+                # Events were lost: nothing about the maintained state can be trusted
+                logger.info("Watcher overflow: rescanning every target")
+                self.overflows += 1
+                dirty.update(self.roots)
+                full = True
+                self._watch_all()
+            with self._lock:
+                cleaned, self._invalidated = self._invalidated, set()
+            if keys or cleaned:
+                dirty.update(k for k in set(keys) | cleaned if k in self.roots)
+                last_event = now
+            if self.polled and now >= next_poll:
+                dirty.update(self.polled)
+                next_poll = now + self.poll_s
+            if now >= next_rescan:
+                # Also picks up items that aged past the grace period without any file change
+                dirty.update(self.roots)
+                full = True
+                next_rescan = now + self.rescan_s
+            if dirty and (overflow or now - last_event >= self.debounce_s):
+                keys, dirty = dirty, set()
+                try:
+                    self.refresh(keys, full=full)
+                    full = False
+                    for key in keys:
+                        if self.roots[key][1] == "search":
+                            self._watch_key(key)  # Newly found bloat folders
+                except Exception as e:
+                    logger.error(f"Live totals refresh failed: {e}")
+
+    def refresh(self, keys, full=False):
+        """
+        Re-walks the given targets / search paths (size index makes unchanged trees cheap).
+        full=True (seed, overflow, periodic rescan) counts as a scan for size-index ageing.
+        """
+        engine = self.engine
+        walker = TreeWalker(engine.size_index, workers=engine.config.get("scan_workers", 0),
+                            governor=engine.governor, **engine._link_options())
+        grace_period = engine.config.get("grace_period_hours", 24) * 3600
+        if engine.size_index and full:
+            # Only full refreshes age the index: polls and partial refreshes would evict the other trees
+            engine.size_index.begin_scan()
+        for key in keys:
+            path, kind, max_depth = self.roots[key]
+            if kind == "category":
+                engine._scan_category(path, key, grace_period, _quiet, walker)
+            else:
+                engine._scan_bloat(path, max_depth, _quiet, walker)
+        fresh = {key: [] for key in keys}
+        for item, res in zip(walker.items, walker.run()):
+            fresh.setdefault(item.group, []).append(res)
+        if engine.size_index:
+            engine.size_index.save()
+        with self._lock:
+            self.items.update(fresh)
+            self.refreshes += 1
+            self.updated = time.time()
+
+    def invalidate(self, paths):
+        """Drops items whose path was cleaned and queues their targets for a refresh."""
+        paths = {str(p) for p in paths}
+        with self._lock:
+            for key, group in self.items.items():
+                kept = [res for res in group if str(res['path']) not in paths]
+                if len(kept) != len(group):
+                    self.items[key] = kept
+                    self._invalidated.add(key)
+
+    def results(self):
+        """The maintained walker result dicts, in target order (no disk access)."""
+        with self._lock:
+            return [res for key in self.roots for res in self.items.get(key, [])]
+
+    def totals(self):
+        """{key: (items, bytes)} for every watched target / search path"""
+        with self._lock:
+            return {key: (len(group), sum(r['size'] for r in group)) for key, group in self.items.items()}
+
+
+def _quiet(_message):
+    pass
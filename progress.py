@@ -0,0 +1,113 @@
+import time
+import queue
+
+# Event kinds carried on the bus
+MESSAGE = 0
+TICK = 1
+
+
+class ProgressSnapshot:
+    """Coalesced view of everything published since the phase started."""
+    __slots__ = ('phase', 'message', 'current', 'items_done', 'items_total', 'bytes_done', 'rate', 'byte_rate')
+
+    def __init__(self, phase=None):
+        self.phase = phase
+        self.message = None      # Last free-text status line, if nothing newer was published
+        self.current = None      # Name of the last item processed
+        self.items_done = 0
+        self.items_total = None  # Known up front for clean(), unknown for scans
+        self.bytes_done = 0
+        self.rate = 0.0          # Items per second (smoothed)
+        self.byte_rate = 0.0     # Bytes per second (smoothed)
+
+
+class ProgressBus:
+    """
+    Thread-safe progress channel between engine workers and the UI.
+
+    Workers push small events onto a lock-free queue; the UI calls drain() from one fixed-rate
+    timer, which folds every pending event into a single snapshot. UI cost therefore depends on
+    the poll rate, not on how many items the engine processes per second.
+    The bus is also callable with a message string, so it can be passed wherever the engine
+    expects a log_callback.
+    """
+    SMOOTHING = 0.3
+
+    def __init__(self):
+        self._events = queue.SimpleQueue()
+        self.snapshot = ProgressSnapshot()
+        self._mark = (time.monotonic(), 0, 0)
+
+    def __call__(self, message):
+        self._events.put((MESSAGE, message))
+
+    def publish(self, phase=None, current=None, items=0, nbytes=0, total=None):
+        """Reports progress: items/nbytes are increments, phase/current/total replace the previous value."""
+        self._events.put((TICK, phase, current, items, nbytes, total))
+
+    def reset(self, phase):
+        """Starts a new phase with zeroed counters (call before handing the bus to the engine)."""
+        while True:
+            try:
+                self._events.get_nowait()
+            except queue.Empty:
+                break
+        self.snapshot = ProgressSnapshot(phase)
+        self._mark = (time.monotonic(), 0, 0)
+
+    def drain(self):
+        """Folds queued events into the snapshot. Returns the snapshot if anything changed, else None."""
+        snap = self.snapshot
+        changed = False
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            changed = True
+            if event[0] == MESSAGE:
+                snap.message = event[1]
+                continue
+            _, phase, current, items, nbytes, total = event
+            snap.message = None  # A message is only shown until newer progress arrives
+            if phase is not None:
+                snap.phase = phase
+            if current is not None:
+                snap.current = current
+            if total is not None:
+                snap.items_total = total
+            snap.items_done += items
+            snap.bytes_done += nbytes
+
+        if changed:
+            now = time.monotonic()
+            last_time, last_items, last_bytes = self._mark
+            elapsed = now - last_time
+            if elapsed > 0:
+                a = self.SMOOTHING
+                snap.rate = (1 - a) * snap.rate + a * (snap.items_done - last_items) / elapsed
+                snap.byte_rate = (1 - a) * snap.byte_rate + a * (snap.bytes_done - last_bytes) / elapsed
+            self._mark = (now, snap.items_done, snap.bytes_done)
+            return snap
+        return None
+
+
+class CallbackProgress:
+    """Adapter so engine code can publish events when the caller only passed a plain log callback."""
+    __slots__ = ('callback',)
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def __call__(self, message):
+        self.callback(message)
+
+    def publish(self, phase=None, current=None, items=0, nbytes=0, total=None):
+        pass
+
+
+def as_progress(log_callback):
+    """Engine entry points accept either a plain log callback or a ProgressBus."""
+    if isinstance(log_callback, (ProgressBus, CallbackProgress)):
+        return log_callback
+    return CallbackProgress(log_callback)
@@ -0,0 +1,125 @@
+import os
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+IGNORE_FILE = ".cleanerignore"
+_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+
+def _translate(pattern):
+    """gitignore glob -> regex body: '*' and '?' stay within one path component, '**' spans any."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern.startswith("**", i):
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2 if pattern.startswith("[!", i) or pattern.startswith("[^", i) else i + 1)
+            if end < 0:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body[:1] in ("!", "^"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class PruneRule:
+    """One compiled gitignore line, relative to the directory (`base`) it was defined in."""
+    __slots__ = ('pattern', 'regex', 'negate', 'dir_only', 'anchored', 'base')
+
+    def __init__(self, pattern, base, negate=False):
+        self.pattern = pattern
+        self.negate = negate
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        if pattern.startswith("~/") or re.match(r"^[A-Za-z]:[\\/]", pattern):
+            # Absolute paths (C:/VMs, ~/datasets) match that exact tree wherever the walk reaches it.
+            # A leading '/' keeps its gitignore meaning: anchored to the defining directory.
+            base = ""
+            pattern = os.path.expanduser(pattern).replace("\\", "/")
+        self.anchored = "/" in pattern
+        self.base = base
+        self.regex = re.compile(_translate(pattern.lstrip("/") if base else pattern), _FLAGS)
+
+    def matches(self, path, name):
+        if not self.anchored:
+            return self.regex.fullmatch(name) is not None
+        if self.base:
+            if not path.startswith(self.base) or path[len(self.base):len(self.base) + 1] != os.sep:
+                return False
+            rel = path[len(self.base):].lstrip(os.sep)
+        else:
+            rel = path
+        return self.regex.fullmatch(rel.replace(os.sep, "/")) is not None
+
+
+class PruneRules:
+    """
+    Gitignore-style exclusions for the Dev-Bloat hunt: config `prune_patterns` plus every
+    `.cleanerignore` found on the way down. Rules are compiled once and inherited by reference;
+    a directory with its own ignore file gets a new PruneRules with its rules appended, so as in
+    git the deepest, last matching rule wins ('!' re-includes). Excluded directories are never
+    listed, so nothing below them can be re-included.
+    """
+    __slots__ = ('rules',)
+
+    def __init__(self, rules=()):
+        self.rules = tuple(rules)
+
+    @classmethod
+    def from_patterns(cls, patterns, base):
+        rules = []
+        for line in patterns:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate or line.startswith("\\#") or line.startswith("\\!"):
+                line = line[1:]
+            try:
+                rules.append(PruneRule(line, base, negate))
+            except re.error as e:
+                logger.info(f"Ignoring prune pattern {line!r}: {e}")
+        return cls(rules)
+
+    def with_ignore_file(self, dir_path):
+        """Rules for dir_path's subtree: these plus its .cleanerignore (self if it adds nothing)."""
+        try:
+            with open(os.path.join(dir_path, IGNORE_FILE), "r", encoding="utf-8", errors="replace") as f:
+                extra = PruneRules.from_patterns(f, dir_path)
+        except OSError:
+            return self
+        return PruneRules(self.rules + extra.rules) if extra.rules else self
+
+    def excluded(self, path, name, is_dir=True):
+        for rule in reversed(self.rules):
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.matches(path, name):
+                return not rule.negate
+        return False
+
+    def __bool__(self):
+        return bool(self.rules)
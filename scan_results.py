@@ -0,0 +1,159 @@
+import os
+from array import array
+from pathlib import Path
+
+# Bit flags stored per result
+PARTIAL = 1
+ESTIMATED = 2
+
+
+class ResultRecord:
+    """
+    Lightweight view of one row in a ScanResults store.
+    Supports the dict-style access the rest of the app uses (rec['path'], rec.get('partial'), ...)
+    without copying the row out of the columns.
+    """
+    __slots__ = ('store', 'index')
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def __getitem__(self, key):
+        return self.store.get_field(self.index, key)
+
+    def __setitem__(self, key, value):
+        self.store.set_field(self.index, key, value)
+
+    def get(self, key, default=None):
+        try:
+            return self.store.get_field(self.index, key)
+        except KeyError:
+            return default
+
+    def update(self, **fields):
+        for key, value in fields.items():
+            self.store.set_field(self.index, key, value)
+
+    def to_dict(self):
+        return {key: self.store.get_field(self.index, key) for key in ScanResults.FIELDS}
+
+    def __eq__(self, other):
+        return isinstance(other, ResultRecord) and other.store is self.store and other.index == self.index
+
+    def __hash__(self):
+        return hash((id(self.store), self.index))
+
+    def __repr__(self):
+        return f"ResultRecord({self.to_dict()!r})"
+
+
+class ScanResults:
+    """
+    Compact columnar store for scan results, shared by the engine, the UI list and clean().
+
+    Each column is a flat array; category names and parent directories are interned, so a row
+    costs a file name string plus a few array slots instead of a dict, a Path and a repeated
+    category string. Rows are addressed by index; ResultRecord gives dict-style access.
+    """
+    FIELDS = ('path', 'size', 'allocated', 'category', 'partial', 'estimated', 'size_error')
+    # Categories listed for review rather than as junk: their rows start unselected, and cleans
+    # without a per-row choice (scheduler, CLI rescan) skip them unless opted in
+    REVIEW_CATEGORIES = frozenset(["DUPLICATES", "LARGE-FILES"])
+
+    def __init__(self):
+        self.names = []            # Base name of each result
+        self.dir_ids = array('I')  # Index into self.dirs
+        self.sizes = array('q')
+        self.allocs = array('q')   # Allocated (on-disk) bytes; what deleting the row actually frees
+        self.errors = array('q')   # size_error (95% CI half-width) for estimated rows
+        self.cat_ids = array('B')  # Index into self.categories
+        self.flags = array('B')    # PARTIAL | ESTIMATED
+        self.dirs = []
+        self.categories = []
+        self._dir_ids = {}
+        self._cat_ids = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.names)
+        if not 0 <= index < len(self.names):
+            raise IndexError(index)
+        return ResultRecord(self, index)
+
+    def __iter__(self):
+        for i in range(len(self.names)):
+            yield ResultRecord(self, i)
+
+    def _intern(self, value, values, ids):
+        idx = ids.get(value)
+        if idx is None:
+            idx = ids[value] = len(values)
+            values.append(value)
+        return idx
+
+    def append(self, path, size, category, partial=False, estimated=False, size_error=0, allocated=None):
+        """Adds one row and returns its ResultRecord (allocated defaults to the logical size)."""
+        parent, name = os.path.split(os.fspath(path))
+        self.dir_ids.append(self._intern(parent, self.dirs, self._dir_ids))
+        self.cat_ids.append(self._intern(category, self.categories, self._cat_ids))
+        self.sizes.append(size)
+        self.allocs.append(size if allocated is None else allocated)
+        self.errors.append(size_error)
+        self.flags.append((PARTIAL if partial else 0) | (ESTIMATED if estimated else 0))
+        # names last: len(self) only grows once the row is complete, so readers never see half a row
+        self.names.append(name)
+        return ResultRecord(self, len(self.names) - 1)
+
+    def append_result(self, res):
+        """Adds a walker result dict."""
+        return self.append(res['path'], res['size'], res['category'], res.get('partial', False),
+                           res.get('estimated', False), res.get('size_error', 0), res.get('allocated'))
+
+    def path_str(self, index):
+        return os.path.join(self.dirs[self.dir_ids[index]], self.names[index])
+
+    def get_field(self, index, key):
+        if key == 'path':
+            return Path(self.path_str(index))
+        if key == 'size':
+            return self.sizes[index]
+        if key == 'allocated':
+            return self.allocs[index]
+        if key == 'category':
+            return self.categories[self.cat_ids[index]]
+        if key == 'partial':
+            return bool(self.flags[index] & PARTIAL)
+        if key == 'estimated':
+            return bool(self.flags[index] & ESTIMATED)
+        if key == 'size_error':
+            return self.errors[index]
+        if key == 'name':
+            return self.names[index]
+        raise KeyError(key)
+
+    def set_field(self, index, key, value):
+        if key == 'size':
+            self.sizes[index] = value
+        elif key == 'allocated':
+            self.allocs[index] = value
+        elif key == 'size_error':
+            self.errors[index] = value
+        elif key == 'partial':
+            self.flags[index] = (self.flags[index] & ~PARTIAL) | (PARTIAL if value else 0)
+        elif key == 'estimated':
+            self.flags[index] = (self.flags[index] & ~ESTIMATED) | (ESTIMATED if value else 0)
+        else:
+            raise KeyError(key)
+
+    def total_bytes(self):
+        return sum(self.sizes)
+
+    def total_allocated(self):
+        return sum(self.allocs)
+
+    def count_flag(self, flag):
+        return sum(1 for f in self.flags if f & flag)
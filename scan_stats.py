@@ -0,0 +1,115 @@
+import time
+
+
+class GroupStats:
+    """Counters for one category or search path of a scan."""
+    __slots__ = ('name', 'kind', 'dirs', 'entries', 'stat_calls', 'permission_errors', 'timeouts',
+                 'cached_dirs', 'pruned', 'revisits', 'links', 'throttled_s', 'busy_s', 'first_start', 'last_end')
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind               # "category" or "search"
+        self.dirs = 0                  # Directories listed (scandir)
+        self.entries = 0               # Directory entries looked at
+        self.stat_calls = 0            # stat()/lstat() calls, including size-index validation
+        self.permission_errors = 0     # Entries or directories skipped as unreadable
+        self.timeouts = 0              # Items cut short by the per-item timeout
+        self.cached_dirs = 0           # Directories answered by the size index instead of scandir
+        self.pruned = 0                # Directories skipped by prune rules (.cleanerignore, prune_patterns)
+        self.revisits = 0              # Directories not entered again (loops, bind mounts, overlapping roots)
+        self.links = 0                 # Hardlinks of a file whose bytes were already counted
+        self.throttled_s = 0.0         # Time workers waited on the I/O governor (part of busy_s)
+        self.busy_s = 0.0              # Summed worker time (exceeds wall time when parallel)
+        self.first_start = None        # perf_counter() span of the group's work, for wall time
+        self.last_end = None
+
+    @property
+    def wall_s(self):
+        if self.first_start is None:
+            return 0.0
+        return self.last_end - self.first_start
+
+    def mark(self, start, end):
+        """Records one unit of work that ran from start to end (perf_counter values)."""
+        self.busy_s += end - start
+        if self.first_start is None or start < self.first_start:
+            self.first_start = start
+        if self.last_end is None or end > self.last_end:
+            self.last_end = end
+
+    def merge(self, other):
+        for key in ('dirs', 'entries', 'stat_calls', 'permission_errors', 'timeouts', 'cached_dirs', 'pruned',
+                    'revisits', 'links', 'throttled_s'):
+            setattr(self, key, getattr(self, key) + getattr(other, key))
+        if other.first_start is not None:
+            self.busy_s += other.busy_s
+            if self.first_start is None or other.first_start < self.first_start:
+                self.first_start = other.first_start
+            if self.last_end is None or other.last_end > self.last_end:
+                self.last_end = other.last_end
+
+    def to_dict(self):
+        return {
+            'name': self.name, 'kind': self.kind, 'wall_s': round(self.wall_s, 4), 'busy_s': round(self.busy_s, 4),
+            'dirs': self.dirs, 'entries': self.entries, 'stat_calls': self.stat_calls,
+            'permission_errors': self.permission_errors, 'timeouts': self.timeouts, 'cached_dirs': self.cached_dirs,
+            'pruned': self.pruned, 'revisits': self.revisits, 'links': self.links,
+            'throttled_s': round(self.throttled_s, 4),
+        }
+
+
+class ScanStats:
+    """
+    Structured instrumentation for one scan: a GroupStats per category and per search path,
+    plus per-worker busy time so worker utilisation (busy / walk wall time) can be reported.
+    Workers fill private GroupStats and merge them here once, so counting needs no locking.
+    """
+    def __init__(self):
+        self.groups = {}        # name -> GroupStats, in the order groups were first seen
+        self.worker_busy = []   # Seconds each walker thread spent processing tasks
+        self.walk_s = 0.0       # Wall time of the parallel walk
+        self.started = time.perf_counter()
+
+    def group(self, name, kind="category"):
+        stats = self.groups.get(name)
+        if stats is None:
+            stats = self.groups[name] = GroupStats(name, kind)
+        return stats
+
+    def merge_groups(self, local):
+        for name, other in local.items():
+            self.group(name, other.kind).merge(other)
+
+    @property
+    def utilisation(self):
+        """Average fraction of the walk each worker spent busy (0..1)."""
+        if not self.worker_busy or self.walk_s <= 0:
+            return 0.0
+        return min(1.0, sum(self.worker_busy) / (len(self.worker_busy) * self.walk_s))
+
+    def totals(self):
+        total = GroupStats("total", "total")
+        for stats in self.groups.values():
+            total.merge(stats)
+        return total
+
+    def to_dict(self):
+        return {
+            'groups': [g.to_dict() for g in self.groups.values()],
+            'total': self.totals().to_dict(),
+            'workers': len(self.worker_busy),
+            'walk_s': round(self.walk_s, 4),
+            'utilisation': round(self.utilisation, 3),
+        }
+
+    def format_table(self):
+        """Fixed-width table, slowest group first (used by the diagnostics panel and the log)."""
+        header = f"{'group':28} {'wall s':>7} {'busy s':>7} {'dirs':>8} {'entries':>9} {'stats':>9} {'denied':>6} {'t/o':>4} {'cached':>7} {'pruned':>7} {'revisit':>7} {'links':>7} {'thr s':>7}"
+        lines = [header, "-" * len(header)]
+        rows = sorted(self.groups.values(), key=lambda g: g.wall_s, reverse=True) + [self.totals()]
+        for g in rows:
+            name = g.name if len(g.name) <= 28 else "…" + g.name[-27:]
+            lines.append(f"{name:28} {g.wall_s:7.2f} {g.busy_s:7.2f} {g.dirs:8} {g.entries:9} {g.stat_calls:9} "
+                         f"{g.permission_errors:6} {g.timeouts:4} {g.cached_dirs:7} {g.pruned:7} {g.revisits:7} {g.links:7} {g.throttled_s:7.2f}")
+        lines.append(f"workers: {len(self.worker_busy)}, walk {self.walk_s:.2f}s, utilisation {self.utilisation:.0%}")
+        return "\n".join(lines)
@@ -0,0 +1,266 @@
+import os
+import sys
+import json
+import time
+import ctypes
+import logging
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class CronSchedule:
+    """
+    Five-field cron expression: minute hour day-of-month month day-of-week.
+    Fields accept '*', numbers, ranges (1-5), lists (1,15) and steps (*/15, 0-30/10).
+    Day of week is 0-6 with 0 = Sunday (7 is accepted as Sunday too). As in cron, when both
+    day fields are restricted a day matches if either one does.
+    """
+    FIELDS = (("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 7))
+
+    def __init__(self, expr):
+        parts = expr.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got {len(parts)}: {expr!r}")
+        self.expr = expr
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self._parse(part, name, lo, hi) for part, (name, lo, hi) in zip(parts, self.FIELDS))
+        self.weekdays = {d % 7 for d in weekdays}
+        self.any_day = parts[2] == "*"
+        self.any_weekday = parts[4] == "*"
+
+    @staticmethod
+    def _parse(field, name, lo, hi):
+        values = set()
+        for chunk in field.split(","):
+            rng, _, step = chunk.partition("/")
+            step = int(step) if step else 1
+            if rng == "*":
+                start, end = lo, hi
+            elif "-" in rng:
+                start, end = (int(v) for v in rng.split("-", 1))
+            else:
+                start = end = int(rng)
+                if step > 1:
+                    end = hi
+            if not (lo <= start <= end <= hi) or step < 1:
+                raise ValueError(f"Invalid {name} field: {field!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt):
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.isoweekday() % 7) in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, dt):
+        """First matching minute strictly after `dt` (naive local time)."""
+        t = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + timedelta(days=366 * 5)
+        while t < limit:
+            if t.month not in self.months:
+                t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        raise ValueError(f"Cron expression never matches: {self.expr!r}")
+
+
+class ProcessPriority:
+    """
+    Lowers the CPU and I/O priority of the current process, per platform:
+      - Windows: PROCESS_MODE_BACKGROUND_BEGIN (low CPU, I/O and memory priority)
+      - Linux: nice +10 and the idle I/O class (ionice -c3) via ioprio_set
+      - elsewhere: nice +10 only
+    lower() returns the list of measures that took effect.
+    """
+    PROCESS_MODE_BACKGROUND_BEGIN = 0x00100000
+    IOPRIO_WHO_PROCESS = 1
+    IOPRIO_CLASS_IDLE = 3
+    IOPRIO_CLASS_SHIFT = 13
+    # ioprio_set syscall numbers (no libc wrapper exists)
+    IOPRIO_SET_SYSCALL = {"x86_64": 251, "i386": 289, "i686": 289, "aarch64": 30, "armv7l": 314}
+
+    def lower(self):
+        applied = []
+        if sys.platform == "win32":
+            try:
+                kernel32 = ctypes.windll.kernel32
+                if kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), self.PROCESS_MODE_BACKGROUND_BEGIN):
+                    applied.append("background-mode")
+            except Exception as e:
+                logger.info(f"Could not enter background mode: {e}")
+            return applied
+
+        try:
+            os.nice(10)
+            applied.append("nice")
+        except (AttributeError, OSError) as e:
+            logger.info(f"Could not lower CPU priority: {e}")
+        if sys.platform.startswith("linux") and self._ionice_idle():
+            applied.append("ionice-idle")
+        return applied
+
+    def _ionice_idle(self):
+        syscall_no = self.IOPRIO_SET_SYSCALL.get(os.uname().machine)
+        if syscall_no is None:
+            return False
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            prio = self.IOPRIO_CLASS_IDLE << self.IOPRIO_CLASS_SHIFT
+            return libc.syscall(syscall_no, self.IOPRIO_WHO_PROCESS, 0, prio) == 0
+        except Exception as e:
+            logger.info(f"Could not lower I/O priority: {e}")
+            return False
+
+
+def cpu_load():
+    """
+    Machine-wide CPU load in [0, 1] (or more on Unix when the run queue is oversubscribed).
+    Unix: 1-minute load average per CPU. Windows: busy share of GetSystemTimes over one second.
+    Returns None when it cannot be measured.
+    """
+    if hasattr(os, "getloadavg"):
+        try:
+            return os.getloadavg()[0] / (os.cpu_count() or 1)
+        except OSError:
+            return None
+    try:
+        get_times = ctypes.windll.kernel32.GetSystemTimes
+    except Exception:
+        return None
+
+    def sample():
+        idle, kernel, user = ctypes.c_ulonglong(), ctypes.c_ulonglong(), ctypes.c_ulonglong()
+        get_times(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user))
+        return idle.value, kernel.value + user.value  # Kernel time includes idle time
+
+    idle0, total0 = sample()
+    time.sleep(1)
+    idle1, total1 = sample()
+    total = total1 - total0
+    return 1 - (idle1 - idle0) / total if total else None
+
+
+class RunHistory:
+    """Unattended runs, newest last, in a small JSON file next to config.json."""
+    def __init__(self, path, max_runs=200):
+        self.path = Path(path)
+        self.max_runs = max_runs
+
+    def load(self):
+        if not self.path.exists():
+            return []
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load run history: {e}")
+            return []
+
+    def append(self, record):
+        runs = self.load()
+        runs.append(record)
+        runs = runs[-self.max_runs:]
+        try:
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                json.dump(runs, f, indent=1)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.error(f"Failed to save run history: {e}")
+
+
+class CleaningScheduler:
+    """
+    Unattended scan + clean of the configured targets on a cron schedule.
+
+    A due run is deferred (checked every schedule_busy_retry_minutes) while the CPU load is
+    above schedule_max_load, and recorded as skipped once it has waited
+    schedule_max_defer_minutes. Every run, cleaned or skipped, is appended to RunHistory.
+    """
+    def __init__(self, engine, history=None, schedule=None, load_probe=cpu_load):
+        self.engine = engine
+        config = engine.config
+        self.schedule = CronSchedule(schedule or config.get("schedule_cron", "0 3 * * *"))
+        self.max_load = config.get("schedule_max_load", 0.5)
+        self.busy_retry_s = config.get("schedule_busy_retry_minutes", 10) * 60
+        self.max_defer_s = config.get("schedule_max_defer_minutes", 120) * 60
+        self.history = history or RunHistory(
+            Path(config.config_path).parent / "run_history.json",
+            config.get("schedule_history_max", 200))
+        self.load_probe = load_probe
+        self._stop = threading.Event()
+
+    def stop(self):
+        self._stop.set()
+        self.engine.cancel_scan()
+
+    def run_forever(self):
+        """Sleeps until each scheduled time and runs; returns once stop() is called."""
+        logger.info(f"Scheduler started: '{self.schedule.expr}', next run {self.schedule.next_after(datetime.now())}")
+        while not self._stop.is_set():
+            due = self.schedule.next_after(datetime.now())
+            if self._stop.wait(max(0.0, (due - datetime.now()).total_seconds())):
+                break
+            self.run_when_idle(due)
+
+    def run_when_idle(self, due=None):
+        """Waits (up to the defer limit) for the machine to be idle, then runs once."""
+        due = due or datetime.now()
+        waited = 0.0
+        while True:
+            load = self.load_probe()
+            if load is None or load <= self.max_load:
+                return self.run_once(scheduled=due, load=load)
+            if waited + self.busy_retry_s > self.max_defer_s:
+                logger.info(f"Skipping scheduled run: machine busy (load {load:.2f})")
+                record = self._record(due, datetime.now(), "skipped-busy", load=load)
+                self.history.append(record)
+                return record
+            logger.info(f"Machine busy (load {load:.2f}); retrying in {self.busy_retry_s / 60:.0f} min")
+            if self._stop.wait(self.busy_retry_s):
+                return None
+            waited += self.busy_retry_s
+
+    def run_once(self, scheduled=None, load=None):
+        """
+        Scans and cleans everything the scan finds, except review-only categories (DUPLICATES,
+        LARGE-FILES) not opted in through clean_review_categories; returns the history record.
+        """
+        started = datetime.now()
+        start = time.perf_counter()
+        try:
+            results = self.engine.scan(logger.info)
+            items = self.engine.unattended_items(results)
+            deleted, reclaimed = self.engine.clean(items, logger.info) if items else (0, 0)
+            summary = self.engine.last_clean_summary if items else {}
+            record = self._record(scheduled or started, started, "cleaned", load=load,
+                                  scan_status=self.engine.last_scan_summary.get('status'),
+                                  items=deleted, failed=summary.get('failed', 0), bytes_reclaimed=reclaimed)
+        except Exception as e:
+            logger.error(f"Scheduled run failed: {e}")
+            record = self._record(scheduled or started, started, "failed", load=load, error=str(e))
+        record['duration_s'] = round(time.perf_counter() - start, 3)
+        self.history.append(record)
+        logger.info(f"Scheduled run {record['status']}: {record.get('bytes_reclaimed', 0)} bytes "
+                    f"in {record['duration_s']:.1f}s")
+        return record
+
+    @staticmethod
+    def _record(scheduled, started, status, load=None, **fields):
+        return {'scheduled': scheduled.isoformat(timespec="seconds"),
+                'started': started.isoformat(timespec="seconds"),
+                'status': status,
+                'load': None if load is None else round(load, 2),
+                'duration_s': 0.0,
+                **fields}
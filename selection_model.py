@@ -0,0 +1,138 @@
+class SelectionModel:
+    """
+    Selection state for a ScanResults store, independent of Tk.
+
+    Selected rows are bits in a bytearray. Selected count, selected bytes and per-category
+    subtotals are maintained incrementally, so toggling a row is O(1) and select/deselect all
+    is a bytearray fill plus copying the store totals, regardless of result count.
+    """
+    def __init__(self):
+        self.results = None
+        self.bits = bytearray()
+        self.known = 0             # Rows of the store the model has seen
+        self.total_count = 0
+        self.total_bytes = 0
+        self.total_allocated = 0   # Allocated bytes over all rows (what the health score is based on)
+        self.count = 0             # Selected rows
+        self.bytes = 0             # Selected bytes
+        self.totals_by_cat = {}    # category id -> [count, bytes] over all rows
+        self.selected_by_cat = {}  # category id -> [count, bytes] over selected rows
+
+    def reset(self, results):
+        """Attach to a (possibly still growing) store; rows start selected, except review-only categories."""
+        self.results = results
+        self.bits = bytearray()
+        self.known = 0
+        self.total_count = self.total_bytes = self.total_allocated = 0
+        self.count = self.bytes = 0
+        self.totals_by_cat = {}
+        self.selected_by_cat = {}
+        self.sync()
+
+    def sync(self):
+        """
+        Picks up rows appended to the store since the last call. New rows are selected unless their
+        category is in ScanResults.REVIEW_CATEGORIES (duplicates and large files are picked by hand).
+        """
+        results = self.results
+        end = len(results) if results is not None else 0
+        if end <= self.known:
+            return
+        needed = (end + 7) >> 3
+        if len(self.bits) < needed:
+            self.bits.extend(bytes(needed - len(self.bits)))
+        review = {cat for cat, name in enumerate(results.categories) if name in results.REVIEW_CATEGORIES}
+        for i in range(self.known, end):
+            size = results.sizes[i]
+            cat = results.cat_ids[i]
+            self._add(self.totals_by_cat, cat, 1, size)
+            self.total_count += 1
+            self.total_bytes += size
+            self.total_allocated += results.allocs[i]
+            # Set or clear explicitly: the byte may hold bits from an earlier select_all
+            if cat in review:
+                self.bits[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+                continue
+            self.bits[i >> 3] |= 1 << (i & 7)
+            self._add(self.selected_by_cat, cat, 1, size)
+            self.count += 1
+            self.bytes += size
+        self.known = end
+
+    def _add(self, table, cat, count, size):
+        entry = table.get(cat)
+        if entry is None:
+            entry = table[cat] = [0, 0]
+        entry[0] += count
+        entry[1] += size
+
+    def is_selected(self, index):
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def set(self, index, selected):
+        """Selects or deselects one row in O(1)."""
+        if self.is_selected(index) == selected:
+            return
+        size = self.results.sizes[index]
+        cat = self.results.cat_ids[index]
+        if selected:
+            self.bits[index >> 3] |= 1 << (index & 7)
+            sign = 1
+        else:
+            self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+            sign = -1
+        self.count += sign
+        self.bytes += sign * size
+        self._add(self.selected_by_cat, cat, sign, sign * size)
+
+    def select_all(self):
+        """Selects every row seen so far; rows that arrive later are selected by sync()'s own rule."""
+        full, rest = divmod(self.known, 8)
+        bits = bytearray(len(self.bits))
+        bits[:full] = b"\xff" * full
+        if rest:
+            bits[full] = (1 << rest) - 1
+        self.bits[:] = bits
+        self.count = self.total_count
+        self.bytes = self.total_bytes
+        self.selected_by_cat = {cat: list(entry) for cat, entry in self.totals_by_cat.items()}
+
+    def deselect_all(self):
+        self.bits[:] = bytes(len(self.bits))
+        self.count = 0
+        self.bytes = 0
+        self.selected_by_cat = {}
+
+    def set_size(self, index, size, allocated=None):
+        """Changes a row's size in the store (e.g. estimate refinement) and keeps totals in step."""
+        delta = size - self.results.sizes[index]
+        self.results.sizes[index] = size
+        if allocated is not None:
+            self.total_allocated += allocated - self.results.allocs[index]
+            self.results.allocs[index] = allocated
+        cat = self.results.cat_ids[index]
+        self.total_bytes += delta
+        self._add(self.totals_by_cat, cat, 0, delta)
+        if self.is_selected(index):
+            self.bytes += delta
+            self._add(self.selected_by_cat, cat, 0, delta)
+
+    def selected_indices(self):
+        """Yields selected row indices, skipping empty bytes of the bitset."""
+        bits = self.bits
+        for byte_index in range(len(bits)):
+            byte = bits[byte_index]
+            if not byte:
+                continue
+            base = byte_index << 3
+            for bit in range(8):
+                if byte & (1 << bit) and base + bit < self.known:
+                    yield base + bit
+
+    def selected_items(self):
+        return [self.results[i] for i in self.selected_indices()]
+
+    def category_subtotals(self):
+        """Returns {category name: (selected count, selected bytes)} for categories with a selection."""
+        names = self.results.categories if self.results is not None else []
+        return {names[cat]: (entry[0], entry[1]) for cat, entry in self.selected_by_cat.items() if entry[0]}
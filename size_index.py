@@ -0,0 +1,124 @@
+import os
+import json
+import time
+import threading
+import logging
+from pathlib import Path
+
+
+class SizeIndex:
+    """
+    Persistent per-directory size cache.
+
+    Each directory is keyed by its path and validated by (st_dev, st_ino, st_mtime_ns).
+    A record stores the logical and allocated bytes of the directory's own files, its
+    multiply-linked files as [st_dev, st_ino, logical, allocated] (so a cached directory still
+    counts each inode once per scan) and the names of its sub-directories, so an unchanged
+    directory costs a single stat() instead of a full scandir() + stat() of every file.
+    Sub-directories are validated the same way, which means a change anywhere in the tree
+    only re-lists the directories that changed.
+
+    Rewriting a file in place does not touch its parent's mtime, so a record is only reused
+    for max_age_s seconds after its directory was last listed; after that a hit is treated as
+    a miss and the directory is listed again. save() only writes when records were added,
+    refreshed or evicted, so a scan answered entirely from the index does not rewrite the file.
+    """
+    VERSION = 3
+
+    def __init__(self, index_path, max_entries=500000, max_idle_scans=10, max_age_s=24 * 3600):
+        self.index_path = Path(index_path)
+        self.max_entries = max_entries
+        self.max_idle_scans = max_idle_scans
+        self.max_age_s = max_age_s
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.generation = 0
+        # path -> [dev, ino, mtime_ns, own_bytes, own_allocated, [links], [child dir names],
+        #          last_used_generation, listed_at (time.time())]
+        self.entries = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self):
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self.generation = data.get("generation", 0)
+                self.entries = data.get("entries", {})
+        except Exception as e:
+            self.logger.error(f"Failed to load size index: {e}")
+            self.entries = {}
+
+    def save(self):
+        """
+        Evicts stale records and writes the index atomically, unless nothing changed since the
+        last load or save. Skipping a hit-only scan also leaves its generation unrecorded, so
+        idle ages stay consistent with what is on disk.
+        """
+        with self._lock:
+            self._evict()
+            if not self.dirty:
+                return
+            data = {"version": self.VERSION, "generation": self.generation, "entries": self.entries}
+            tmp_path = self.index_path.with_suffix(".tmp")
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_path, self.index_path)
+                self.dirty = False
+            except Exception as e:
+                self.logger.error(f"Failed to save size index: {e}")
+
+    def begin_scan(self):
+        """Starts a new scan generation and resets the hit/miss counters."""
+        with self._lock:
+            self.generation += 1
+            self.hits = 0
+            self.misses = 0
+
+    def lookup(self, path_str, stamp):
+        """Returns (own_bytes, own_allocated, links, child_names) if the directory is unchanged, else None."""
+        with self._lock:
+            rec = self.entries.get(path_str)
+            if (rec is not None and rec[0] == stamp[0] and rec[1] == stamp[1] and rec[2] == stamp[2]
+                    and time.time() - rec[8] <= self.max_age_s):
+                rec[7] = self.generation
+                self.hits += 1
+                return rec[3], rec[4], rec[5], rec[6]
+            self.misses += 1
+            return None
+
+    def store(self, path_str, stamp, own_bytes, own_allocated, links, child_names):
+        with self._lock:
+            self.entries[path_str] = [stamp[0], stamp[1], stamp[2], own_bytes, own_allocated, links, child_names,
+                                      self.generation, time.time()]
+            self.dirty = True
+
+    def clear(self):
+        with self._lock:
+            self.entries = {}
+            self.dirty = True
+
+    def _evict(self):
+        """Drops records unused for max_idle_scans scans, then the least recently used above max_entries."""
+        oldest_allowed = self.generation - self.max_idle_scans
+        stale = [p for p, rec in self.entries.items() if rec[7] < oldest_allowed]
+        for p in stale:
+            del self.entries[p]
+        if stale:
+            self.dirty = True
+
+        overflow = len(self.entries) - self.max_entries
+        if overflow > 0:
+            by_age = sorted(self.entries.items(), key=lambda kv: kv[1][7])
+            for p, _ in by_age[:overflow]:
+                del self.entries[p]
+            self.dirty = True
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries)}
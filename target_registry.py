@@ -0,0 +1,159 @@
+import os
+import re
+import json
+import string
+import fnmatch
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class TargetSpec:
+    """
+    One cleanable location, defined as data:
+      name           category name shown in results (e.g. "TEMP", "PIP_CACHE")
+      root           path template; {VAR} is replaced from the environment (plus HOME and the
+                     SystemRoot default; case-insensitive on Windows), e.g. "{LOCALAPPDATA}/pip/cache"
+      include        globs for top-level entries that are reported (default: everything)
+      exclude        globs that are never reported (checked before include)
+      min_age_hours  overrides grace_period_hours for this target (None = use the global value)
+      admin          only scanned when running elevated
+      enabled        custom targets are scanned unless this is False; built-ins follow `targets`
+    """
+    __slots__ = ('name', 'root', 'include', 'exclude', 'min_age_hours', 'admin', 'enabled', 'source')
+
+    def __init__(self, name, root, include=None, exclude=None, min_age_hours=None, admin=False,
+                 enabled=True, source="builtin"):
+        self.name = name
+        self.root = root
+        self.include = list(include or ["*"])
+        self.exclude = list(exclude or [])
+        self.min_age_hours = min_age_hours
+        self.admin = admin
+        self.enabled = enabled
+        self.source = source
+
+    @classmethod
+    def from_dict(cls, data, source):
+        if not data.get('name') or not data.get('root'):
+            raise ValueError("a target needs 'name' and 'root'")
+        return cls(data['name'], data['root'], data.get('include'), data.get('exclude'),
+                   data.get('min_age_hours'), bool(data.get('admin', False)),
+                   bool(data.get('enabled', True)), source)
+
+    def resolve(self, env, fold_case=False):
+        """
+        Expands the root template; None if a variable it needs is not set. With fold_case (Windows,
+        where variable names are case-insensitive) `env` has upper-case keys and fields are looked up
+        upper-cased, so {SystemRoot} finds SYSTEMROOT.
+        """
+        fields = [f for _, f, _, _ in string.Formatter().parse(self.root) if f]
+        values = {f: env.get(f.upper() if fold_case else f) for f in fields}
+        if not all(values.values()):
+            return None
+        return Path(self.root.format_map(values))
+
+
+BUILTIN_TARGETS = [
+    TargetSpec("TEMP", "{TEMP}"),
+    TargetSpec("SYSTEM_TEMP", "{SystemRoot}/Temp"),
+    TargetSpec("PREFETCH", "{SystemRoot}/Prefetch", admin=True),
+    TargetSpec("DISCORD", "{APPDATA}/discord/Cache"),
+    TargetSpec("SPOTIFY", "{LOCALAPPDATA}/Spotify/PersistentCache"),
+]
+
+
+class TargetMatcher:
+    """
+    Every target's include/exclude globs and the global whitelist, compiled into one regex.
+    Names are matched as "<target index>\\0<entry name>"; exclude alternatives come first, so
+    classifying an entry is a single fullmatch regardless of how many patterns exist.
+    """
+    def __init__(self, specs, whitelist):
+        flags = re.IGNORECASE if os.name == "nt" else 0
+        self._protected = re.compile("|".join(fnmatch.translate(n) for n in whitelist) or r"(?!)", flags)
+        prefix = r"\d+\x00"
+        excludes = [prefix + f"(?:{self._alternation(whitelist)})"] if whitelist else []
+        includes = []
+        for i, spec in enumerate(specs):
+            if spec.exclude:
+                excludes.append(f"{i}\\x00(?:{self._alternation(spec.exclude)})")
+            includes.append(f"{i}\\x00(?:{self._alternation(spec.include)})")
+        self._regex = re.compile(f"(?P<ex>{'|'.join(excludes) or '(?!)'})|(?P<inc>{'|'.join(includes) or '(?!)'})",
+                                 flags | re.DOTALL)
+
+    @staticmethod
+    def _alternation(globs):
+        # fnmatch.translate gives "(?s:...)\Z"; fullmatch makes the anchor redundant
+        return "|".join(fnmatch.translate(g)[:-2] for g in globs)
+
+    def matches(self, index, name):
+        """True if entry `name` directly under target `index` should be reported."""
+        m = self._regex.fullmatch(f"{index}\x00{name}")
+        return m is not None and m.lastgroup == "inc"
+
+    def protected(self, name):
+        """True if `name` is on the whitelist (never cleaned, whatever target it came from)."""
+        return self._protected.fullmatch(name) is not None
+
+
+class TargetRegistry:
+    """
+    Built-in targets plus custom ones from config (`custom_targets`) and plugin files
+    (`targets.d/*.json` next to config.json; each holds one target object or a list).
+    A custom target with a built-in's name replaces it.
+    """
+    def __init__(self, config, whitelist, plugin_dir=None):
+        self.config = config
+        specs = {spec.name: spec for spec in BUILTIN_TARGETS}
+        for spec in self._load_custom(plugin_dir):
+            specs[spec.name] = spec
+        self.specs = list(specs.values())
+        self._index = {spec.name: i for i, spec in enumerate(self.specs)}
+        self.matcher = TargetMatcher(self.specs, list(whitelist) + list(config.get("whitelist", [])))
+
+    def _load_custom(self, plugin_dir):
+        sources = [("config", entry) for entry in self.config.get("custom_targets", [])]
+        if plugin_dir is not None and Path(plugin_dir).is_dir():
+            for path in sorted(Path(plugin_dir).glob("*.json")):
+                try:
+                    with open(path, "r") as f:
+                        data = json.load(f)
+                except Exception as e:
+                    logger.error(f"Failed to load target plugin {path.name}: {e}")
+                    continue
+                sources.extend((path.name, entry) for entry in (data if isinstance(data, list) else [data]))
+        specs = []
+        for source, entry in sources:
+            try:
+                specs.append(TargetSpec.from_dict(entry, source))
+            except (ValueError, AttributeError, TypeError) as e:
+                logger.error(f"Ignoring target from {source}: {e}")
+        return specs
+
+    def get(self, name):
+        i = self._index.get(name)
+        return None if i is None else self.specs[i]
+
+    def index_of(self, name):
+        return self._index.get(name)
+
+    def active(self, is_admin):
+        """(spec, root Path) for every enabled target whose root exists, in `targets` order then custom order."""
+        fold_case = os.name == "nt"
+        # os.environ upper-cases its keys on Windows; fold the defaults' names the same way
+        env = {key.upper(): value for key, value in os.environ.items()} if fold_case else dict(os.environ)
+        env.setdefault("SYSTEMROOT" if fold_case else "SystemRoot", "C:\\Windows")
+        env.setdefault("HOME", str(Path.home()))
+        wanted = list(self.config.get("targets", []))
+        wanted += [s.name for s in self.specs if s.source != "builtin" and s.enabled and s.name not in wanted]
+        found = []
+        for name in wanted:
+            spec = self.get(name)
+            if spec is None or (spec.admin and not is_admin):
+                continue
+            root = spec.resolve(env, fold_case)
+            if root is not None and root.exists():
+                found.append((spec, root))
+        return found
@@ -0,0 +1,68 @@
+import os
+import json
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class TraceRecorder:
+    """
+    Collects Chrome/Perfetto trace events (https://ui.perfetto.dev, chrome://tracing).
+
+    Timestamps are time.perf_counter() values, converted to microseconds since the recorder
+    was created. Thread ids are small integers chosen by the caller (0 = the calling thread of
+    scan/clean, 1.. = walker workers, 100.. = clean lanes) and named with name_thread().
+    list.append is atomic, so workers can record without taking a lock.
+    """
+    MAIN_TID = 0
+
+    def __init__(self, min_span_s=0.05, merge_gap_s=0.001):
+        self.min_span_s = min_span_s    # Item spans shorter than this are not recorded
+        self.merge_gap_s = merge_gap_s  # Worker activity with smaller idle gaps is merged into one span
+        self.pid = os.getpid()
+        self.t0 = time.perf_counter()
+        self.events = []
+        self._named = set()
+        self._lock = threading.Lock()
+        self.name_thread(self.MAIN_TID, "engine")
+
+    def _us(self, t):
+        return round((t - self.t0) * 1e6, 1)
+
+    def name_thread(self, tid, name):
+        with self._lock:
+            if tid in self._named:
+                return
+            self._named.add(tid)
+        self.events.append({'ph': "M", 'name': "thread_name", 'pid': self.pid, 'tid': tid, 'args': {'name': name}})
+
+    def complete(self, name, cat, start, end, tid=MAIN_TID, args=None):
+        """A span on one thread (phase 'X')."""
+        event = {'ph': "X", 'name': name, 'cat': cat, 'pid': self.pid, 'tid': tid,
+                 'ts': self._us(start), 'dur': round((end - start) * 1e6, 1)}
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    def async_span(self, name, cat, start, end, span_id, args=None):
+        """A span that is not tied to one thread, e.g. an item sized by several workers (phases 'b'/'e')."""
+        begin = {'ph': "b", 'name': name, 'cat': cat, 'pid': self.pid, 'tid': self.MAIN_TID,
+                 'id': str(span_id), 'ts': self._us(start)}
+        if args:
+            begin['args'] = args
+        self.events.append(begin)
+        self.events.append({'ph': "e", 'name': name, 'cat': cat, 'pid': self.pid, 'tid': self.MAIN_TID,
+                            'id': str(span_id), 'ts': self._us(end)})
+
+    def save(self, path):
+        """Writes the trace as JSON; returns the path, or None on failure."""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "w") as f:
+                json.dump({'traceEvents': self.events, 'displayTimeUnit': "ms"}, f)
+            return path
+        except Exception as e:
+            logger.error(f"Failed to write trace {path}: {e}")
+            return None
@@ -0,0 +1,728 @@
+import os
+import math
+import stat
+import time
+import random
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from prune_rules import IGNORE_FILE
+from ecosystems import EcosystemDetector
+from scan_stats import ScanStats, GroupStats
+
+logger = logging.getLogger(__name__)
+
+# Task kinds handled by the walker
+SIZE = 0   # Sum every byte below a directory
+HUNT = 1   # Look for dev-bloat folders (depth limited), sizing each hit in the same pass
+
+# Clock checks inside a directory listing happen once per this many entries
+CHECK_EVERY = 256
+
+# z-score for the 95% confidence interval reported by estimate mode
+Z_95 = 1.96
+
+# st_blocks (512-byte units actually allocated) is POSIX only; elsewhere allocated = logical size
+HAS_BLOCKS = hasattr(os.stat_result, "st_blocks")
+
+
+def allocated_bytes(st):
+    """Bytes a file occupies on disk: less than st_size when sparse or compressed, more when it has slack."""
+    return st.st_blocks * 512 if HAS_BLOCKS else st.st_size
+
+
+def default_workers():
+    """Directory listing is I/O bound, so use more threads than cores (same rule as ThreadPoolExecutor)."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class CancelToken:
+    """Cooperative stop flag shared by every scan worker, with an optional global deadline."""
+    __slots__ = ('cancelled', 'reason', 'deadline')
+
+    def __init__(self, deadline_s=None):
+        self.cancelled = False
+        self.reason = None
+        self.deadline = time.monotonic() + deadline_s if deadline_s else None
+
+    def cancel(self, reason="cancelled"):
+        if not self.cancelled:
+            self.reason = reason
+            self.cancelled = True
+
+    def stopped(self):
+        """Returns True once cancelled or past the deadline (uses the monotonic clock)."""
+        if self.cancelled:
+            return True
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self.cancel("deadline")
+            return True
+        return False
+
+
+class WalkItem:
+    """A result being accumulated by the walker (one top-level item or one bloat folder)."""
+    __slots__ = ('path', 'category', 'group', 'size', 'allocated', 'pending', 'complete', 'deadline',
+                 'started', 'parent', 'is_sample', 'samples', 'sample_allocated', 'population', 'error',
+                 'estimated')
+
+    def __init__(self, path, category, parent=None, group=None, is_sample=False):
+        self.path = path
+        self.category = category
+        self.group = group    # ScanStats group the item's work is counted under
+        self.size = 0         # Logical bytes (st_size), each hardlinked inode counted once per scan
+        self.allocated = 0    # Bytes on disk (st_blocks), what deleting the item actually frees
+        self.pending = 0      # Outstanding tasks (and sample items); the item is final when this drops to 0
+        self.complete = True
+        self.deadline = None  # Starts when the first directory of the item is listed
+        self.started = None   # perf_counter() at that moment (for trace spans)
+        self.parent = parent  # Estimate mode only: the item a sample or a nested estimate folds into
+        self.is_sample = is_sample  # True: size joins parent.samples; False: size adds to parent.size
+        self.samples = None   # Sampled sub-directory sizes when the item is estimated
+        self.sample_allocated = 0  # Allocated bytes of those samples, summed
+        self.population = 0   # Number of sub-directories the samples were drawn from
+        self.error = 0        # Half-width of the 95% confidence interval, in bytes
+        self.estimated = False
+
+    def apply_estimate(self):
+        """
+        Extrapolates size = walked bytes + population * mean(sample) with a 95% confidence interval,
+        combined with the intervals of estimates already folded in (independent errors add in quadrature).
+        """
+        n = len(self.samples)
+        k = self.population
+        mean = sum(self.samples) / n
+        variance = sum((s - mean) ** 2 for s in self.samples) / (n - 1) if n > 1 else 0.0
+        # Finite population correction: sampling most of the children leaves little uncertainty
+        fpc = math.sqrt((k - n) / (k - 1)) if k > 1 else 0.0
+        self.size += int(k * mean)
+        self.allocated += int(k * self.sample_allocated / n)
+        self.error = int(math.hypot(self.error, Z_95 * k * math.sqrt(variance / n) * fpc))
+        self.estimated = True
+
+    def to_result(self):
+        # 'partial' marks sizes cut short by a timeout, cancellation or the scan deadline;
+        # 'estimated' sizes are extrapolated from a sample and are accurate to +/- size_error
+        return {'path': Path(self.path), 'size': self.size, 'allocated': self.allocated,
+                'category': self.category, 'partial': not self.complete,
+                'estimated': self.estimated, 'size_error': self.error}
+
+
+class TreeWalker:
+    """
+    Single-pass, work-stealing traversal engine shared by category scans and the Dev-Bloat Hunter.
+
+    Every directory is a (kind, dir_path, arg, depth) task (arg: the WalkItem for SIZE tasks,
+    (max_depth, stats group, PruneRules or None, EcosystemDetector, bloat age) for HUNT tasks). Each worker owns a deque: it pushes
+    and pops its own tasks LIFO (depth-first, cache friendly) and, when it runs dry, steals the
+    oldest task from another worker, which is usually the root of a large untouched subtree.
+    One huge folder is therefore spread over all workers instead of pinning a single thread.
+
+    When a task finishes, its bytes are reduced into the owning item and the item's outstanding
+    task count is updated; an item whose count reaches zero is final and is handed to `on_item`
+    straight away, so callers can stream results while the rest of the walk continues.
+    Once the CancelToken trips, remaining tasks are drained without touching the disk and the
+    affected items are reported with partial=True.
+
+    In estimate mode (estimate_samples > 0) any directory with many sub-directories, at any depth,
+    only walks a random sample of them; each sample is a hidden child item, and once all samples
+    are final the directory's subtree is extrapolated. Estimates below an item's root fold into
+    the item, which is reported with estimated=True and a size_error combining them all.
+    HUNT tasks schedule SIZE tasks for the bloat folders they discover, so each directory is
+    listed exactly once. A folder is bloat only when its listing shows a project marker of an
+    ecosystem that regenerates it (package.json next to node_modules, Cargo.toml next to target,
+    ...), and stale when the newest of the project's source and lock files in that same listing is
+    older than the bloat age. Callables in `file_sinks` receive (path, lstat result) for every file
+    a hunt lists, so other finders (duplicates, ...) ride on the same traversal. While there are
+    sinks, the hunt also goes below max_depth and into HUNT_IGNORE and dot folders, listing them
+    for the sinks only (no bloat detection there; SINK_IGNORE is skipped). Directories
+    excluded by a hunt's PruneRules (config patterns and .cleanerignore files, gitignore semantics)
+    are skipped before they are ever opened. There is no recursion, so deep trees cannot hit the
+    recursion limit.
+
+    Sizes are reported twice: logical bytes (st_size) and allocated bytes (st_blocks, or st_size
+    where the platform has no block count), which is what deleting sparse or compressed files
+    really frees. A file with several hardlinks is counted once per scan, by the first task that
+    reaches one of its links (a seen-set of (st_dev, st_ino) holding only multiply-linked files).
+    A directory already listed by a task of the same kind is not entered again, so junction and
+    bind-mount loops and overlapping roots neither hang the walk nor double the totals.
+
+    Work is counted per category / search path in `stats` (a ScanStats): directories, entries,
+    stat calls, permission errors, timeouts, size-index hits, revisited directories, hardlinks
+    already counted, time, and per-worker busy time.
+    With an IOGovernor, directory listings and stat calls are paced by its token buckets and the
+    time spent waiting is counted per group as throttled_s.
+    With a TraceRecorder, each worker's activity is recorded as spans (consecutive tasks of one
+    group merged) and items that took at least tracer.min_span_s to size get their own span.
+    """
+    BLOAT_NAMES = frozenset(["node_modules", "venv", ".venv"])  # Legacy find_bloat_recursive only
+    # Folders to completely ignore to save time (Updated to allow traversing User/Documents/Desktop)
+    HUNT_IGNORE = frozenset(["AppData", "Pictures", "Music", "Videos",
+                             ".git", ".vscode", "node_modules", "venv", ".venv"])
+    # What file sinks skip: version-control internals and installed dependency trees, not user files
+    SINK_IGNORE = frozenset([".git", ".hg", ".svn", "node_modules", "venv", ".venv", "__pycache__"])
+    BLOAT_AGE = 30 * 24 * 3600
+
+    def __init__(self, size_index=None, timeout=5, workers=1, on_item=None, cancel_token=None,
+                 estimate_samples=0, tracer=None, governor=None, dedupe_links=True, link_probe_min=0):
+        """
+        workers=0 picks default_workers(). on_item(result_dict) is called from worker threads.
+        timeout is a per-item budget in seconds; cancel_token adds a scan-wide stop/deadline.
+        estimate_samples > 0 enables estimate mode with that many sampled sub-directories per item.
+        tracer (a trace_events.TraceRecorder) records worker timelines and slow items.
+        governor (an io_governor.IOGovernor) caps directory reads and stat calls per second.
+        dedupe_links counts a hardlinked file once per scan however many links reach it; on Windows,
+        where listings carry no link count, that costs one extra stat() per file, so only files of
+        at least link_probe_min bytes are checked there (smaller ones count once per link).
+        """
+        self.tracer = tracer
+        self.governor = governor
+        self.size_index = size_index
+        self.timeout = timeout
+        self.estimate_samples = estimate_samples
+        self.cancel_token = cancel_token or CancelToken()
+        self.skipped_hunts = 0  # HUNT tasks dropped because the scan was stopped
+        self.stats = ScanStats()
+        self.workers = workers if workers > 0 else default_workers()
+        self.on_item = on_item
+        self.items = []
+        self.file_sinks = []  # f(path, st) per file seen by HUNT tasks; called from worker threads
+        self.dedupe_links = dedupe_links
+        self.link_probe_min = link_probe_min
+        # Identities are (st_dev, st_ino) tuples: ReFS file IDs are 128-bit, so they cannot be packed into a shift
+        self._seen_files = set()          # Multiply-linked files already counted
+        self._seen_dirs = (set(), set())  # Directories already listed, per task kind (SIZE, HUNT)
+        self._seen_lock = threading.Lock()
+        self._initial = []
+        self._ready = []  # Items that needed no walking (files, unreadable entries)
+        self._now = time.time()
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)  # Idle workers park here until tasks are pushed or the walk ends
+        self._idle = 0
+        self._pending = 0
+
+    def add_item(self, path, category, st=None, group=None):
+        """
+        Schedules a file or directory to be sized as one result. `st` may be a cached lstat() result.
+        Its work is counted under `group` in stats (default: the category).
+        """
+        path_str = str(path)
+        group = group or category or "items"
+        item = WalkItem(path_str, category, group=group)
+        self.items.append(item)
+        stats = self.stats.group(group)
+        try:
+            if st is None:
+                stats.stat_calls += 1
+                st = os.stat(path_str, follow_symlinks=False)
+            if stat.S_ISDIR(st.st_mode):
+                item.pending = 1
+                self._initial.append((SIZE, path_str, item, 0))
+            elif self.dedupe_links and st.st_nlink != 1:
+                size, allocated, links = self._split_links([(path_str, st)], stats)
+                linked_size, linked_allocated = self._claim_links(links, stats)
+                item.size = size + linked_size
+                item.allocated = allocated + linked_allocated
+            else:
+                item.size = st.st_size
+                item.allocated = allocated_bytes(st)
+        except OSError:
+            pass
+        if item.pending == 0:
+            self._ready.append(item)
+        return item
+
+    def add_hunt(self, root, max_depth, group=None, rules=None, detector=None, bloat_age=None, bloat=True):
+        """
+        Schedules a Dev-Bloat search below `root` (root itself is depth 1), counted under `group`.
+        `rules` (prune_rules.PruneRules) excludes directories, and .cleanerignore files found on the way
+        down add to it; None disables pruning. `detector` (ecosystems.EcosystemDetector, default: the
+        built-in ecosystems) decides what is bloat; projects untouched for `bloat_age` seconds are stale.
+        bloat=False walks for file_sinks only (at any depth) and reports no DEV-BLOAT items.
+        """
+        group = group or str(root)
+        self.stats.group(group, "search")
+        if bloat:
+            detector = detector or EcosystemDetector()
+        else:
+            detector = None
+        hunt = (max_depth, group, rules, detector,
+                self.BLOAT_AGE if bloat_age is None else bloat_age)
+        self._initial.append((HUNT, str(root), hunt, 1))
+
+    def run(self):
+        """Walks every scheduled task and returns result dicts for every item."""
+        tasks, self._initial = self._initial, []
+        ready, self._ready = self._ready, []
+        if self.on_item:
+            for item in ready:
+                self.on_item(item.to_result())
+
+        self._pending = len(tasks)
+        walk_start = time.perf_counter()
+        if self.workers == 1:
+            self._worker(0, [deque(tasks)])
+        else:
+            queues = [deque() for _ in range(self.workers)]
+            for i, task in enumerate(tasks):
+                queues[i % self.workers].append(task)
+            threads = [
+                threading.Thread(target=self._worker, args=(i, queues), daemon=True)
+                for i in range(self.workers)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.stats.walk_s += time.perf_counter() - walk_start
+
+        return [item.to_result() for item in self.items]
+
+    def _worker(self, index, queues):
+        own = queues[index]
+        victims = [q for i, q in enumerate(queues) if i != index]
+        children = []
+        local = {}  # Private GroupStats, merged into self.stats when the worker exits
+        busy = 0.0
+        clock = time.perf_counter
+        tracer = self.tracer
+        tid = index + 1
+        span = None  # [group, start, end] of the worker's current run of work on one group
+        if tracer is not None:
+            tracer.name_thread(tid, f"walker-{index}")
+        while True:
+            try:
+                task = own.pop()
+            except IndexError:
+                task = self._steal(victims) or self._park(victims)
+                if task is None:
+                    if span is not None:
+                        tracer.complete(span[0], "walk", span[1], span[2], tid)
+                    with self._lock:
+                        self.stats.merge_groups(local)
+                        self.stats.worker_busy.append(busy)
+                    return
+
+            group = task[2].group if task[0] == SIZE else task[2][1]
+            gs = local.get(group)
+            if gs is None:
+                gs = local[group] = GroupStats(group, self.stats.group(group).kind)
+            size = allocated = 0
+            start = clock()
+            try:
+                size, allocated = self._process(task, children, gs)
+            except Exception as e:
+                logger.debug(f"Walker task failed at {task[1]}: {e}")
+            end = clock()
+            gs.mark(start, end)
+            busy += end - start
+            if tracer is not None:
+                if span is not None and span[0] == group and start - span[2] < tracer.merge_gap_s:
+                    span[2] = end
+                else:
+                    if span is not None:
+                        tracer.complete(span[0], "walk", span[1], span[2], tid)
+                    span = [group, start, end]
+
+            # Count children before publishing them, so pending never reads 0 while work remains
+            done = None
+            with self._lock:
+                self._pending += len(children) - 1
+                for child in children:
+                    if child[0] == SIZE:
+                        child[2].pending += 1
+                if task[0] == SIZE:
+                    item = task[2]
+                    item.size += size
+                    item.allocated += allocated
+                    item.pending -= 1
+                    done = self._settle(item)
+                if self._pending == 0:
+                    self._work.notify_all()
+            if children:
+                own.extend(children)
+                # A parking worker registers as idle before its last steal attempt, so this cannot miss it
+                if self._idle:
+                    with self._work:
+                        self._work.notify(len(children))
+                children.clear()
+            if done is not None:
+                if tracer is not None and done.started is not None and end - done.started >= tracer.min_span_s:
+                    tracer.async_span(os.path.basename(done.path), "item", done.started, end, id(done),
+                                      {'path': done.path, 'bytes': done.size, 'group': done.group})
+                if self.on_item:
+                    self.on_item(done.to_result())
+
+    def _settle(self, item):
+        """
+        Called under the lock after an item's count changed. Extrapolates finished estimates, folds
+        finished sample items and nested estimates into their parent and returns the top-level item
+        if it just became final, else None.
+        """
+        while item.pending == 0:
+            if item.samples is not None:
+                item.apply_estimate()
+            parent = item.parent
+            if parent is None:
+                return item
+            if item.is_sample:
+                parent.samples.append(item.size)
+                parent.sample_allocated += item.allocated
+            else:
+                parent.size += item.size
+                parent.allocated += item.allocated
+                parent.error = int(math.hypot(parent.error, item.error))
+                parent.estimated = True
+            parent.complete = parent.complete and item.complete
+            parent.pending -= 1
+            item = parent
+        return None
+
+    def _park(self, victims):
+        """
+        Blocks an idle worker until it can steal a task (returned) or the walk is over (None),
+        instead of polling: spinning threads would compete with the busy ones for the GIL.
+        """
+        with self._work:
+            self._idle += 1
+            try:
+                while True:
+                    task = self._steal(victims)
+                    if task is not None or self._pending == 0:
+                        return task
+                    self._work.wait()
+            finally:
+                self._idle -= 1
+
+    def _steal(self, victims):
+        """Takes the oldest task from the first non-empty victim, starting at a random one."""
+        count = len(victims)
+        if not count:
+            return None
+        start = random.randrange(count)
+        for i in range(count):
+            try:
+                return victims[(start + i) % count].popleft()
+            except IndexError:
+                continue
+        return None
+
+    def _process(self, task, push_to, gs):
+        """
+        Runs one task, appending follow-up tasks to push_to and counting into gs.
+        Returns (logical bytes, allocated bytes) for SIZE tasks.
+        """
+        kind, path_str, arg, depth = task
+        if kind == SIZE:
+            return self._size_dir(path_str, arg, push_to, gs)
+        self._hunt_dir(path_str, arg, depth, push_to, gs)
+        return 0, 0
+
+    def _first_visit(self, kind, st, gs):
+        """
+        Claims a directory for this scan. False (counted as a revisit) if a task of the same kind
+        already listed it: a junction or bind mount loop, or roots that overlap.
+        """
+        if not st.st_ino:
+            return True  # No usable identity on this filesystem
+        key = (st.st_dev, st.st_ino)
+        seen = self._seen_dirs[kind]
+        with self._seen_lock:
+            if key in seen:
+                gs.revisits += 1
+                return False
+            seen.add(key)
+        return True
+
+    def _split_links(self, files, gs):
+        """
+        Splits (path, st) pairs whose link count was not 1 into plain bytes and multiply-linked inodes.
+        Returns (logical, allocated, [[st_dev, st_ino, logical, allocated], ...]). DirEntry.stat()
+        leaves st_nlink at 0 on Windows, so those files are stat()ed once more to learn it, unless
+        they are smaller than link_probe_min.
+        """
+        size = allocated = 0
+        links = []
+        probes = 0
+        probe_min = self.link_probe_min
+        for path, st in files:
+            if not st.st_nlink:
+                if st.st_size < probe_min:
+                    size += st.st_size
+                    allocated += allocated_bytes(st)
+                    continue
+                probes += 1
+                try:
+                    st = os.stat(path, follow_symlinks=False)
+                except OSError:
+                    continue
+            if st.st_nlink > 1 and st.st_ino:
+                links.append([st.st_dev, st.st_ino, st.st_size, allocated_bytes(st)])
+            else:
+                size += st.st_size
+                allocated += allocated_bytes(st)
+        if probes:
+            gs.stat_calls += probes
+            if self.governor is not None:
+                gs.throttled_s += self.governor.stat(probes, self.cancel_token.stopped)
+        return size, allocated, links
+
+    def _claim_links(self, links, gs):
+        """Bytes of the inodes in `links` that no earlier link in this scan has counted yet."""
+        size = allocated = 0
+        seen = self._seen_files
+        with self._seen_lock:
+            for dev, ino, link_size, link_allocated in links:
+                key = (dev, ino)
+                if key in seen:
+                    gs.links += 1
+                    continue
+                seen.add(key)
+                size += link_size
+                allocated += link_allocated
+        return size, allocated
+
+    def _timed_out(self, item, gs):
+        """Marks item partial; counts it as a timeout the first time its own deadline (not the token) is hit."""
+        if item.complete and not self.cancel_token.cancelled:
+            gs.timeouts += 1
+        item.complete = False
+
+    def _size_dir(self, path_str, item, push_to, gs):
+        token = self.cancel_token
+        now = time.monotonic()
+        if item.deadline is None:
+            item.deadline = now + self.timeout
+            item.started = time.perf_counter()
+        if now > item.deadline or token.stopped():
+            self._timed_out(item, gs)
+            return 0, 0
+
+        index = self.size_index
+        governor = self.governor
+        # The directory's identity both guards against walking it twice and validates the size index
+        gs.stat_calls += 1
+        if governor is not None:
+            gs.throttled_s += governor.stat(1, token.stopped)
+        try:
+            st = os.stat(path_str)
+        except PermissionError:
+            gs.permission_errors += 1
+            return 0, 0
+        except OSError:
+            return 0, 0
+        if not self._first_visit(SIZE, st, gs):
+            return 0, 0
+        stamp = (st.st_dev, st.st_ino, st.st_mtime_ns)
+        if index is not None:
+            cached = index.lookup(path_str, stamp)
+            if cached is not None:
+                gs.cached_dirs += 1
+                own_bytes, own_allocated, links, child_names = cached
+                linked_bytes, linked_allocated = self._claim_links(links, gs) if links else (0, 0)
+                self._push_children(path_str, item, child_names, push_to)
+                return own_bytes + linked_bytes, own_allocated + linked_allocated
+
+        own_bytes = 0
+        own_allocated = 0
+        child_names = []
+        linked = []  # (path, st) of files that may have other links
+        dedupe = self.dedupe_links
+        n = -1
+        files = 0
+        denied = 0
+        if governor is not None:
+            gs.throttled_s += governor.dir_read(token.stopped)
+        try:
+            with os.scandir(path_str) as it:
+                gs.dirs += 1
+                for n, entry in enumerate(it):
+                    # Huge flat directories can still hit a deadline part-way through
+                    if n % CHECK_EVERY == CHECK_EVERY - 1 and (time.monotonic() > item.deadline or token.stopped()):
+                        self._timed_out(item, gs)
+                        return own_bytes, own_allocated
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            files += 1
+                            st = entry.stat()
+                            if dedupe and st.st_nlink != 1:
+                                linked.append((entry.path, st))
+                            else:
+                                own_bytes += st.st_size
+                                own_allocated += st.st_blocks * 512 if HAS_BLOCKS else st.st_size
+                        elif entry.is_dir(follow_symlinks=False):
+                            child_names.append(entry.name)
+                    except PermissionError:
+                        denied += 1
+                    except FileNotFoundError:
+                        continue
+        except PermissionError:
+            gs.permission_errors += 1
+            return 0, 0
+        except FileNotFoundError:
+            return 0, 0
+        finally:
+            gs.entries += n + 1
+            gs.stat_calls += files
+            gs.permission_errors += denied
+
+        if governor is not None:
+            # Charged after the listing: per-entry acquire() calls would cost more than the stats
+            gs.throttled_s += governor.stat(files, token.stopped)
+        links = []
+        if linked:
+            size, allocated, links = self._split_links(linked, gs)
+            own_bytes += size
+            own_allocated += allocated
+        if index is not None:
+            index.store(path_str, stamp, own_bytes, own_allocated, links, child_names)
+        self._push_children(path_str, item, child_names, push_to)
+        if links:
+            linked_bytes, linked_allocated = self._claim_links(links, gs)
+            return own_bytes + linked_bytes, own_allocated + linked_allocated
+        return own_bytes, own_allocated
+
+    def _push_children(self, path_str, item, child_names, push_to):
+        """
+        Schedules sub-directories. In estimate mode any directory with many children, at any depth,
+        only gets a sample: at an item's root the item itself is extrapolated, deeper down a hidden
+        node extrapolates that subtree and adds it to the item.
+        """
+        n = self.estimate_samples
+        if n and len(child_names) > 2 * n:
+            if path_str == item.path and item.samples is None:
+                # Safe outside the lock: nothing else can touch this item until its root task settles
+                node = item
+            else:
+                node = WalkItem(path_str, None, parent=item, group=item.group)
+                with self._lock:
+                    item.pending += 1  # Other tasks of the item may be settling concurrently
+            # Seeded per path so repeated scans of an unchanged folder give the same estimate
+            sample = random.Random(path_str).sample(child_names, n)
+            node.samples = []
+            node.population = len(child_names)
+            node.pending += n
+            for name in sample:
+                child_path = os.path.join(path_str, name)
+                push_to.append((SIZE, child_path,
+                                WalkItem(child_path, None, parent=node, group=item.group, is_sample=True), 0))
+            return
+        for name in child_names:
+            push_to.append((SIZE, os.path.join(path_str, name), item, 0))
+
+    def _project_age(self, files, detector, gs, stats=None):
+        """
+        Seconds since the newest source/lock file of a project listing changed. `stats` (from
+        _feed_sinks, aligned with `files`) are reused as is; without them only the sources are stat()ed.
+        """
+        if stats is not None:
+            mtimes = [st.st_mtime for entry, st in zip(files, stats)
+                      if st is not None and detector.is_source(entry.name)]
+        else:
+            sources = [entry for entry in files if detector.is_source(entry.name)]
+            gs.stat_calls += len(sources)
+            if self.governor is not None:
+                gs.throttled_s += self.governor.stat(len(sources), self.cancel_token.stopped)
+            mtimes = []
+            for entry in sources:
+                try:
+                    mtimes.append(entry.stat(follow_symlinks=False).st_mtime)
+                except PermissionError:
+                    gs.permission_errors += 1
+                except OSError:
+                    continue
+        return self._now - max(mtimes) if mtimes else -math.inf
+
+    def _feed_sinks(self, files, gs):
+        """
+        lstat()s every listed file once (DirEntry caches it) and hands it to each file sink.
+        Returns the stat results aligned with `files` (None where the stat failed).
+        """
+        gs.stat_calls += len(files)
+        if self.governor is not None:
+            gs.throttled_s += self.governor.stat(len(files), self.cancel_token.stopped)
+        sinks = self.file_sinks
+        stats = []
+        for entry in files:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except PermissionError:
+                gs.permission_errors += 1
+                stats.append(None)
+                continue
+            except OSError:
+                stats.append(None)
+                continue
+            stats.append(st)
+            for sink in sinks:
+                sink(entry.path, st)
+        return stats
+
+    def _hunt_dir(self, path_str, hunt, depth, push_to, gs):
+        max_depth, group, rules, detector, bloat_age = hunt
+        if detector is not None and depth > max_depth:
+            if not self.file_sinks:
+                return
+            # Past the bloat depth the listing only feeds the file sinks
+            detector = None
+            hunt = (max_depth, group, rules, None, bloat_age)
+        if self.cancel_token.stopped():
+            with self._lock:
+                self.skipped_hunts += 1
+            return
+        governor = self.governor
+        try:
+            gs.stat_calls += 1
+            if governor is not None:
+                gs.throttled_s += governor.stat(1, self.cancel_token.stopped)
+            if not self._first_visit(HUNT, os.stat(path_str), gs):
+                return
+            if governor is not None:
+                gs.throttled_s += governor.dir_read(self.cancel_token.stopped)
+            with os.scandir(path_str) as it:
+                gs.dirs += 1
+                entries = list(it)
+            gs.entries += len(entries)
+            if rules is not None and any(entry.name == IGNORE_FILE for entry in entries):
+                # Rules of this directory's .cleanerignore apply to everything below it
+                subtree_rules = rules.with_ignore_file(path_str)
+                if subtree_rules is not rules:
+                    rules = subtree_rules
+                    hunt = (max_depth, group, rules, detector, bloat_age)
+            dirs = []
+            files = []
+            for entry in entries:
+                try:
+                    (dirs if entry.is_dir(follow_symlinks=False) else files).append(entry)
+                except OSError:
+                    continue
+            sinks = bool(self.file_sinks)
+            stats = self._feed_sinks(files, gs) if sinks and files else None
+            project = detector.detect([entry.name for entry in files]) if files and detector else None
+            stale = project is not None and self._project_age(files, detector, gs, stats) > bloat_age
+            sink_hunt = hunt if detector is None else (max_depth, group, rules, None, bloat_age)
+            for entry in dirs:
+                name = entry.name
+                if rules and rules.excluded(entry.path, name):
+                    gs.pruned += 1
+                    continue
+                if project is not None and project.is_bloat(name):
+                    if stale:
+                        item = WalkItem(entry.path, 'DEV-BLOAT', group=group)
+                        with self._lock:
+                            self.items.append(item)
+                        push_to.append((SIZE, entry.path, item, 0))
+                        continue
+                elif detector is not None and name not in self.HUNT_IGNORE and not name.startswith("."):
+                    push_to.append((HUNT, entry.path, hunt, depth + 1))
+                    continue
+                # Folders the bloat search skips are still listed for the file sinks, at any depth
+                if sinks and name not in self.SINK_IGNORE:
+                    push_to.append((HUNT, entry.path, sink_hunt, depth + 1))
+        except PermissionError:
+            gs.permission_errors += 1
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Scan error at {path_str}: {e}")